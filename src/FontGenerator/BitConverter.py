@@ -24,6 +24,11 @@
 ## Description
 Converts a TTF font to a bitmap which can be used by OTOS.
 
+The glyphs can be converted with different engines, see `ENGINES`.
+The `reference` engine converts every pixel in pure Python and
+defines the expected output. All other engines have to produce
+byte-identical bitmaps, which is checked by `test_Equivalence.py`.
+
 ### Author
 Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 
@@ -34,23 +39,36 @@ Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 ---
 """
 # === Modules ===
+import concurrent.futures
+import os
+import numpy as np
 from PIL import Image, ImageFont, ImageDraw
 
+# === Constants ===
+ENGINES: tuple = ("reference", "vectorized", "atlas", "parallel")
+ROTATIONS: tuple = (0, 90, 180, 270)
+BIT_DEPTHS: tuple = (1, 2, 4)
+
+# Starting the worker processes costs about as much as converting this
+# many glyphs in-process, fewer glyphs are converted by `vectorized`.
+PARALLEL_MIN_CHARACTERS: int = 128
+
 # === Functions ===
 
 
-def create_canvas(height_px: int, width_px: int) -> Image:
+def create_canvas(height_px: int, width_px: int, mode: str = "1") -> Image:
     """Creates a canvas for the font.
     Args:
         height_px (int): 1x1 [px] The height of the canvas.
         width_px (int): 1x1 [px] The width of the canvas.
+        mode (str, optional): 1x1 [-] The image mode, "L" for anti-aliased glyphs.
     Returns:
         PIL.Image: 1x1 [-] The canvas.
 
 
     ---
     """
-    return Image.new("1", (width_px, height_px), 0)
+    return Image.new(mode, (width_px, height_px), 0)
 
 
 def get_max_width(font: ImageFont.FreeTypeFont) -> int:
@@ -96,11 +114,78 @@ def get_max_offset(font: ImageFont.FreeTypeFont) -> int:
     return max_offset
 
 
-def convert_pixel_sequence(sequence) -> int:
+def get_bitmap_size(font_path: str, font_size: int, rotation: int = 0) -> tuple:
+    """Get the size of the glyph bitmaps of a font size without converting glyphs.
+
+    The size is computed from the font metrics like in `FontConverter`.
+
+    Args:
+        font_path (str): 1x1 [-] The path to the font file.
+        font_size (int): 1x1 [px] The font size in pixels.
+        rotation (int, optional): 1x1 [deg] The clockwise rotation of the glyphs.
+
+    Returns:
+        tuple: 1x2 [px] The (width, height) of the glyph bitmaps.
+
+    ---
+    """
+    width = get_max_width(ImageFont.truetype(str(font_path), font_size))
+    if rotation in (90, 270):
+        return font_size, width
+    return width, font_size
+
+
+def find_fit_size(
+    font_path: str, width_px: int, height_px: int, rotation: int = 0
+) -> int:
+    """Find the largest font size whose glyph bitmaps fit in a pixel box.
+
+    The font size is searched with a binary search, since the glyph bitmaps
+    grow with the font size. Only the font metrics are computed for every
+    tested size, no glyphs are converted.
+
+    Args:
+        font_path (str): 1x1 [-] The path to the font file.
+        width_px (int): 1x1 [px] The available width of the glyphs.
+        height_px (int): 1x1 [px] The available height of the glyphs.
+        rotation (int, optional): 1x1 [deg] The clockwise rotation of the glyphs.
+
+    Returns:
+        int: 1x1 [px] The largest fitting font size.
+
+    Raises:
+        ValueError: Not even the smallest font size fits in the box.
+
+    ---
+    """
+
+    def _fits(font_size: int) -> bool:
+        width, height = get_bitmap_size(font_path, font_size, rotation)
+        return width <= width_px and height <= height_px
+
+    # The font size is bounded by the box, since it either sets the height
+    # of the bitmaps or, when rotated, their width.
+    low, high = 0, height_px if rotation in (0, 180) else width_px
+    while low < high:
+        size = (low + high + 1) // 2
+        if _fits(size):
+            low = size
+        else:
+            high = size - 1
+
+    if low == 0:
+        raise ValueError(f"No font size fits in {width_px}x{height_px} px.")
+    return low
+
+
+def convert_pixel_sequence(sequence, bpp: int = 1) -> int:
     """Converts a pixel sequence to a byte.
 
+    The first pixel is stored in the least significant bits.
+
     Args:
-        sequence (list): 1x8 [px] The pixel sequence.
+        sequence (list): 1x(8/bpp) [px] The pixel sequence.
+        bpp (int, optional): 1x1 [bit] The bits per pixel.
 
     Returns:
         int: 1x1 [-] The converted byte.
@@ -109,16 +194,148 @@ def convert_pixel_sequence(sequence) -> int:
     """
     # Convert the sequence to a byte
     byte = 0
-    for i in range(8):
-        byte |= sequence[i] << i
+    for i in range(8 // bpp):
+        byte |= sequence[i] << (i * bpp)
 
     return byte
 
 
+def quantize_level(value: int, bpp: int) -> int:
+    """Quantizes a gray value of a pixel to the given bit depth.
+
+    Args:
+        value (int): 1x1 [-] The gray value from 0 to 255.
+        bpp (int): 1x1 [bit] The bits per pixel.
+
+    Returns:
+        int: 1x1 [-] The gray level from 0 to 2^bpp - 1.
+
+    ---
+    """
+    return (value * ((1 << bpp) - 1) + 127) // 255
+
+
+def quantize_pixels(pixels: np.ndarray, bpp: int) -> np.ndarray:
+    """Quantizes the gray values of glyphs to the given bit depth in bulk.
+
+    The result is the same as `quantize_level` for every pixel.
+
+    Args:
+        pixels (np.ndarray): nxHxW [-] The gray values from 0 to 255.
+        bpp (int): 1x1 [bit] The bits per pixel.
+
+    Returns:
+        np.ndarray: nxHxW [-] The gray levels from 0 to 2^bpp - 1.
+
+    ---
+    """
+    levels = (pixels.astype(np.uint16) * ((1 << bpp) - 1) + 127) // 255
+    return levels.astype(np.uint8)
+
+
+def pack_pixels(pixels: np.ndarray, bpp: int = 1) -> np.ndarray:
+    """Converts the pixels of glyphs to bitmaps in bulk.
+
+    The bitmaps have the same layout as `FontConverter.convert_character`.
+    Every byte contains 8/bpp vertical pixels. When the height is not a
+    multiple of 8/bpp, the pixels below the glyph are padded with zeros.
+
+    Args:
+        pixels (np.ndarray): nxHxW [px] The pixels or gray levels of n glyphs.
+        bpp (int, optional): 1x1 [bit] The bits per pixel.
+
+    Returns:
+        np.ndarray: nx(W*ceil(H*bpp/8)) [-] The bitmaps of the glyphs.
+
+    ---
+    """
+    count, height, width = pixels.shape
+    per_byte = 8 // bpp
+    bytes_y = -(-height // per_byte)
+
+    # Group the pixel rows in bytes, the lowest byte row comes first
+    rows = np.zeros((count, bytes_y * per_byte, width), dtype=pixels.dtype)
+    rows[:, :height, :] = pixels
+    rows = rows.reshape((count, bytes_y, per_byte, width))
+    rows = rows[:, ::-1].astype(np.uint8)
+    if bpp == 1:
+        packed = np.packbits(rows, axis=2, bitorder="little")[:, :, 0, :]
+    else:
+        shifts = (np.arange(per_byte, dtype=np.uint8) * bpp)[:, np.newaxis]
+        packed = np.bitwise_or.reduce(rows << shifts, axis=2)
+
+    # Sort the bytes column by column
+    return packed.transpose(0, 2, 1).reshape(count, width * bytes_y)
+
+
+def pack_bitstream(pixels: np.ndarray, bpp: int = 1) -> np.ndarray:
+    """Converts the pixels of glyphs to dense bitmaps in bulk.
+
+    The columns of every glyph are stored as one continuous bitstream
+    without padding between the columns. The pixels of every column are
+    stored from top to bottom, starting at the least significant bit, so
+    that pixel (x, y) starts at bit `(x * H + y) * bpp`. Only the end of
+    every glyph is padded to a full byte.
+
+    Args:
+        pixels (np.ndarray): nxHxW [px] The pixels or gray levels of n glyphs.
+        bpp (int, optional): 1x1 [bit] The bits per pixel.
+
+    Returns:
+        np.ndarray: nxceil(W*H*bpp/8) [-] The dense bitmaps of the glyphs.
+
+    ---
+    """
+    count = pixels.shape[0]
+    levels = pixels.transpose(0, 2, 1).reshape(count, -1, 1).astype(np.uint8)
+    bits = (levels >> np.arange(bpp, dtype=np.uint8)) & 1
+    return np.packbits(bits.reshape(count, -1), axis=1, bitorder="little")
+
+
+def transform_pixels(pixels: np.ndarray, rotation: int, mirror: bool) -> np.ndarray:
+    """Mirrors and rotates the pixels of glyphs in bulk.
+
+    The glyphs are mirrored horizontally first and then rotated clockwise.
+
+    Args:
+        pixels (np.ndarray): nxHxW [px] The pixels of n glyphs.
+        rotation (int): 1x1 [deg] The clockwise rotation, see `ROTATIONS`.
+        mirror (bool): 1x1 [-] Whether to mirror the glyphs horizontally.
+
+    Returns:
+        np.ndarray: nxH'xW' [px] The transformed pixels.
+
+    ---
+    """
+    if mirror:
+        pixels = pixels[:, :, ::-1]
+    return np.rot90(pixels, -(rotation // 90), axes=(1, 2))
+
+
+def _convert_chunk(
+    font_path: str, font_size: int, options: dict, characters: list
+) -> list:
+    """Converts characters in a worker process of the `parallel` engine.
+
+    Args:
+        font_path (str): 1x1 [-] The path to the font file.
+        font_size (int): 1x1 [px] The font size in pixels.
+        options (dict): 1x1 [-] The conversion options of the converter.
+        characters (list): 1xn [-] The characters to convert.
+
+    Returns:
+        list: 1xn [-] The bitmaps of the characters.
+
+    ---
+    """
+    converter = FontConverter(font_path, font_size, **options)
+    return converter.convert_characters(characters, "vectorized")
+
+
 # === Classes ===
 
 
-class FontConverter:
+class FontConverter:  # pylint: disable=too-many-instance-attributes
     """Converts a TTF font to a bitmap which can be used by OTOS.
 
     ---
@@ -155,16 +372,116 @@ class FontConverter:
         """
         return self._width_px
 
+    @property
+    def bitmap_height_px(self) -> int:
+        """The height of the converted glyph bitmaps in pixels.
+
+        Returns:
+            int: [px] The height of the bitmaps after the rotation.
+        """
+        if self.rotation in (90, 270):
+            return self.width_px
+        return self.height_px
+
+    @property
+    def bitmap_width_px(self) -> int:
+        """The width of the converted glyph bitmaps in pixels.
+
+        Returns:
+            int: [px] The width of the bitmaps after the rotation.
+        """
+        if self.rotation in (90, 270):
+            return self.height_px
+        return self.width_px
+
+    @property
+    def rotation(self) -> int:
+        """The clockwise rotation of the glyphs.
+
+        Returns:
+            int: [deg] The rotation of the glyphs, see `ROTATIONS`.
+        """
+        return self._rotation
+
+    @property
+    def mirror(self) -> bool:
+        """Whether the glyphs are mirrored horizontally.
+
+        Returns:
+            bool: [-] True when the glyphs are mirrored.
+        """
+        return self._mirror
+
+    @property
+    def bpp(self) -> int:
+        """The bits per pixel of the converted glyphs.
+
+        Returns:
+            int: [bit] The bit depth of the glyphs, see `BIT_DEPTHS`.
+        """
+        return self._bpp
+
+    @property
+    def dense(self) -> bool:
+        """Whether the glyphs are packed as dense bitstreams.
+
+        Returns:
+            bool: [-] True when the columns are not padded to full bytes.
+        """
+        return self._dense
+
+    @property
+    def options(self) -> dict:
+        """The conversion options of the converter.
+
+        Returns:
+            dict: 1x1 [-] The keyword arguments to create an equal converter.
+        """
+        return {
+            "rotation": self.rotation,
+            "mirror": self.mirror,
+            "bpp": self.bpp,
+            "dense": self.dense,
+        }
+
     # === Constructor ===
-    def __init__(self, font_path: str, font_size: int):
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        font_path: str,
+        font_size: int,
+        rotation: int = 0,
+        mirror: bool = False,
+        bpp: int = 1,
+        dense: bool = False,
+    ):
         """Creates a new font converter.
 
         Args:
             font_path (str): 1x1 [-] The path to the font file.
             font_size (int): 1x1 [px] The font size in pixels.
+            rotation (int, optional): 1x1 [deg] The clockwise rotation of the glyphs.
+            mirror (bool, optional): 1x1 [-] Mirror the glyphs horizontally.
+            bpp (int, optional): 1x1 [bit] The bits per pixel, glyphs with more
+                than 1 bit per pixel are rendered anti-aliased.
+            dense (bool, optional): 1x1 [-] Pack the columns of every glyph as one
+                continuous bitstream, see `pack_bitstream`.
+
+        Raises:
+            ValueError: The rotation is not a multiple of 90 degrees or
+                the bit depth is not supported.
 
         ---
         """
+        # Check the conversion options
+        if rotation not in ROTATIONS:
+            raise ValueError(f"Rotation has to be one of {ROTATIONS}.")
+        if bpp not in BIT_DEPTHS:
+            raise ValueError(f"Bits per pixel have to be one of {BIT_DEPTHS}.")
+        self._rotation = rotation
+        self._mirror = mirror
+        self._bpp = bpp
+        self._dense = dense
+
         # Save the font path
         self.font_path = font_path
         self._height_px = font_size
@@ -175,43 +492,243 @@ class FontConverter:
         except Exception as exc:
             raise FileNotFoundError("Font file not found.") from exc
 
-        # Get the maximum width of the font
+        # Get the maximum width and offset of the font
         self._width_px = get_max_width(self.font)
+        self._y_offset = get_max_offset(self.font)
+
+        # Anti-aliased glyphs are rendered in gray values
+        self._mode = "1" if bpp == 1 else "L"
+        self._fill = 1 if bpp == 1 else 255
 
     # === Methods ===
-    def convert_character(self, character: int) -> list:
-        """Converts a character to a bitmap.
+    def render_character(self, character: int) -> Image:
+        """Draws a character on a new canvas.
 
         Args:
-            character (int): 1x1 [-] The character to convert.
+            character (int): 1x1 [-] The character to draw.
 
         Returns:
-            list: 1x1 [-] The bitmap.
+            PIL.Image: 1x1 [-] The canvas with the character.
 
         ---
         """
         # Create the canvas
-        y_offset = get_max_offset(self.font)
-        canvas = create_canvas(self.height_px, self.width_px)
+        canvas = create_canvas(self.height_px, self.width_px, self._mode)
 
         # Draw the font
         draw = ImageDraw.Draw(canvas)
-        draw.text((0, -y_offset), chr(character), font=self.font, fill=1)
+        draw.text((0, -self._y_offset), chr(character), font=self.font, fill=self._fill)
+        return canvas
+
+    def transform_canvas(self, canvas: Image) -> Image:
+        """Mirrors and rotates a canvas according to the conversion options.
+
+        Args:
+            canvas (PIL.Image): 1x1 [-] The canvas with the character.
+
+        Returns:
+            PIL.Image: 1x1 [-] The transformed canvas.
+
+        ---
+        """
+        if self.mirror:
+            canvas = canvas.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+        if self.rotation:
+            canvas = canvas.rotate(-self.rotation, expand=True)
+        return canvas
+
+    def convert_string(self, text: str) -> tuple:
+        """Converts a whole string to one bitmap.
+
+        The glyphs are placed next to each other in cells of `width_px`, like
+        when the string is drawn glyph by glyph, and the whole line is then
+        transformed and packed at once. The bitmap has the same layout as the
+        glyphs, so that it can be drawn like one wide glyph. Characters which
+        are not part of the 8-bit font tables can be used as well.
+
+        Args:
+            text (str): 1xn [-] The string to convert.
 
-        # Convert the canvas to a bitmap
-        bytes_y = self.height_px // 8
+        Returns:
+            tuple: 1x2 [-] The (width, height) of the bitmap in pixels and the bitmap.
+
+        ---
+        """
+        pixels = [np.asarray(self.render_character(ord(char))) for char in text]
+        pixels = np.reshape(pixels, (-1, self.height_px, self.width_px))
+        line = pixels.transpose(1, 0, 2).reshape(1, self.height_px, -1)
+        line = transform_pixels(line, self.rotation, self.mirror)
+        _, height, width = line.shape
+        if self.bpp > 1:
+            line = quantize_pixels(line, self.bpp)
+        if self.dense:
+            return (width, height), pack_bitstream(line, self.bpp)[0].tolist()
+        return (width, height), pack_pixels(line, self.bpp)[0].tolist()
+
+    def render_atlas(self, characters: list) -> np.ndarray:
+        """Draws all characters on one canvas and returns the glyph pixels.
+
+        Every glyph gets a slot which is wide enough for the overhanging
+        parts of the glyphs, so that the glyphs do not overlap and are
+        clipped the same way as on separate canvases.
+
+        Args:
+            characters (list): 1xn [-] The characters to draw.
+
+        Returns:
+            np.ndarray: nxHxW [px] The pixels of the glyphs.
+
+        ---
+        """
+        # Get the slot size to fit the overhanging glyph parts. The bounding
+        # boxes are not exact for hinted glyphs, so one em is added as margin.
+        boxes = [self.font.getbbox(chr(character)) for character in characters]
+        pad_left = max([0] + [-box[0] for box in boxes]) + self.height_px
+        pad_right = max([0] + [box[2] - self.width_px for box in boxes])
+        pad_right += self.height_px
+        pitch = pad_left + self.width_px + pad_right
+
+        # Draw all characters on one canvas
+        canvas = create_canvas(self.height_px, pitch * len(characters), self._mode)
+        draw = ImageDraw.Draw(canvas)
+        for slot, character in enumerate(characters):
+            position = (slot * pitch + pad_left, -self._y_offset)
+            draw.text(position, chr(character), font=self.font, fill=self._fill)
+
+        # Cut the glyphs out of the canvas
+        pixels = np.asarray(canvas).reshape(self.height_px, len(characters), pitch)
+        pixels = pixels[:, :, pad_left : pad_left + self.width_px]
+        return pixels.transpose(1, 0, 2)
+
+    def pack_pixels(self, pixels: np.ndarray) -> np.ndarray:
+        """Transforms, quantizes and packs rendered glyphs in bulk.
+
+        Args:
+            pixels (np.ndarray): nxHxW [-] The rendered pixels of the glyphs.
+
+        Returns:
+            np.ndarray: nxm [-] The bitmaps of the glyphs.
+
+        ---
+        """
+        pixels = transform_pixels(pixels, self.rotation, self.mirror)
+        if self.bpp > 1:
+            pixels = quantize_pixels(pixels, self.bpp)
+        if self.dense:
+            return pack_bitstream(pixels, self.bpp)
+        return pack_pixels(pixels, self.bpp)
+
+    def convert_characters(self, characters: list, engine: str = "reference") -> list:
+        """Converts multiple characters to bitmaps.
+
+        The `parallel` engine converts less than `PARALLEL_MIN_CHARACTERS`
+        characters in-process with the `vectorized` engine, e.g. when single
+        glyphs are converted on access.
+
+        Args:
+            characters (list): 1xn [-] The characters to convert.
+            engine (str, optional): 1x1 [-] The conversion engine, see `ENGINES`.
+
+        Returns:
+            list: 1xn [-] The bitmaps of the characters.
+
+        Raises:
+            ValueError: The engine is not available.
+
+        ---
+        """
+        characters = list(characters)
+        if engine == "parallel" and len(characters) < PARALLEL_MIN_CHARACTERS:
+            engine = "vectorized"
+        if engine == "reference":
+            return [self.convert_character(character) for character in characters]
+        if engine == "vectorized":
+            pixels = [np.asarray(self.render_character(c)) for c in characters]
+            pixels = np.reshape(pixels, (-1, self.height_px, self.width_px))
+            return self.pack_pixels(pixels).tolist()
+        if engine == "atlas":
+            return self.pack_pixels(self.render_atlas(characters)).tolist()
+        if engine == "parallel":
+            workers = os.cpu_count() or 1
+            chunks = [characters[i::workers] for i in range(workers)]
+            with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+                results = executor.map(
+                    _convert_chunk,
+                    [self.font_path] * workers,
+                    [self.height_px] * workers,
+                    [self.options] * workers,
+                    chunks,
+                )
+                bitmaps = {}
+                for chunk, result in zip(chunks, results):
+                    bitmaps.update(zip(chunk, result))
+            return [bitmaps[character] for character in characters]
+        raise ValueError(f"Unknown conversion engine: {engine}")
+
+    def convert_character(self, character: int) -> list:
+        """Converts a character to a bitmap.
+
+        This is the reference implementation of the conversion.
+
+        Args:
+            character (int): 1x1 [-] The character to convert.
+
+        Returns:
+            list: 1x1 [-] The bitmap.
+
+        ---
+        """
+        # Draw the character
+        canvas = self.transform_canvas(self.render_character(character))
+        if self.dense:
+            return self.convert_canvas_dense(canvas)
+
+        # Convert the canvas to a bitmap, the last byte row is padded with zeros
+        per_byte = 8 // self.bpp
+        bytes_y = -(-self.bitmap_height_px // per_byte)
         bitmap = []
-        for x in range(self.width_px):
+        for x in range(self.bitmap_width_px):
             for y in range(bytes_y):
                 # Get the pixel sequence
                 sequence = []
-                for i in range(8):
-                    sequence.append(canvas.getpixel((x, (bytes_y - 1 - y) * 8 + i)))
+                for i in range(per_byte):
+                    row = (bytes_y - 1 - y) * per_byte + i
+                    if row >= self.bitmap_height_px:
+                        sequence.append(0)
+                        continue
+                    pixel = canvas.getpixel((x, row))
+                    if self.bpp > 1:
+                        pixel = quantize_level(pixel, self.bpp)
+                    sequence.append(pixel)
 
                 # Convert the sequence to a byte
-                byte = convert_pixel_sequence(sequence)
+                byte = convert_pixel_sequence(sequence, self.bpp)
 
                 # Append the byte to the bitmap
                 bitmap.append(byte)
 
         return bitmap
+
+    def convert_canvas_dense(self, canvas: Image) -> list:
+        """Converts a transformed canvas to a dense bitmap.
+
+        This is the reference implementation of `pack_bitstream`.
+
+        Args:
+            canvas (Image): 1x1 [-] The transformed canvas of the character.
+
+        Returns:
+            list: 1x1 [-] The dense bitmap.
+
+        ---
+        """
+        stream = 0
+        position = 0
+        for x in range(self.bitmap_width_px):
+            for y in range(self.bitmap_height_px):
+                pixel = canvas.getpixel((x, y))
+                if self.bpp > 1:
+                    pixel = quantize_level(pixel, self.bpp)
+                stream |= pixel << position
+                position += self.bpp
+        return list(stream.to_bytes(-(-position // 8), "little"))
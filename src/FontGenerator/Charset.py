@@ -0,0 +1,284 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     `FontGenerator/Charset.py`
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+## Description
+Computes the set of glyphs which is actually used by a firmware.
+The C/C++ sources are scanned for string and character literals,
+the used characters are collected and converted to the 8-bit
+codepoints used by the *OTOS* font tables.
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Modules ===
+import collections
+import json
+import pathlib
+import re
+
+# === Constants ===
+SOURCE_SUFFIXES: tuple = (
+    ".c",
+    ".cc",
+    ".cpp",
+    ".cxx",
+    ".h",
+    ".hh",
+    ".hpp",
+    ".hxx",
+    ".ino",
+)
+
+FALLBACK_CODEPOINT: int = 0x20
+
+_C_Tokens = re.compile(
+    r"(?P<comment>//[^\n]*|/\*.*?\*/)"
+    r"|(?P<include>#[ \t]*include[^\n]*)"
+    r"|(?:u8|u|U|L)?R\"(?P<delimiter>[^(\s]*)\((?P<raw>.*?)\)(?P=delimiter)\""
+    r"|(?:u8|u|U|L)?\"(?P<string>(?:\\.|[^\"\\\n])*)\""
+    r"|(?:u8|u|U|L)?'(?P<char>(?:\\.|[^'\\\n])+)'",
+    re.DOTALL,
+)
+
+_C_Escapes = re.compile(
+    r"\\(?:x(?P<hex>[0-9a-fA-F]+)|(?P<oct>[0-7]{1,3})|(?P<simple>.))", re.DOTALL
+)
+
+_C_Simple_Escapes: dict = {
+    "a": "\a",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+}
+
+# === Functions ===
+
+
+def decode_escapes(literal: str) -> str:
+    """Decode the C escape sequences of a literal.
+
+    Args:
+        literal (str): 1xn [-] The content of the literal without quotes.
+
+    Returns:
+        str: 1xn [-] The literal with the escape sequences replaced.
+
+    ---
+    """
+
+    def _replace(match: re.Match) -> str:
+        if match.group("hex") is not None:
+            return chr(int(match.group("hex"), 16) & 0xFF)
+        if match.group("oct") is not None:
+            return chr(int(match.group("oct"), 8) & 0xFF)
+        return _C_Simple_Escapes.get(match.group("simple"), match.group("simple"))
+
+    return _C_Escapes.sub(_replace, literal)
+
+
+def get_string_literals(source: str) -> list:
+    """Get all string and character literals of a C/C++ source.
+
+    Comments and `#include` directives are skipped.
+
+    Args:
+        source (str): 1xn [-] The content of the source file.
+
+    Returns:
+        list: 1xn [str] The decoded literals.
+
+    ---
+    """
+    literals = []
+    for match in _C_Tokens.finditer(source):
+        if match.group("raw") is not None:
+            literals.append(match.group("raw"))
+        elif match.group("string") is not None:
+            literals.append(decode_escapes(match.group("string")))
+        elif match.group("char") is not None:
+            literals.append(decode_escapes(match.group("char")))
+    return literals
+
+
+def find_source_files(paths: list) -> list:
+    """Find all C/C++ source files in the given paths.
+
+    Args:
+        paths (list): 1xn [pathlib.Path] Files or directories to search.
+
+    Returns:
+        list: 1xn [pathlib.Path] The sorted source files.
+
+    ---
+    """
+    files = set()
+    for path in map(pathlib.Path, paths):
+        if path.is_dir():
+            files.update(
+                file
+                for file in path.rglob("*")
+                if file.is_file() and file.suffix.lower() in SOURCE_SUFFIXES
+            )
+        elif path.is_file():
+            files.add(path)
+        else:
+            raise FileNotFoundError(f"Source path not found: {path}")
+    return sorted(files)
+
+
+def get_charset(
+    paths: list, extra_chars: str = "", fallback: int = FALLBACK_CODEPOINT
+) -> list:
+    """Get the sorted codepoints used by the sources and the extra characters.
+
+    Characters which cannot be represented as 8-bit codepoint are ignored.
+    The fallback codepoint is always part of the charset.
+
+    Args:
+        paths (list): 1xn [pathlib.Path] Files or directories to scan.
+        extra_chars (str, optional): 1xn [-] Additional characters to include.
+        fallback (int, optional): 1x1 [-] The codepoint used for missing glyphs.
+
+    Returns:
+        list: 1xn [int] The sorted codepoints.
+
+    ---
+    """
+    used = set(extra_chars)
+    for file in find_source_files(paths):
+        source = file.read_text(encoding="utf-8", errors="replace")
+        for literal in get_string_literals(source):
+            used.update(literal)
+
+    codepoints = {ord(char) for char in used if ord(char) < 256}
+    codepoints.add(fallback)
+    return sorted(codepoints)
+
+
+def get_index_table(charset: list, fallback: int = FALLBACK_CODEPOINT) -> list:
+    """Get the lookup table which maps every codepoint to its glyph slot.
+
+    Codepoints which are not part of the charset are mapped to
+    the slot of the fallback glyph.
+
+    Args:
+        charset (list): 1xn [int] The codepoints in the order they are exported.
+        fallback (int, optional): 1x1 [-] The codepoint used for missing glyphs.
+
+    Returns:
+        list: 1x256 [int] The glyph slot for every codepoint.
+
+    ---
+    """
+    slots = {codepoint: slot for slot, codepoint in enumerate(charset)}
+    default = slots.get(fallback, 0)
+    return [slots.get(codepoint, default) for codepoint in range(256)]
+
+
+def get_frequencies(strings: list) -> dict:
+    """Count how often every character is used by the strings.
+
+    Args:
+        strings (list): 1xn [str] The strings, e.g. a string catalog of the UI.
+
+    Returns:
+        dict: 1xn [int] The number of uses of every codepoint.
+
+    ---
+    """
+    return dict(collections.Counter(ord(char) for text in strings for char in text))
+
+
+def load_frequencies(file: pathlib.Path) -> dict:
+    """Load a glyph frequency profile.
+
+    Files with the suffix `.json` contain a measured histogram, which maps
+    characters or integer codepoints like `"0x41"` to their number of uses.
+    Keys with one character are characters, longer keys are codepoints.
+    All other files are string catalogs with one string per line.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The frequency profile.
+
+    Returns:
+        dict: 1xn [int] The number of uses of every codepoint.
+
+    ---
+    """
+    file = pathlib.Path(file)
+    content = file.read_text(encoding="utf-8")
+    if file.suffix.lower() != ".json":
+        return get_frequencies(content.splitlines())
+
+    frequencies = collections.Counter()
+    for key, count in json.loads(content).items():
+        frequencies[ord(key) if len(key) == 1 else int(key, 0)] += int(count)
+    return dict(frequencies)
+
+
+def sort_by_frequency(
+    charset: list, frequencies: dict, fallback: int = FALLBACK_CODEPOINT
+) -> list:
+    """Sort the codepoints by their number of uses, the most used first.
+
+    Uses of codepoints which are not part of the charset are counted for
+    the fallback glyph they are drawn with. Codepoints with the same number
+    of uses keep their order.
+
+    Args:
+        charset (list): 1xn [int] The codepoints in the order they are exported.
+        frequencies (dict): 1xn [int] The number of uses of every codepoint.
+        fallback (int, optional): 1x1 [-] The codepoint used for missing glyphs.
+
+    Returns:
+        list: 1xn [int] The codepoints in the order of their frequency.
+
+    ---
+    """
+    members = set(charset)
+    counts = collections.Counter()
+    for codepoint, count in frequencies.items():
+        counts[codepoint if codepoint in members else fallback] += count
+    return sorted(charset, key=lambda codepoint: -counts[codepoint])
+
+
+def is_complete(charset: list) -> bool:
+    """Check whether the charset contains all codepoints in ascending order.
+
+    Args:
+        charset (list): 1xn [int] The codepoints in the order they are exported.
+
+    Returns:
+        bool: 1x1 [-] True when no index table is required.
+
+    ---
+    """
+    return list(charset) == list(range(256))
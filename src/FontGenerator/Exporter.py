@@ -33,7 +33,11 @@ Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 ---
 """
 # === Modules ===
+import contextlib
+import hashlib
+import os
 import pathlib
+import re
 
 # === Functions ===
 
@@ -64,6 +68,78 @@ def write_copyright_header(file: pathlib.Path):
     file.write_text(_OTOS_Copyright)
 
 
+def get_content_hash(fonts: list) -> str:
+    """Get a deterministic hash of the glyph data of font sizes.
+
+    Args:
+        fonts (list): 1xn [FontData] The converted font data.
+
+    Returns:
+        str: 1x1 [-] The hex digest of the SHA-256 hash.
+
+    ---
+    """
+    content = hashlib.sha256()
+    for font in fonts:
+        content.update(
+            f"{font.name}:{font.size}:{font.width}x{font.height}:{font.stride}:".encode(
+                "utf-8"
+            )
+        )
+        for codepoint in font.charset:
+            content.update(bytes([codepoint]))
+            content.update(len(font.data[codepoint]).to_bytes(4, "little"))
+            content.update(bytes(font.data[codepoint]))
+    return content.hexdigest()
+
+
+def replace_if_changed(temp: pathlib.Path, file: pathlib.Path) -> bool:
+    """Replace the file with the temporary file when the content differs.
+
+    The file is replaced atomically, an unchanged file keeps its
+    modification time so that the build system does not rebuild it.
+
+    Args:
+        temp (pathlib.Path): 1x1 [-] The temporary file with the new content.
+        file (pathlib.Path): 1x1 [-] The file to replace.
+
+    Returns:
+        bool: 1x1 [-] True when the file was replaced.
+
+    ---
+    """
+    if file.is_file() and file.read_bytes() == temp.read_bytes():
+        temp.unlink()
+        return False
+    os.replace(temp, file)
+    return True
+
+
+@contextlib.contextmanager
+def write_if_changed(file: pathlib.Path):
+    """Context to write a file only when its content changes.
+
+    Yields a temporary file next to the file which is written instead.
+    On exit the file is replaced by the temporary file when the content
+    differs, see `replace_if_changed`.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The file to write.
+
+    Yields:
+        pathlib.Path: 1x1 [-] The temporary file to write to.
+
+    ---
+    """
+    temp = file.with_name(f".{file.name}.{os.getpid()}.tmp")
+    try:
+        yield temp
+        replace_if_changed(temp, file)
+    finally:
+        if temp.exists():
+            temp.unlink()
+
+
 def get_array_line(line_number: int, array: list) -> str:
     """Get the line of an array as a string.
 
@@ -106,26 +182,91 @@ def write_lookup_table_preamble(file: pathlib.Path, font_name: str):
         File.write(r"{" + "\n")
 
 
-def write_lookup_table_begin(file: pathlib.Path, font_name: str, size: tuple):
+def get_lookup_table_name(font_name: str, size: int) -> str:
+    """Get the name of the glyph lookup table.
+
+    Args:
+        font_name (str): 1x1 [-] The name of the font.
+        size (int): 1x1 [px] The font size in pixels.
+
+    Returns:
+        str: 1x1 [-] The name of the lookup table.
+
+    ---
+    """
+    return f"Lookup_{font_name}_{size:d}px"
+
+
+def write_lookup_table_begin(
+    file: pathlib.Path,
+    font_name: str,
+    size: tuple,
+    storage: str = "constexpr",
+    font_size: int = None,
+):
     """Write the beginning of the lookup table.
 
     Args:
         file (pathlib.Path): 1x1 [-] The file to write to.
         font_name (str): 1x1 [-] The name of the font.
         size (tuple): 1x2 [px] The (width, height) of the font.
+        storage (str, optional): 1x1 [-] The qualifier of the table definition,
+            `constexpr` in headers and `const` in source files.
+        font_size (int, optional): 1x1 [px] The font size used in the table name,
+            defaults to the height of the font.
 
     ---
     """
     # Write the beginning of the lookup table
     with open(file, "a", encoding="utf-8") as File:
         File.write(
-            _OTOS_LookUp_Begin.format(Name=font_name, Width=size[0], Height=size[1])
+            _OTOS_LookUp_Begin.format(
+                Storage=storage,
+                Table=get_lookup_table_name(font_name, font_size or size[1]),
+                Width=size[0],
+                Height=size[1],
+            )
         )
         File.write(r"{" + "\n")
 
 
-def write_lookup_table_end(
-    file: pathlib.Path, font_name: str, size: tuple, stride: int
+def get_placement_qualifier(section: str = None, alignment: int = 1) -> str:
+    """Get the qualifiers which place a table in a linker section.
+
+    Args:
+        section (str, optional): 1x1 [-] The linker section of the table.
+        alignment (int, optional): 1x1 [byte] The alignment of the table.
+
+    Returns:
+        str: 1x1 [-] The qualifiers followed by a space, empty without placement.
+
+    ---
+    """
+    qualifier = f"alignas({alignment}) " if alignment > 1 else ""
+    if section is not None:
+        qualifier += f'__attribute__((section("{section}"))) '
+    return qualifier
+
+
+def write_lookup_table_close(file: pathlib.Path):
+    """Close the lookup table without writing the font descriptor.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The file to write to.
+
+    ---
+    """
+    with open(file, "a", encoding="utf-8") as File:
+        File.write("    };\n\n")
+
+
+def write_lookup_table_end(  # pylint: disable=too-many-arguments
+    file: pathlib.Path,
+    font_name: str,
+    size: tuple,
+    stride: int,
+    fields: dict = None,
+    font_size: int = None,
 ):
     """Write the end of the lookup table.
 
@@ -134,22 +275,302 @@ def write_lookup_table_end(
         font_name (str): 1x1 [-] The name of the font.
         size (tuple): 1x2 [px] The (width, height) of the font.
         stride (int): 1x1 [-] The stride of the font.
+        fields (dict, optional): 1xn [-] Additional fields of the font descriptor.
+        font_size (int, optional): 1x1 [px] The font size used in the names,
+            defaults to the height of the font.
 
     ---
     """
     # Write the end of the lookup table
+    with open(file, "a", encoding="utf-8") as File:
+        File.write("    };\n")
+
+    # Write the font information
+    write_font_descriptor(file, font_name, size, stride, fields, font_size)
+
+
+def write_font_descriptor(  # pylint: disable=too-many-arguments
+    file: pathlib.Path,
+    font_name: str,
+    size: tuple,
+    stride: int,
+    fields: dict = None,
+    font_size: int = None,
+):
+    """Write the font descriptor which points to the lookup table.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The file to write to.
+        font_name (str): 1x1 [-] The name of the font.
+        size (tuple): 1x2 [px] The (width, height) of the font.
+        stride (int): 1x1 [-] The stride of the font.
+        fields (dict, optional): 1xn [-] Additional fields of the font descriptor.
+        font_size (int, optional): 1x1 [px] The font size used in the names,
+            defaults to the height of the font.
+
+    ---
+    """
+    font_size = font_size or size[1]
+
+    # Format the additional descriptor fields
+    _fields = ""
+    for key, value in (fields or {}).items():
+        _fields += f",\n            .{key} = {value}"
+
+    # Write the font information
     with open(file, "a", encoding="utf-8") as File:
         File.write(
-            _OTOS_LookUp_End.format(
-                Namespace=get_namespace_for_size(size[1]),
+            _OTOS_Font_Descriptor.format(
+                Namespace=get_namespace_for_size(font_size),
                 Name=font_name,
+                Size=font_size,
+                Table=get_lookup_table_name(font_name, font_size),
                 Width=size[0],
                 Height=size[1],
                 Stride=stride,
+                Fields=_fields,
             )
         )
 
 
+def write_table_declaration(
+    file: pathlib.Path, table_name: str, ctype: str = "unsigned char"
+):
+    """Write the declaration of a table which is defined in a source file.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The file to write to.
+        table_name (str): 1x1 [-] The name of the table.
+        ctype (str, optional): 1x1 [-] The C++ type of the table elements.
+
+    ---
+    """
+    with open(file, "a", encoding="utf-8") as File:
+        File.write(f"    extern const {ctype} {table_name}[];\n")
+
+
+def get_table_type(max_value: int) -> str:
+    """Get the smallest unsigned C++ type which can store the value.
+
+    Args:
+        max_value (int): 1x1 [-] The largest value of the table.
+
+    Returns:
+        str: 1x1 [-] The C++ type of the table elements.
+
+    ---
+    """
+    for ctype, size in _OTOS_Table_Types.items():
+        if max_value < 1 << (8 * size):
+            return ctype
+    raise ValueError(f"Value {max_value} does not fit in a table.")
+
+
+def get_table_size(ctype: str) -> int:
+    """Get the size of a table element in bytes.
+
+    Args:
+        ctype (str): 1x1 [-] The C++ type of the table elements.
+
+    Returns:
+        int: 1x1 [byte] The size of one table element.
+
+    ---
+    """
+    return _OTOS_Table_Types[ctype]
+
+
+def write_table(  # pylint: disable=too-many-arguments
+    file: pathlib.Path,
+    table_name: str,
+    values: list,
+    ctype: str = "unsigned char",
+    storage: str = "constexpr",
+    brief: str = "",
+):
+    """Write a table with 16 values per line.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The file to write to.
+        table_name (str): 1x1 [-] The name of the table.
+        values (list): 1xn [-] The values of the table.
+        ctype (str, optional): 1x1 [-] The C++ type of the table elements.
+        storage (str, optional): 1x1 [-] The qualifier of the table definition.
+        brief (str, optional): 1x1 [-] The description of the table.
+
+    ---
+    """
+    digits = 2 + 2 * _OTOS_Table_Types[ctype]
+    with open(file, "a", encoding="utf-8") as File:
+        File.write(
+            _OTOS_Table_Begin.format(
+                Brief=brief, Storage=storage, Type=ctype, Table=table_name
+            )
+        )
+        File.write(r"{" + "\n")
+        for start in range(0, len(values), 16):
+            line = "".join(
+                f"{value:#0{digits}x}, " for value in values[start : start + 16]
+            )
+            File.write(8 * " " + line.rstrip() + "\n")
+        File.write("    };\n\n")
+
+
+def get_string_identifier(text: str, used: set = None) -> str:
+    """Get a C++ identifier for a pre-rendered string.
+
+    Characters which are not allowed in identifiers are replaced by `_`.
+    When the identifier is already used, a number is appended.
+
+    Args:
+        text (str): 1xn [-] The string.
+        used (set, optional): 1xn [str] The identifiers which are already used,
+            the new identifier is added.
+
+    Returns:
+        str: 1x1 [-] The identifier of the string.
+
+    ---
+    """
+    identifier = re.sub(r"[^0-9A-Za-z]+", "_", text).strip("_") or "String"
+    if identifier[0].isdigit():
+        identifier = f"_{identifier}"
+    used = set() if used is None else used
+    unique = identifier
+    number = 2
+    while unique in used:
+        unique = f"{identifier}_{number}"
+        number += 1
+    used.add(unique)
+    return unique
+
+
+def get_string_table_name(font_name: str, size: int, identifier: str) -> str:
+    """Get the name of the bitmap of a pre-rendered string.
+
+    Args:
+        font_name (str): 1x1 [-] The name of the font.
+        size (int): 1x1 [px] The font size in pixels.
+        identifier (str): 1x1 [-] The identifier of the string.
+
+    Returns:
+        str: 1x1 [-] The name of the bitmap table.
+
+    ---
+    """
+    return f"String_{font_name}_{size:d}px_{identifier}"
+
+
+def write_string_bitmap(
+    file: pathlib.Path, table_name: str, text: str, size: tuple, bitmap: list
+):
+    """Write the bitmap of a pre-rendered string.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The file to write to.
+        table_name (str): 1x1 [-] The name of the bitmap table.
+        text (str): 1xn [-] The pre-rendered string.
+        size (tuple): 1x2 [px] The (width, height) of the bitmap.
+        bitmap (list): 1xn [-] The bitmap of the string.
+
+    ---
+    """
+    text = text.replace("*/", "* /")
+    brief = f'Pre-rendered string "{text}"\n'
+    brief += f"     * @details width: {size[0]:d} px, height: {size[1]:d} px"
+    write_table(file, table_name, bitmap, brief=brief)
+
+
+def write_string_descriptors(
+    file: pathlib.Path, font_name: str, font_size: int, descriptors: list
+):
+    """Write the descriptors of the pre-rendered strings of one font size.
+
+    Every string is described by a `Font::Base_t` with the string bitmap
+    as one wide glyph, so that it can be drawn with a single blit.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The file to write to.
+        font_name (str): 1x1 [-] The name of the font.
+        font_size (int): 1x1 [px] The font size in pixels.
+        descriptors (list): 1xn [tuple] The (identifier, table name, size,
+            stride, fields) of every string.
+
+    ---
+    """
+    with open(file, "a", encoding="utf-8") as File:
+        File.write(
+            _OTOS_String_Namespace.format(
+                Namespace=get_namespace_for_size(font_size),
+                Name=font_name,
+                Size=font_size,
+            )
+        )
+        for identifier, table_name, size, stride, fields in descriptors:
+            _fields = "".join(
+                f",\n            .{key} = {value}" for key, value in fields.items()
+            )
+            File.write(
+                _OTOS_String_Descriptor.format(
+                    Name=f"{font_name}_{identifier}",
+                    Table=table_name,
+                    Width=size[0],
+                    Height=size[1],
+                    Stride=stride,
+                    Fields=_fields,
+                )
+            )
+        File.write("    };\n")
+
+
+def get_index_table_name(font_name: str, size: int) -> str:
+    """Get the name of the codepoint index table.
+
+    Args:
+        font_name (str): 1x1 [-] The name of the font.
+        size (int): 1x1 [px] The font size in pixels.
+
+    Returns:
+        str: 1x1 [-] The name of the index table.
+
+    ---
+    """
+    return f"Index_{font_name}_{size:d}px"
+
+
+def write_index_table(
+    file: pathlib.Path,
+    font_name: str,
+    size: int,
+    index: list,
+    storage: str = "constexpr",
+):
+    """Write the table which maps every codepoint to its glyph slot.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The file to write to.
+        font_name (str): 1x1 [-] The name of the font.
+        size (int): 1x1 [px] The font size in pixels.
+        index (list): 1x256 [-] The glyph slot of every codepoint.
+        storage (str, optional): 1x1 [-] The qualifier of the table definition.
+
+    ---
+    """
+    with open(file, "a", encoding="utf-8") as File:
+        File.write(
+            _OTOS_Index_Begin.format(
+                Storage=storage,
+                Table=get_index_table_name(font_name, size),
+                Glyphs=max(index) + 1,
+            )
+        )
+        File.write(r"{" + "\n")
+        for start in range(0, len(index), 16):
+            line = "".join(f"{slot:#04x}, " for slot in index[start : start + 16])
+            File.write(8 * " " + line + f"// {start:#04x}\n")
+        File.write("    };\n\n")
+
+
 def finalize_file(file: pathlib.Path, font_name: str):
     """Finalize the file.
 
@@ -164,6 +585,51 @@ def finalize_file(file: pathlib.Path, font_name: str):
         File.write(f"}};\n#endif /* {font_name.upper()}_H_ */")
 
 
+def write_umbrella_header(file: pathlib.Path, font_name: str, headers: list):
+    """Write the header which includes the headers of all font sizes.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The file to write to.
+        font_name (str): 1x1 [-] The name of the font.
+        headers (list): 1xn [str] The file names of the included headers.
+
+    ---
+    """
+    with open(file, "a", encoding="utf-8") as File:
+        File.write(
+            _OTOS_Umbrella.format(
+                Name_Upper=font_name.upper(),
+                Includes="".join(f'#include "{header}"\n' for header in headers),
+            )
+        )
+
+
+def write_source_preamble(file: pathlib.Path, header: str):
+    """Write the preamble of a source file which defines the lookup tables.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The file to write to.
+        header (str): 1x1 [-] The file name of the header declaring the tables.
+
+    ---
+    """
+    with open(file, "a", encoding="utf-8") as File:
+        File.write(_OTOS_Source_Preamble.format(Header=header))
+        File.write(r"{" + "\n")
+
+
+def finalize_source(file: pathlib.Path):
+    """Finalize the source file.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The file to write to.
+
+    ---
+    """
+    with open(file, "a", encoding="utf-8") as File:
+        File.write("};\n")
+
+
 # === Constants ===
 _OTOS_Copyright: str = """/**
  * OTOS - Open Tec Operating System
@@ -200,18 +666,63 @@ _OTOS_LookUp_Begin: str = """    /**
      * @brief Ascii font lookup table
      * @details width: {Width:d} px, height: {Height:d} px
      */
-    constexpr unsigned char Lookup_{Name}_{Height:d}px[] = """
-
-_OTOS_LookUp_End: str = """    }};
+    {Storage} unsigned char {Table}[] = """
 
+_OTOS_Font_Descriptor: str = """
     // === Font Information ===
-    // {Name}: {Height:d}px
+    // {Name}: {Size:d}px
     namespace {Namespace}
     {{
         constexpr Font::Base_t {Name} = {{
-            .data = Lookup_{Name}_{Height:d}px,
+            .data = {Table},
             .width_px = {Width:d},
             .height_px = {Height:d},
-            .stride = {Stride:d}}};
+            .stride = {Stride:d}{Fields}}};
     }};
 """
+
+_OTOS_Index_Begin: str = """    /**
+     * @brief Codepoint to glyph slot lookup table
+     * @details glyphs: {Glyphs:d}, missing glyphs are mapped to the fallback glyph
+     */
+    {Storage} unsigned char {Table}[] = """
+
+_OTOS_Table_Types: dict = {
+    "unsigned char": 1,
+    "unsigned short": 2,
+    "unsigned int": 4,
+}
+
+_OTOS_Table_Begin: str = """    /**
+     * @brief {Brief}
+     */
+    {Storage} {Type} {Table}[] = """
+
+_OTOS_String_Namespace: str = """
+    // === Pre-rendered Strings ===
+    // {Name}: {Size:d}px
+    namespace {Namespace}
+    {{
+"""
+
+_OTOS_String_Descriptor: str = """        constexpr Font::Base_t {Name} = {{
+            .data = {Table},
+            .width_px = {Width:d},
+            .height_px = {Height:d},
+            .stride = {Stride:d}{Fields}}};
+"""
+
+_OTOS_Source_Preamble: str = """
+// === Includes ===
+#include "{Header}"
+
+namespace Font
+"""
+
+_OTOS_Umbrella: str = """
+#ifndef {Name_Upper}_H_
+#define {Name_Upper}_H_
+
+// === Includes ===
+{Includes}
+#endif /* {Name_Upper}_H_ */"""
@@ -0,0 +1,328 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     `FontGenerator/FontIndex.py`
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+## Description
+Index of the installed and provided font files.
+The family and style names of every font file are read once and stored
+together with the modification time of the file in a cache file. Font
+names are then resolved without opening the font files again, only new
+and changed files are read when the index is updated.
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Modules ===
+import json
+import os
+import pathlib
+import re
+import sys
+from PIL import ImageFont
+
+# === Constants ===
+FONT_SUFFIXES: tuple = (".otf", ".ttc", ".ttf")
+
+INDEX_VERSION: int = 1
+
+REGULAR_STYLES: tuple = ("book", "normal", "regular", "roman")
+
+_Name_Separators = re.compile(r"[\s_-]+")
+
+# === Functions ===
+
+
+def get_font_directories() -> list:
+    """Get the directories of the installed fonts of the platform.
+
+    Returns:
+        list: 1xn [pathlib.Path] The existing font directories.
+
+    ---
+    """
+    home = pathlib.Path.home()
+    if sys.platform.startswith("win"):
+        directories = [
+            pathlib.Path(os.environ.get("WINDIR", "C:/Windows")) / "Fonts",
+            pathlib.Path(os.environ.get("LOCALAPPDATA", home))
+            / "Microsoft/Windows/Fonts",
+        ]
+    elif sys.platform == "darwin":
+        directories = [
+            pathlib.Path("/System/Library/Fonts"),
+            pathlib.Path("/Library/Fonts"),
+            home / "Library/Fonts",
+        ]
+    else:
+        data_dirs = os.environ.get("XDG_DATA_DIRS", "/usr/local/share:/usr/share")
+        directories = [pathlib.Path(path) / "fonts" for path in data_dirs.split(":")]
+        directories += [home / ".local/share/fonts", home / ".fonts"]
+    return [path for path in directories if path.is_dir()]
+
+
+def get_cache_file() -> pathlib.Path:
+    """Get the default location of the font index cache file.
+
+    Returns:
+        pathlib.Path: 1x1 [-] The cache file in the user cache directory.
+
+    ---
+    """
+    cache = os.environ.get("XDG_CACHE_HOME", pathlib.Path.home() / ".cache")
+    return pathlib.Path(cache) / "otos-utils" / "font-index.json"
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a font name for the lookup.
+
+    Case, spaces, hyphens and underscores are ignored.
+
+    Args:
+        name (str): 1xn [-] The font name.
+
+    Returns:
+        str: 1xn [-] The normalized name.
+
+    ---
+    """
+    return _Name_Separators.sub("", name).casefold()
+
+
+def read_font_name(path: pathlib.Path) -> tuple:
+    """Read the family and style name of a font file.
+
+    Args:
+        path (pathlib.Path): 1x1 [-] The font file.
+
+    Returns:
+        tuple: 1x2 [str] The (family, style) of the font, None when the
+            file cannot be read.
+
+    ---
+    """
+    try:
+        return tuple(ImageFont.truetype(str(path), 10).getname())
+    except OSError:
+        return None
+
+
+# === Classes ===
+
+
+class FontIndex:
+    """Cached index of the family and style names of font files."""
+
+    def __init__(self, cache_file: pathlib.Path = None, directories: list = None):
+        """Create the index and load the cached entries.
+
+        Args:
+            cache_file (pathlib.Path, optional): 1x1 [-] The cache file, defaults
+                to `get_cache_file()`. The index is not persisted when the
+                cache file cannot be written.
+            directories (list, optional): 1xn [pathlib.Path] The directories to
+                index, defaults to `get_font_directories()`.
+
+        ---
+        """
+        self.cache_file = pathlib.Path(cache_file or get_cache_file())
+        self.directories = [
+            pathlib.Path(path) for path in (directories or get_font_directories())
+        ]
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        """Load the entries from the cache file.
+
+        Missing, corrupt or outdated cache files result in an empty index.
+
+        ---
+        """
+        try:
+            cache = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(cache, dict) and cache.get("version") == INDEX_VERSION:
+            self.entries = cache.get("fonts", {})
+
+    def save(self):
+        """Save the entries to the cache file.
+
+        ---
+        """
+        cache = {"version": INDEX_VERSION, "fonts": self.entries}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.cache_file.with_name(f".{self.cache_file.name}.{os.getpid()}")
+            temp.write_text(json.dumps(cache, indent=1, sort_keys=True), "utf-8")
+            os.replace(temp, self.cache_file)
+        except OSError:
+            pass
+
+    def find_files(self) -> list:
+        """Find all font files in the indexed directories.
+
+        Returns:
+            list: 1xn [pathlib.Path] The sorted font files.
+
+        ---
+        """
+        files = set()
+        for directory in self.directories:
+            for root, _, names in os.walk(directory):
+                files.update(
+                    pathlib.Path(root, name).resolve()
+                    for name in names
+                    if name.lower().endswith(FONT_SUFFIXES)
+                )
+        return sorted(files)
+
+    def update(self) -> bool:
+        """Update the index with the new, changed and removed font files.
+
+        Only files whose modification time changed are read again.
+        The cache file is written when the index changed.
+
+        Returns:
+            bool: 1x1 [-] True when the index changed.
+
+        ---
+        """
+        entries = {}
+        for path in self.find_files():
+            mtime = path.stat().st_mtime_ns
+            entry = self.entries.get(str(path))
+            if entry is None or entry["mtime"] != mtime:
+                name = read_font_name(path)
+                entry = {"mtime": mtime, "name": list(name) if name else None}
+            entries[str(path)] = entry
+
+        changed = entries != self.entries
+        self.entries = entries
+        if changed:
+            self.save()
+        return changed
+
+    def get_name(self, path: pathlib.Path) -> tuple:
+        """Get the cached (family, style) name of a font file.
+
+        Args:
+            path (pathlib.Path): 1x1 [-] The font file.
+
+        Returns:
+            tuple: 1x2 [str] The (family, style) of the font, None when the
+                file is not indexed or not a valid font.
+
+        ---
+        """
+        entry = self.entries.get(str(pathlib.Path(path).resolve()))
+        if entry is None or entry["name"] is None:
+            return None
+        return tuple(entry["name"])
+
+    def lookup(self, name: str) -> pathlib.Path:
+        """Look up a font file by its name in the cached entries.
+
+        The name is compared with the family name, the family and style name
+        and the file name of every font. A regular style is preferred when
+        only the family is given, and the path decides between equal names.
+
+        Args:
+            name (str): 1xn [-] The name of the font.
+
+        Returns:
+            pathlib.Path: 1x1 [-] The font file, None when no font matches or
+                the matching file changed since it was indexed.
+
+        ---
+        """
+        key = normalize_name(name)
+        matches = []
+        for path, entry in self.entries.items():
+            family, style = entry["name"] or ("", "")
+            names = {
+                normalize_name(family + style): 0,
+                normalize_name(pathlib.Path(path).stem): 1,
+                normalize_name(family): 2
+                if normalize_name(style) in REGULAR_STYLES
+                else 3,
+            }
+            if key in names:
+                matches.append((names[key], path))
+        if not matches:
+            return None
+
+        path = pathlib.Path(min(matches)[1])
+        try:
+            if path.stat().st_mtime_ns != self.entries[str(path)]["mtime"]:
+                return None
+        except OSError:
+            return None
+        return path
+
+    def find(self, name: str) -> pathlib.Path:
+        """Find a font file by its name.
+
+        The cached entries are used first, the index is only updated when
+        the name is not found or the font file changed.
+
+        Args:
+            name (str): 1xn [-] The name of the font.
+
+        Returns:
+            pathlib.Path: 1x1 [-] The font file, None when no font matches.
+
+        ---
+        """
+        path = self.lookup(name)
+        if path is None and self.update():
+            path = self.lookup(name)
+        return path
+
+
+def resolve_font(font: pathlib.Path, index: FontIndex = None) -> pathlib.Path:
+    """Resolve the path or name of a font to a font file.
+
+    Existing paths are returned unchanged. Names which are not indexed are
+    also returned unchanged, so that they can still be resolved by *Pillow*.
+
+    Args:
+        font (pathlib.Path): 1x1 [-] The path or name of the font.
+        index (FontIndex, optional): 1x1 [-] The font index, defaults to the
+            index of the installed fonts.
+
+    Returns:
+        pathlib.Path: 1x1 [-] The font file.
+
+    ---
+    """
+    font = pathlib.Path(font)
+    if font.exists():
+        return font
+    if index is None:
+        index = FontIndex()
+    return index.find(str(font)) or font
@@ -0,0 +1,262 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     `FontGenerator/GlyphFile.py`
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+## Description
+Intermediate file format of the converted glyphs.
+The converted font sizes are stored in an uncompressed *NumPy* `.npz`
+archive together with their metadata, so that a font is converted once
+and exported many times. The glyph arrays are memory mapped when the
+file is loaded, only the glyphs which are accessed are read.
+
+Every font size `i` is stored with the arrays:
+- `charset_i`: The codepoints of the converted glyphs.
+- `offsets_i`: The start of every glyph in `glyphs_i`, followed by the end.
+- `glyphs_i`: The packed glyphs of the charset back-to-back.
+
+The `metadata` array contains the JSON encoded format version and the
+metadata of every font size.
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Modules ===
+import collections.abc
+import json
+import pathlib
+import struct
+import zipfile
+import numpy as np
+from . import Exporter
+
+# === Constants ===
+FORMAT_VERSION: int = 1
+
+LAYOUTS: tuple = ("columns", "dense")
+
+METADATA_KEYS: tuple = (
+    "name",
+    "size",
+    "width",
+    "height",
+    "stride",
+    "rotation",
+    "mirror",
+    "bpp",
+)
+
+_Zip_Date = (1980, 1, 1, 0, 0, 0)
+
+# === Functions ===
+
+
+def get_arrays(font_data) -> tuple:
+    """Get the metadata and the glyph arrays of one font size.
+
+    Args:
+        font_data (FontData): 1x1 [-] The converted font data.
+
+    Returns:
+        tuple: 1x2 [-] The metadata and the (charset, offsets, glyphs) arrays.
+
+    ---
+    """
+    metadata = {key: getattr(font_data, key) for key in METADATA_KEYS}
+    metadata["layout"] = LAYOUTS[int(font_data.dense)]
+    records = [list(font_data.data[codepoint]) for codepoint in font_data.charset]
+    offsets = np.cumsum([0] + [len(record) for record in records], dtype=np.int64)
+    glyphs = np.fromiter(
+        (value for record in records for value in record),
+        dtype=np.uint8,
+        count=int(offsets[-1]),
+    )
+    return metadata, (np.array(font_data.charset, dtype=np.int64), offsets, glyphs)
+
+
+def save(file: pathlib.Path, fonts: list):
+    """Save converted font sizes to an intermediate file.
+
+    The archive is written without timestamps, so that the file is only
+    replaced when the glyphs change, see `Exporter.write_if_changed`.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The file to write, usually with suffix `.npz`.
+        fonts (list): 1xn [FontData] The converted font data.
+
+    ---
+    """
+    metadata = {"version": FORMAT_VERSION, "fonts": []}
+    arrays = {}
+    for number, font_data in enumerate(fonts):
+        font_metadata, font_arrays = get_arrays(font_data)
+        metadata["fonts"].append(font_metadata)
+        for name, array in zip(("charset", "offsets", "glyphs"), font_arrays):
+            arrays[f"{name}_{number}"] = array
+    arrays["metadata"] = np.frombuffer(
+        json.dumps(metadata, sort_keys=True).encode("utf-8"), dtype=np.uint8
+    )
+
+    with Exporter.write_if_changed(pathlib.Path(file)) as temp:
+        with zipfile.ZipFile(temp, "w", zipfile.ZIP_STORED) as archive:
+            for key, array in arrays.items():
+                info = zipfile.ZipInfo(f"{key}.npy", date_time=_Zip_Date)
+                with archive.open(info, "w", force_zip64=True) as member:
+                    np.lib.format.write_array(member, array, allow_pickle=False)
+
+
+def map_arrays(file: pathlib.Path) -> dict:
+    """Memory map the arrays of an uncompressed `.npz` archive.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The archive.
+
+    Returns:
+        dict: 1xn [np.ndarray] The read-only memory mapped arrays by name.
+
+    Raises:
+        ValueError: The archive is compressed or contains no `.npy` arrays.
+
+    ---
+    """
+    arrays = {}
+    with zipfile.ZipFile(file) as archive, open(file, "rb") as stream:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"Array {info.filename} is compressed.")
+
+            # Skip the local header of the archive member
+            stream.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack("<HH", stream.read(4))
+            stream.seek(name_length + extra_length, 1)
+
+            # Read the header of the array, the data follows directly
+            version = np.lib.format.read_magic(stream)
+            if version == (1, 0):
+                header = np.lib.format.read_array_header_1_0(stream)
+            else:
+                header = np.lib.format.read_array_header_2_0(stream)
+            shape, fortran, dtype = header
+            key = info.filename.removesuffix(".npy")
+            if not np.prod(shape, dtype=np.int64):
+                arrays[key] = np.zeros(shape, dtype)
+                continue
+            arrays[key] = np.memmap(
+                file,
+                dtype,
+                "r",
+                stream.tell(),
+                shape,
+                "F" if fortran else "C",
+            )
+    return arrays
+
+
+def load(file: pathlib.Path, mmap: bool = True) -> list:
+    """Load the converted font sizes of an intermediate file.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The intermediate file.
+        mmap (bool, optional): 1x1 [-] Memory map the glyph arrays instead of
+            reading the whole file.
+
+    Returns:
+        list: 1xn [tuple] The metadata and the `GlyphData` of every font size.
+
+    Raises:
+        ValueError: The file is not an intermediate file of a supported version.
+
+    ---
+    """
+    try:
+        if mmap:
+            arrays = map_arrays(file)
+        else:
+            with np.load(file, allow_pickle=False) as archive:
+                arrays = dict(archive.items())
+        metadata = json.loads(bytes(arrays["metadata"]).decode("utf-8"))
+    except (KeyError, ValueError, zipfile.BadZipFile) as error:
+        raise ValueError(f"{file} is not an intermediate glyph file.") from error
+    if metadata.get("version") != FORMAT_VERSION:
+        raise ValueError(
+            f"{file} has format version {metadata.get('version')}, "
+            f"version {FORMAT_VERSION} is supported."
+        )
+
+    fonts = []
+    for number, font_metadata in enumerate(metadata["fonts"]):
+        if font_metadata["layout"] not in LAYOUTS:
+            raise ValueError(f"Unknown glyph layout: {font_metadata['layout']}")
+        glyphs = GlyphData(
+            arrays[f"charset_{number}"],
+            arrays[f"offsets_{number}"],
+            arrays[f"glyphs_{number}"],
+        )
+        fonts.append((font_metadata, glyphs))
+    return fonts
+
+
+# === Classes ===
+
+
+class GlyphData(collections.abc.Sequence):
+    """The glyphs of one font size, indexed by codepoint like `FontData.data`.
+
+    Glyphs which are not part of the charset are empty.
+    """
+
+    def __init__(self, charset: np.ndarray, offsets: np.ndarray, glyphs: np.ndarray):
+        """Create the glyph data of the stored arrays.
+
+        Args:
+            charset (np.ndarray): 1xn [-] The codepoints of the glyphs.
+            offsets (np.ndarray): 1x(n+1) [byte] The start of every glyph and the end.
+            glyphs (np.ndarray): 1xm [-] The packed glyphs back-to-back.
+
+        ---
+        """
+        self.charset = [int(codepoint) for codepoint in charset]
+        self._slots = {codepoint: slot for slot, codepoint in enumerate(self.charset)}
+        self._offsets = offsets
+        self._glyphs = glyphs
+
+    def __len__(self) -> int:
+        """Get the number of codepoints."""
+        return 256
+
+    def __getitem__(self, codepoint: int) -> list:
+        """Get the bitmap of a glyph, only this glyph is read from the file.
+
+        Raises:
+            IndexError: The codepoint is not an 8-bit codepoint.
+        """
+        if codepoint not in range(256):
+            raise IndexError(f"Codepoint {codepoint!r} is not an 8-bit codepoint.")
+        slot = self._slots.get(codepoint)
+        if slot is None:
+            return []
+        start, end = self._offsets[slot : slot + 2]
+        return self._glyphs[start:end].tolist()
@@ -0,0 +1,234 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     `FontGenerator/Layout.py`
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+## Description
+Layout of the exported glyph records.
+The converted glyphs are stored column by column with `stride` bytes
+per column. The functions of this module rearrange these records for
+the export, e.g. by removing the empty byte rows of every glyph or
+by padding the records to the word size of the target.
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Constants ===
+ALIGNMENTS: tuple = (1, 2, 4)
+
+# === Functions ===
+
+
+def trim_rows(record: list, width: int) -> tuple:
+    """Remove the empty byte rows at the start and the end of a glyph.
+
+    The byte rows are counted in the order in which they are stored
+    in every column.
+
+    Args:
+        record (list): 1xn [-] The glyph record with `width` columns.
+        width (int): 1x1 [px] The number of columns of the glyph.
+
+    Returns:
+        tuple: 1x3 [-] The (first row, number of rows, trimmed record).
+
+    ---
+    """
+    column_bytes = len(record) // width if width else 0
+    used = [
+        row
+        for row in range(column_bytes)
+        if any(record[row : len(record) : column_bytes])
+    ]
+    if not used:
+        return 0, 0, []
+
+    first, count = used[0], used[-1] - used[0] + 1
+    trimmed = []
+    for start in range(0, len(record), column_bytes):
+        trimmed.extend(record[start + first : start + first + count])
+    return first, count, trimmed
+
+
+def get_offsets(records: list) -> list:
+    """Get the start of every record when the records are stored back-to-back.
+
+    Args:
+        records (list): 1xn [-] The glyph records.
+
+    Returns:
+        list: 1xn [byte] The offset of every record in the table.
+
+    ---
+    """
+    offsets = []
+    offset = 0
+    for record in records:
+        offsets.append(offset)
+        offset += len(record)
+    return offsets
+
+
+def pad_columns(record: list, width: int, stride: int) -> list:
+    """Pad every column of a glyph with zero bytes to the given stride.
+
+    Args:
+        record (list): 1xn [-] The glyph record with `width` columns.
+        width (int): 1x1 [px] The number of columns of the glyph.
+        stride (int): 1x1 [byte] The number of bytes of every padded column.
+
+    Returns:
+        list: 1x(width*stride) [-] The padded record.
+
+    ---
+    """
+    if not width:
+        return list(record)
+    column_bytes = len(record) // width
+    padded = []
+    for start in range(0, column_bytes * width, column_bytes or 1):
+        column = record[start : start + column_bytes]
+        padded.extend(column + [0x00] * (stride - len(column)))
+    return padded
+
+
+def pad_record(record: list, alignment: int) -> list:
+    """Pad a glyph record with zero bytes to a multiple of the alignment.
+
+    Args:
+        record (list): 1xn [-] The glyph record.
+        alignment (int): 1x1 [byte] The alignment of the record.
+
+    Returns:
+        list: 1xn [-] The padded record.
+
+    ---
+    """
+    return list(record) + [0x00] * (-len(record) % alignment)
+
+
+# === Classes ===
+
+
+class GlyphTable:  # pylint: disable=too-many-instance-attributes
+    """The glyph records of one font size in the order they are exported."""
+
+    def __init__(
+        self,
+        font_data,
+        trim: bool = False,
+        alignment: int = 1,
+        charset: list = None,
+    ):
+        """Create the glyph table of the converted font data.
+
+        Args:
+            font_data (FontData): 1x1 [-] The converted font data.
+            trim (bool, optional): 1x1 [-] Remove the empty byte rows of every glyph.
+            alignment (int, optional): 1x1 [byte] Pad the glyphs to this alignment.
+            charset (list, optional): 1xn [int] The order of the exported glyphs,
+                defaults to the charset of the font data.
+
+        Raises:
+            ValueError: The alignment is not one of `ALIGNMENTS`.
+
+        ---
+        """
+        if alignment not in ALIGNMENTS:
+            raise ValueError(f"Alignment has to be one of {ALIGNMENTS}.")
+        self.font = font_data
+        self.charset = list(font_data.charset if charset is None else charset)
+        self.records = [font_data.data[codepoint] for codepoint in self.charset]
+        self.stride = font_data.stride
+        self.alignment = 1
+        self.rows = None
+        self.offsets = None
+        self.section = None
+        self.table_alignment = 1
+        if trim:
+            self.trim()
+        if alignment > 1:
+            self.align(alignment)
+
+    def trim(self):
+        """Remove the empty byte rows of every glyph.
+
+        The first row and the number of rows of every glyph are stored in
+        `rows` and the start of every record in `offsets`.
+
+        Raises:
+            ValueError: The glyphs are dense bitstreams without byte rows.
+
+        ---
+        """
+        if self.font.dense:
+            raise ValueError("Dense glyphs have no byte rows to trim.")
+        self.rows = []
+        for slot, record in enumerate(self.records):
+            first, count, self.records[slot] = trim_rows(record, self.font.width)
+            self.rows.extend((first, count))
+        self.offsets = get_offsets(self.records)
+
+    def align(self, alignment: int):
+        """Pad the glyphs, so that every glyph starts at a multiple of the alignment.
+
+        The columns of untrimmed glyphs are padded to a stride which is a
+        multiple of the alignment, so that every column is aligned as well.
+        Trimmed glyphs have a varying number of rows per column and dense
+        glyphs have no byte columns, so only their records are padded and
+        the offsets are updated.
+
+        Args:
+            alignment (int): 1x1 [byte] The alignment of the glyphs.
+
+        ---
+        """
+        if self.rows is None and not self.font.dense:
+            self.stride = -(-self.font.stride // alignment) * alignment
+            self.records = [
+                pad_columns(record, self.font.width, self.stride)
+                for record in self.records
+            ]
+        self.records = [pad_record(record, alignment) for record in self.records]
+        if self.offsets is not None:
+            self.offsets = get_offsets(self.records)
+        self.alignment = alignment
+
+    def place(self, section: str = None, alignment: int = 1):
+        """Place the tables of the font size in a linker section.
+
+        The alignment only applies to the start of the lookup table, the
+        glyphs are not padded, see `align`.
+
+        Args:
+            section (str, optional): 1x1 [-] The linker section of the tables,
+                defaults to the section chosen by the linker.
+            alignment (int, optional): 1x1 [byte] The alignment of the lookup table.
+
+        ---
+        """
+        self.section = section
+        self.table_alignment = alignment
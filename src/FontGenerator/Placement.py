@@ -0,0 +1,182 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     `FontGenerator/Placement.py`
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+## Description
+Placement of the exported font tables in the memory of the target.
+Every font size can be placed in its own linker section, e.g. fonts
+which are drawn constantly in tightly-coupled memory and rarely used
+fonts in external flash. The glyph lookup table can additionally be
+aligned to a power of two, e.g. to the cache line size.
+
+A placement is a dict with the keys `section` and `align`. The
+placements of a project are given in a JSON manifest, which maps the
+font names and font sizes to their placement. `"*"` matches every font
+name or every size:
+
+```json
+{
+    "*": {"*": {"section": ".font_flash"}},
+    "DejaVuSans": {"8": {"section": ".itcm_rodata", "align": 32}}
+}
+```
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Modules ===
+import json
+import pathlib
+import re
+
+# === Constants ===
+PLACEMENT_KEYS: tuple = ("section", "align")
+
+WILDCARD: str = "*"
+
+_Section_Name = re.compile(r"[A-Za-z0-9_.$]+")
+
+_Size_Option = re.compile(r"(?:(?P<size>\d+):)?(?P<value>.*)")
+
+# === Functions ===
+
+
+def check_placement(placement: dict) -> dict:
+    """Check a placement and fill in the defaults of the missing keys.
+
+    Args:
+        placement (dict): 1x1 [-] The placement with the keys `section` and `align`.
+
+    Returns:
+        dict: 1x1 [-] The complete placement.
+
+    Raises:
+        ValueError: The section name or the alignment is not valid.
+
+    ---
+    """
+    unknown = set(placement) - set(PLACEMENT_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown placement keys: {', '.join(sorted(unknown))}")
+    section = placement.get("section")
+    align = placement.get("align", 1)
+    if section is not None and not _Section_Name.fullmatch(str(section)):
+        raise ValueError(f"Invalid section name: {section!r}")
+    if not isinstance(align, int) or align < 1 or align & (align - 1):
+        raise ValueError(f"Alignment has to be a power of two: {align!r}")
+    return {"section": section, "align": align}
+
+
+def merge(*placements: dict) -> dict:
+    """Merge placements, the keys of later placements take precedence.
+
+    Args:
+        *placements (dict): 1xn [-] The placements.
+
+    Returns:
+        dict: 1x1 [-] The merged placement, keys which are `None` are skipped.
+
+    ---
+    """
+    merged = {}
+    for placement in placements:
+        merged.update(
+            {key: value for key, value in placement.items() if value is not None}
+        )
+    return merged
+
+
+def parse_option(text: str) -> tuple:
+    """Parse a placement option given as `[SIZE:]VALUE`.
+
+    Args:
+        text (str): 1xn [-] The option, e.g. `.itcm_rodata` or `8:.itcm_rodata`.
+
+    Returns:
+        tuple: 1x2 [-] The font size or `WILDCARD` and the value.
+
+    ---
+    """
+    match = _Size_Option.fullmatch(text)
+    size = WILDCARD if match["size"] is None else int(match["size"])
+    return size, match["value"]
+
+
+def load_manifest(file: pathlib.Path) -> dict:
+    """Load a placement manifest.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The JSON manifest.
+
+    Returns:
+        dict: 1xn [dict] The placements by font name and size, the sizes
+            are integers or `WILDCARD`.
+
+    Raises:
+        ValueError: The manifest contains an invalid placement.
+
+    ---
+    """
+    content = json.loads(pathlib.Path(file).read_text(encoding="utf-8"))
+    if not isinstance(content, dict):
+        raise ValueError(f"{file} does not map font names to placements.")
+
+    manifest = {}
+    for name, sizes in content.items():
+        if not isinstance(sizes, dict):
+            raise ValueError(f"{file} does not map the sizes of {name} to placements.")
+        manifest[name] = {}
+        for size, placement in sizes.items():
+            if not isinstance(placement, dict):
+                raise ValueError(f"Placement of {name} {size} is not an object.")
+            check_placement(placement)
+            manifest[name][size if size == WILDCARD else int(size)] = placement
+    return manifest
+
+
+def get_placement(manifest: dict, name: str, size: int) -> dict:
+    """Get the placement of a font size from a manifest.
+
+    Entries for the font name take precedence over `WILDCARD` fonts and
+    entries for the size over `WILDCARD` sizes.
+
+    Args:
+        manifest (dict): 1xn [dict] The placements by font name and size,
+            see `load_manifest`.
+        name (str): 1x1 [-] The name of the font.
+        size (int): 1x1 [px] The font size in pixels.
+
+    Returns:
+        dict: 1x1 [-] The placement, empty when the manifest has no entry.
+
+    ---
+    """
+    placements = []
+    for font in (WILDCARD, name):
+        sizes = manifest.get(font, {})
+        placements += [sizes.get(WILDCARD, {}), sizes.get(size, {})]
+    return merge(*placements)
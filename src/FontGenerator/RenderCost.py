@@ -0,0 +1,157 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     `FontGenerator/RenderCost.py`
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+## Description
+Estimates the cost of drawing strings with the exported font tables.
+The model follows the text drawing of *OTOS*: every character looks up
+its glyph in the tables of `Font::Base_t`, reads the glyph record and
+writes its columns to the display RAM. The cost of every codepoint is
+computed once from the exported glyph table, whole string catalogs are
+then evaluated with *NumPy*.
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Modules ===
+import numpy as np
+from . import Charset, Exporter
+
+# === Constants ===
+COST_KEYS: tuple = ("glyphs", "lookups", "bytes_read", "bytes_written")
+
+# === Functions ===
+
+
+def get_glyph_costs(table) -> dict:
+    """Get the cost of drawing every codepoint with the exported tables.
+
+    Codepoints which are not part of the charset cost as much as the
+    fallback glyph they are mapped to.
+
+    Args:
+        table (Layout.GlyphTable): 1x1 [-] The exported glyph table.
+
+    Returns:
+        dict: 1x1 [-] The `lookups`, `bytes_read` and `bytes_written` of
+            every codepoint as 1x256 arrays.
+
+    ---
+    """
+    width = table.font.width
+    slots = np.array(Charset.get_index_table(table.charset))
+    record_bytes = np.array([len(record) for record in table.records], dtype=np.int64)
+
+    # Every glyph reads the lookup table, subsets read the index table
+    # and trimmed glyphs read their rows and offset.
+    lookups = 1
+    table_bytes = 0
+    if not Charset.is_complete(table.charset):
+        lookups += 1
+        table_bytes += 1
+    if table.rows is not None:
+        offset_type = Exporter.get_table_type(max(table.offsets, default=0))
+        lookups += 2
+        table_bytes += 2 + Exporter.get_table_size(offset_type)
+        rows = np.array(table.rows[1::2], dtype=np.int64)
+    else:
+        rows = np.minimum(record_bytes // max(width, 1), table.font.stride)
+
+    return {
+        "lookups": np.full(256, lookups, dtype=np.int64),
+        "bytes_read": record_bytes[slots] + table_bytes,
+        "bytes_written": width * rows[slots],
+    }
+
+
+def encode_strings(strings: list) -> tuple:
+    """Encode strings to the 8-bit codepoints of the font tables.
+
+    Characters which cannot be represented as 8-bit codepoint are
+    replaced by the fallback codepoint.
+
+    Args:
+        strings (list): 1xn [str] The strings.
+
+    Returns:
+        tuple: 1x2 [np.ndarray] The codepoints of all strings and the
+            index of the string of every codepoint.
+
+    ---
+    """
+    lengths = np.array([len(string) for string in strings], dtype=np.int64)
+    codes = np.frombuffer("".join(strings).encode("utf-32-le"), dtype="<u4")
+    codes = np.where(codes < 256, codes, Charset.FALLBACK_CODEPOINT)
+    return codes.astype(np.uint8), np.repeat(np.arange(len(strings)), lengths)
+
+
+def get_render_costs(table, strings: list) -> dict:
+    """Get the cost of drawing every string with the exported tables.
+
+    Args:
+        table (Layout.GlyphTable): 1x1 [-] The exported glyph table.
+        strings (list): 1xn [str] The strings to draw.
+
+    Returns:
+        dict: 1x1 [-] The `glyphs`, `lookups`, `bytes_read` and
+            `bytes_written` of every string as 1xn arrays.
+
+    ---
+    """
+    codes, ids = encode_strings(strings)
+    costs = {"glyphs": np.ones(256, dtype=np.int64), **get_glyph_costs(table)}
+    return {
+        key: np.bincount(ids, weights=costs[key][codes], minlength=len(strings)).astype(
+            np.int64
+        )
+        for key in COST_KEYS
+    }
+
+
+def format_costs(table, costs: dict) -> str:
+    """Format the total and the maximum cost of a string catalog.
+
+    Args:
+        table (Layout.GlyphTable): 1x1 [-] The exported glyph table.
+        costs (dict): 1x1 [-] The costs of the strings, see `get_render_costs`.
+
+    Returns:
+        str: 1xn [-] The formatted costs.
+
+    ---
+    """
+    strings = len(costs["glyphs"])
+    lines = [
+        f"{table.font.name} {table.font.size}px: {strings} strings, "
+        + ", ".join(f"{key}: {int(np.sum(costs[key]))}" for key in COST_KEYS)
+    ]
+    if strings:
+        lines.append(
+            "    max per string: "
+            + ", ".join(f"{key}: {int(np.max(costs[key]))}" for key in COST_KEYS)
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,222 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     `FontGenerator/Report.py`
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+## Description
+Flash usage report of the exported font tables.
+The report is computed from the converted font data and lists the
+bytes per font size and glyph range as well as the bytes which are
+wasted by blank glyphs, empty columns and stride rounding.
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Modules ===
+import json
+import pathlib
+
+# === Constants ===
+GLYPH_RANGES: tuple = (
+    ("control", 0x00, 0x1F),
+    ("ascii", 0x20, 0x7E),
+    ("extended", 0x7F, 0x9F),
+    ("latin-1", 0xA0, 0xFF),
+)
+
+# === Functions ===
+
+
+def get_range_name(codepoint: int) -> str:
+    """Get the name of the glyph range a codepoint belongs to.
+
+    Args:
+        codepoint (int): 1x1 [-] The codepoint of the glyph.
+
+    Returns:
+        str: 1x1 [-] The name of the glyph range.
+
+    ---
+    """
+    for name, first, last in GLYPH_RANGES:
+        if first <= codepoint <= last:
+            return name
+    raise ValueError(f"Codepoint {codepoint:#x} is not part of any glyph range.")
+
+
+def get_font_report(
+    font_data,
+    records: list = None,
+    table_bytes: int = 0,
+    string_bytes: int = 0,
+    charset: list = None,
+) -> dict:
+    """Get the flash usage of one font size.
+
+    Args:
+        font_data (FontData): 1x1 [-] The converted font data.
+        records (list, optional): 1xn [-] The exported glyph records in the
+            order of `charset`, defaults to the converted glyphs.
+        table_bytes (int, optional): 1x1 [byte] Bytes of additional lookup tables.
+        string_bytes (int, optional): 1x1 [byte] Bytes of pre-rendered strings.
+        charset (list, optional): 1xn [int] The codepoints of the records,
+            defaults to the charset of the font data.
+
+    Returns:
+        dict: 1x1 [-] The flash usage of the font size.
+
+    ---
+    """
+    if charset is None:
+        charset = font_data.charset
+    if records is None:
+        records = [font_data.data[codepoint] for codepoint in charset]
+
+    ranges = {name: 0 for name, _, _ in GLYPH_RANGES}
+    blank = 0
+    columns = 0
+    rounding_bits = 0
+    for codepoint, record in zip(charset, records):
+        ranges[get_range_name(codepoint)] += len(record)
+
+        # Blank glyphs are wasted completely
+        if not any(record):
+            blank += len(record)
+            continue
+
+        # Dense glyphs only waste the bits at the end of the glyph
+        column_bits = font_data.height * font_data.bpp
+        if font_data.dense:
+            rounding_bits += 8 * len(record) - font_data.width * column_bits
+            continue
+
+        # Count the empty columns and the unused bits of every column
+        column_bytes = len(record) // font_data.width if font_data.width else 0
+        for start in range(0, column_bytes * font_data.width, column_bytes or 1):
+            if not any(record[start : start + column_bytes]):
+                columns += column_bytes
+        rounding_bits += font_data.width * max(0, 8 * column_bytes - column_bits)
+
+    glyph_bytes = sum(ranges.values())
+    return {
+        "name": font_data.name,
+        "size": font_data.size,
+        "width": font_data.width,
+        "height": font_data.height,
+        "stride": font_data.stride,
+        "glyphs": len(records),
+        "bytes": {
+            "glyphs": glyph_bytes,
+            "tables": table_bytes,
+            "strings": string_bytes,
+            "total": glyph_bytes + table_bytes + string_bytes,
+        },
+        "ranges": ranges,
+        "waste": {
+            "blank_glyphs": blank,
+            "empty_columns": columns,
+            "stride_rounding": rounding_bits // 8,
+        },
+    }
+
+
+def get_report(font_reports: list, budget: int = None) -> dict:
+    """Combine the reports of all font sizes.
+
+    Args:
+        font_reports (list): 1xn [dict] The reports of the font sizes.
+        budget (int, optional): 1x1 [byte] The available flash budget.
+
+    Returns:
+        dict: 1x1 [-] The combined report.
+
+    ---
+    """
+    total = sum(font["bytes"]["total"] for font in font_reports)
+    return {
+        "fonts": font_reports,
+        "total": total,
+        "budget": budget,
+        "exceeded": budget is not None and total > budget,
+    }
+
+
+def format_report(report: dict) -> str:
+    """Format the report as human readable text.
+
+    Args:
+        report (dict): 1x1 [-] The combined report.
+
+    Returns:
+        str: 1xn [-] The formatted report.
+
+    ---
+    """
+    lines = [
+        f"{'Font':<24}{'Size':>6}{'Glyphs':>8}{'Bytes':>9}{'Blank':>8}"
+        f"{'Columns':>9}{'Stride':>8}"
+    ]
+    for font in report["fonts"]:
+        lines.append(
+            f"{font['name']:<24}{font['size']:>4}px{font['glyphs']:>8}"
+            f"{font['bytes']['total']:>9}{font['waste']['blank_glyphs']:>8}"
+            f"{font['waste']['empty_columns']:>9}{font['waste']['stride_rounding']:>8}"
+        )
+        lines.append(
+            "    "
+            + ", ".join(f"{name}: {size}" for name, size in font["ranges"].items())
+            + f", tables: {font['bytes']['tables']}"
+            + (
+                f", strings: {font['bytes']['strings']}"
+                if font["bytes"]["strings"]
+                else ""
+            )
+        )
+
+    total = f"Total: {report['total']} bytes"
+    if report["budget"] is not None:
+        total += f" of {report['budget']} bytes budget"
+        total += " (exceeded)" if report["exceeded"] else ""
+    lines.append(total)
+    return "\n".join(lines) + "\n"
+
+
+def write_report(report: dict, file: pathlib.Path):
+    """Write the report to a file.
+
+    Files with the suffix `.json` are written as JSON, all others as text.
+
+    Args:
+        report (dict): 1x1 [-] The combined report.
+        file (pathlib.Path): 1x1 [-] The file to write to.
+
+    ---
+    """
+    file = pathlib.Path(file)
+    if file.suffix.lower() == ".json":
+        file.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    else:
+        file.write_text(format_report(report), encoding="utf-8")
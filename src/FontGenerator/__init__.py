@@ -35,22 +35,43 @@ Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 ---
 """
 # === Modules ===
+import collections
 import pathlib
 import math
 import dataclasses
-from . import BitConverter, Exporter
+from . import (
+    BitConverter,
+    Charset,
+    Exporter,
+    FontIndex,
+    GlyphFile,
+    Layout,
+    Placement,
+    RenderCost,
+    Report,
+)
 
 # === Package Information ===
 __author__ = "Sebastian Oberschwendtner"
 __version__ = "1.0.0"
-__all__ = ["BitConverter", "Exporter"]
+__all__ = [
+    "BitConverter",
+    "Charset",
+    "Exporter",
+    "FontIndex",
+    "GlyphFile",
+    "Layout",
+    "Placement",
+    "RenderCost",
+    "Report",
+]
 
 # === Functions ===
 
 
 # === Classes ===
 @dataclasses.dataclass
-class FontData:
+class FontData:  # pylint: disable=too-many-instance-attributes
     """Data type to store font data."""
 
     def __init__(self):
@@ -58,7 +79,13 @@ class FontData:
         self.name = ""
         self.size = 0
         self.width = 0
+        self.height = 0
         self.stride = 0
+        self.rotation = 0
+        self.mirror = False
+        self.bpp = 1
+        self.dense = False
+        self.charset = list(range(256))
         self.data = [
             [],
         ] * 256
@@ -68,45 +95,328 @@ class FontData:
 class Font:
     """Class to generate font files."""
 
-    def __init__(self, font_file: pathlib.Path, font_size: int):
-        """Constructor of the font class."""
+    def __init__(
+        self,
+        font_file: pathlib.Path,
+        font_size: int,
+        charset: list = None,
+        **options,
+    ):
+        """Constructor of the font class.
+
+        When a charset is given, only these codepoints are converted and exported.
+        The options are passed to the `BitConverter.FontConverter`.
+        """
         self.data: FontData = FontData()
+        if charset is not None:
+            self.data.charset = list(charset)
         self.converter: BitConverter.FontConverter = BitConverter.FontConverter(
-            str(font_file), font_size
+            str(font_file), font_size, **options
+        )
+        self.engine: str = "reference"
+        self._converted: set = set()
+
+    @classmethod
+    def from_data(cls, data: FontData) -> "Font":
+        """Create a font from already converted font data, see `Fonts.load`.
+
+        The font has no converter, all glyphs which are not part of the
+        font data are empty.
+        """
+        _font = cls.__new__(cls)
+        _font.data = data
+        _font.converter = None
+        _font.engine = "reference"
+        _font._converted = set(range(256))
+        return _font
+
+    def __getitem__(self, codepoint) -> list:
+        """Get the bitmap of a glyph, the glyph is converted on first access.
+
+        The codepoint can be given as integer or as character. Converted
+        glyphs are stored in the font data, so that every glyph is only
+        converted once. The engine of the last `convert` is used.
+
+        Raises:
+            KeyError: The codepoint is not an 8-bit codepoint.
+        """
+        if isinstance(codepoint, str):
+            codepoint = ord(codepoint)
+        if codepoint not in range(256):
+            raise KeyError(f"Codepoint {codepoint!r} is not an 8-bit codepoint.")
+        if codepoint not in self._converted:
+            self._convert_characters([codepoint])
+        return self.data.data[codepoint]
+
+    def convert(self, engine: str = "reference"):
+        """Convert the font file to a font file.
+
+        All glyphs of the charset are converted at once, glyphs which were
+        already converted on access are kept.
+        The engine selects the conversion implementation, see `BitConverter.ENGINES`.
+        """
+        self.engine = engine
+        self._convert_characters(
+            [iChar for iChar in self.data.charset if iChar not in self._converted]
         )
 
-    def convert(self):
-        """Convert the font file to a font file."""
+    def _convert_characters(self, characters: list):
+        """Convert the given characters and assign the meta data of the font."""
         # Assign meta data
         self.data.name = self.converter.fontname
         self.data.size = self.converter.height_px
-        self.data.width = self.converter.width_px
-        self.data.stride = int(math.ceil(self.converter.height_px / 8))
+        self.data.width = self.converter.bitmap_width_px
+        self.data.height = self.converter.bitmap_height_px
+        self.data.bpp = self.converter.bpp
+        self.data.dense = self.converter.dense
+        self.data.stride = int(
+            math.ceil(self.converter.bitmap_height_px * self.data.bpp / 8)
+        )
+        self.data.rotation = self.converter.rotation
+        self.data.mirror = self.converter.mirror
 
         # Convert the characters
-        for i in range(256):
-            self.data.data[i] = self.converter.convert_character(i)
+        bitmaps = self.converter.convert_characters(characters, self.engine)
+        for i, bitmap in zip(characters, bitmaps):
+            self.data.data[i] = bitmap
+        self._converted.update(characters)
+
+    def convert_strings(self, strings: list) -> list:
+        """Convert constant strings to one bitmap per string.
+
+        Returns the (width, height) in pixels and the bitmap of every string,
+        see `BitConverter.FontConverter.convert_string`.
+
+        Raises:
+            ValueError: The font has no converter, e.g. it was loaded with
+                `Fonts.load`.
+        """
+        if strings and self.converter is None:
+            raise ValueError(
+                f"Strings cannot be pre-rendered with the loaded font {self.data.name}, "
+                "the font file is required."
+            )
+        return [self.converter.convert_string(text) for text in strings]
 
 
 class Fonts:
     """Class to generate multiple font files."""
 
-    def __init__(self, font_file: pathlib.Path, font_sizes: list):
-        """Constructor of the fonts class."""
+    def __init__(
+        self,
+        font_file: pathlib.Path,
+        font_sizes: list,
+        charset: list = None,
+        **options,
+    ):
+        """Constructor of the fonts class.
+
+        The options are passed to the `BitConverter.FontConverter`.
+        """
         self.fonts = []
         for iSize in font_sizes:
-            self.fonts.append(Font(font_file, iSize))
+            self.fonts.append(Font(font_file, iSize, charset, **options))
 
-    def convert(self):
+    @classmethod
+    def from_fonts(cls, fonts: list) -> "Fonts":
+        """Create the fonts from already converted fonts, see `FontCache`."""
+        _fonts = cls.__new__(cls)
+        _fonts.fonts = list(fonts)
+        return _fonts
+
+    def convert(self, engine: str = "reference"):
         """Convert all fonts."""
         for font in self.fonts:
-            font.convert()
+            font.convert(engine)
+
+    def save(self, file: pathlib.Path):
+        """Save the converted fonts to an intermediate file.
+
+        The file can be loaded with `load` and exported many times without
+        converting the fonts again, see `FontGenerator.GlyphFile`.
+        """
+        GlyphFile.save(file, [font.data for font in self.fonts])
+
+    @classmethod
+    def load(cls, file: pathlib.Path, mmap: bool = True) -> "Fonts":
+        """Load the converted fonts of an intermediate file.
+
+        With `mmap`, the glyphs are memory mapped and only read when they
+        are exported. Loaded fonts cannot pre-render strings, since the
+        font file is not opened again.
+        """
+        fonts = []
+        for metadata, glyphs in GlyphFile.load(file, mmap):
+            data = FontData()
+            for key in GlyphFile.METADATA_KEYS:
+                setattr(data, key, metadata[key])
+            data.dense = metadata["layout"] == "dense"
+            data.charset = glyphs.charset
+            data.data = glyphs
+            fonts.append(Font.from_data(data))
+        return cls.from_fonts(fonts)
 
-    def export(self, export_path: pathlib.Path):
-        """Export the font file."""
-        # Create file
+    def export(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        export_path: pathlib.Path,
+        *,
+        budget: int = None,
+        split: bool = False,
+        source: bool = False,
+        trim: bool = False,
+        align: int = 1,
+        strings: list = None,
+        frequencies: dict = None,
+        placement: dict = None,
+    ) -> dict:
+        """Export the font file.
+
+        All options are keyword-only.
+
+        With `split`, every size is written to its own `<Name>_<Size>px.h`
+        and `<Name>.h` only includes these headers. Firmware modules can then
+        include only the sizes they use.
+
+        With `source`, the lookup tables are defined once in `<Name>.cpp`
+        and the headers only contain `extern` declarations and the font
+        descriptors, so that the tables are not parsed by every translation
+        unit which includes the font.
+
+        With `trim`, the empty byte rows of every glyph are not exported.
+        The first row and the number of rows of every glyph are exported in
+        a `Rows_` table and the start of every glyph in an `Offsets_` table.
+
+        With `align`, every glyph and every column is padded to a multiple
+        of `align` bytes and the lookup tables are declared with `alignas`,
+        so that the firmware can copy the glyphs with word or DMA transfers.
+        The padded stride is exported in the font descriptor.
+
+        Fonts converted with `dense` store the columns of every glyph as one
+        bitstream. The bits per column and the bytes per glyph are exported
+        in the font descriptor, so that the firmware can compute the exact
+        bit offset of every pixel, see `BitConverter.pack_bitstream`.
+
+        With `strings`, every non-empty constant string is pre-rendered to
+        one bitmap per size and written to `<Name>_Strings.h`. Every string
+        gets its own font descriptor, so that the firmware can draw it with
+        a single blit instead of one glyph lookup per character.
+
+        With `frequencies`, the glyphs are ordered by their number of uses,
+        so that the most used glyphs are stored next to each other and stay
+        in the flash cache during text rendering. The codepoints are then
+        mapped to their glyph slots by an `Index_` table, see
+        `Charset.sort_by_frequency`.
+
+        With `placement`, the tables of a font size are placed in the linker
+        section of its placement and the lookup table is aligned to its
+        alignment. The placements are given by font size, see `Placement`.
+
+        Every file is only replaced when its content changes, so that
+        unchanged fonts do not trigger a rebuild of the firmware.
+
+        Returns the flash usage report of the exported tables,
+        see `FontGenerator.Report`.
+        """
         _name = self.fonts[0].data.name
-        file = export_path / f"{_name}.h"
+        tables = []
+        for iFont in self.fonts:
+            charset = iFont.data.charset
+            if frequencies is not None:
+                charset = Charset.sort_by_frequency(charset, frequencies)
+            tables.append(Layout.GlyphTable(iFont.data, trim, align, charset))
+            _placement = Placement.check_placement(
+                (placement or {}).get(iFont.data.size, {})
+            )
+            tables[-1].place(_placement["section"], _placement["align"])
+        strings = [text for text in strings or [] if text]
+        bitmaps = [iFont.convert_strings(strings) for iFont in self.fonts]
+        reports = [
+            self._get_report(_name, table, string_bitmaps)
+            for table, string_bitmaps in zip(tables, bitmaps)
+        ]
+
+        # Write the headers, either one per size or all sizes in one header
+        if split:
+            headers = []
+            for table in tables:
+                _guard = f"{_name}_{table.font.size}px"
+                headers.append(f"{_guard}.h")
+                self._write_header(export_path / headers[-1], _guard, [table], source)
+
+            # Write the umbrella header
+            with Exporter.write_if_changed(export_path / f"{_name}.h") as file:
+                self._write_file_header(file, [])
+                Exporter.write_umbrella_header(file, _name, headers)
+        else:
+            self._write_header(export_path / f"{_name}.h", _name, tables, source)
+
+        # Write the source file with the table definitions
+        if source:
+            with Exporter.write_if_changed(export_path / f"{_name}.cpp") as file:
+                self._write_file_header(file, tables)
+                Exporter.write_source_preamble(file, f"{_name}.h")
+                for table in tables:
+                    self._write_tables(file, _name, table, "const")
+                    Exporter.write_lookup_table_close(file)
+                Exporter.finalize_source(file)
+
+        # Write the header with the pre-rendered strings
+        if strings:
+            self._write_strings(
+                export_path / f"{_name}_Strings.h", tables, strings, bitmaps
+            )
+
+        return Report.get_report(reports, budget)
+
+    @classmethod
+    def _write_header(cls, path: pathlib.Path, guard: str, tables: list, source: bool):
+        """Write a header with the lookup tables and the font descriptors.
+
+        With `source`, the tables are only declared.
+        """
+        with Exporter.write_if_changed(path) as file:
+            cls._write_header_content(file, guard, tables, source)
+
+    @classmethod
+    def _write_header_content(
+        cls, file: pathlib.Path, guard: str, tables: list, source: bool
+    ):
+        """Write the content of a header, see `_write_header`."""
+        _name = tables[0].font.name
+        cls._write_file_header(file, [] if source else tables)
+        Exporter.write_lookup_table_preamble(file, guard)
+        for table in tables:
+            data = table.font
+            _size = (data.width, data.height)
+            fields = cls._get_fields(_name, table)
+            if source:
+                for table_name, ctype, _, _ in cls._get_tables(_name, table).values():
+                    Exporter.write_table_declaration(file, table_name, ctype)
+                Exporter.write_table_declaration(
+                    file, Exporter.get_lookup_table_name(_name, data.size)
+                )
+                Exporter.write_font_descriptor(
+                    file, _name, _size, table.stride, fields, data.size
+                )
+            else:
+                cls._write_tables(file, _name, table, "constexpr")
+                Exporter.write_lookup_table_end(
+                    file, _name, _size, table.stride, fields, data.size
+                )
+        Exporter.finalize_file(file, guard)
+
+    @staticmethod
+    def _write_file_header(file: pathlib.Path, tables: list):
+        """Write the copyright and the autogenerated warning to a new file.
+
+        The warning contains the content hash of the glyph data of the fonts
+        whose tables are defined in the file. Files without tables have no
+        hash, so that they are not rewritten when only the glyphs change.
+        """
+        _hash = ""
+        if tables:
+            _hash = Exporter.get_content_hash([table.font for table in tables])
+            _hash = f" * Content hash: sha256:{_hash}\n"
 
         # Write Copyright
         Exporter.write_copyright_header(file)
@@ -116,28 +426,253 @@ class Fonts:
             f.write(
                 "\n/**\n * @attention\n"
                 + f" * This file is autogenerated by {__name__} - {__version__}.\n"
-                + " * You should probably not edit this file manually.\n */\n"
+                + " * You should probably not edit this file manually.\n"
+                + _hash
+                + " */\n"
             )
 
-        # Write lookup preamble
-        Exporter.write_lookup_table_preamble(file, _name)
+    @staticmethod
+    def _get_tables(name: str, table: Layout.GlyphTable) -> dict:
+        """Get the additional lookup tables of a font size.
 
-        for iFont in self.fonts:
-            # Write lookup table begin
-            Exporter.write_lookup_table_begin(
-                file, _name, (iFont.data.width, iFont.data.size)
+        Returns the descriptor field and the (name, type, values, description)
+        of every table.
+        """
+        tables = {}
+        size = table.font.size
+        if not Charset.is_complete(table.charset):
+            tables["index"] = (
+                Exporter.get_index_table_name(name, size),
+                "unsigned char",
+                Charset.get_index_table(table.charset),
+                "Codepoint to glyph slot lookup table",
+            )
+        if table.rows is not None:
+            tables["rows"] = (
+                f"Rows_{name}_{size}px",
+                "unsigned char",
+                table.rows,
+                "First byte row and number of byte rows of every glyph",
+            )
+            tables["offsets"] = (
+                f"Offsets_{name}_{size}px",
+                Exporter.get_table_type(max(table.offsets, default=0)),
+                table.offsets,
+                "Start of every glyph in the lookup table",
             )
+        return tables
 
-            # Write lookup table
-            with open(file, "a", encoding="utf-8") as f:
-                for iChar in range(256):
-                    line = Exporter.get_array_line(iChar, iFont.data.data[iChar])
-                    f.write(8 * " " + line)
+    @classmethod
+    def _get_fields(cls, name: str, table: Layout.GlyphTable) -> dict:
+        """Get all additional descriptor fields of a font size."""
+        fields = {
+            field: values[0] for field, values in cls._get_tables(name, table).items()
+        }
+        fields.update(cls._get_option_fields(table.font))
+        if table.font.dense:
+            fields["column_bits"] = table.font.height * table.font.bpp
+            fields["glyph_bytes"] = max(map(len, table.records), default=0)
+        return fields
 
-            # Write lookup table end
-            Exporter.write_lookup_table_end(
-                file, _name, (iFont.data.width, iFont.data.size), iFont.data.stride
-            )
+    @staticmethod
+    def _get_option_fields(data: FontData) -> dict:
+        """Get the descriptor fields of the converter options of a font size.
+
+        The bit offsets of dense bitmaps depend on the bitmap height and are
+        added by the callers.
+        """
+        fields = {}
+        if data.rotation:
+            fields["rotation"] = data.rotation
+        if data.mirror:
+            fields["mirrored"] = "true"
+        if data.bpp > 1:
+            fields["bpp"] = data.bpp
+        return fields
+
+    @classmethod
+    def _get_report(
+        cls, name: str, table: Layout.GlyphTable, bitmaps: list = ()
+    ) -> dict:
+        """Get the flash usage report of one font size."""
+        table_bytes = 0
+        for _, ctype, values, _ in cls._get_tables(name, table).values():
+            table_bytes += len(values) * Exporter.get_table_size(ctype)
+        string_bytes = sum(len(bitmap) for _, bitmap in bitmaps)
+        return Report.get_font_report(
+            table.font, table.records, table_bytes, string_bytes, table.charset
+        )
+
+    @classmethod
+    def _write_strings(
+        cls, path: pathlib.Path, tables: list, strings: list, bitmaps: list
+    ):
+        """Write the bitmaps and descriptors of the pre-rendered strings.
+
+        The bitmaps of every size are given in the order of `strings`.
+        """
+        _name = tables[0].font.name
+        _guard = f"{_name}_Strings"
+        used = set()
+        identifiers = [Exporter.get_string_identifier(text, used) for text in strings]
+
+        with Exporter.write_if_changed(path) as file:
+            cls._write_file_header(file, [])
+            Exporter.write_lookup_table_preamble(file, _guard)
+            for table, string_bitmaps in zip(tables, bitmaps):
+                descriptors = [
+                    cls._write_string_bitmap(file, table, *string)
+                    for string in zip(identifiers, strings, string_bitmaps)
+                ]
+                Exporter.write_string_descriptors(
+                    file, _name, table.font.size, descriptors
+                )
+            Exporter.finalize_file(file, _guard)
+
+    @classmethod
+    def _write_string_bitmap(  # pylint: disable=too-many-arguments
+        cls,
+        file: pathlib.Path,
+        table: Layout.GlyphTable,
+        identifier: str,
+        text: str,
+        bitmap: tuple,
+    ) -> tuple:
+        """Write the bitmap of one pre-rendered string.
+
+        Returns the identifier, table name, size, stride and descriptor fields
+        of the string. The bit offsets of dense strings are computed from the
+        height of the string bitmap, which differs from the glyph height when
+        the glyphs are rotated.
+        """
+        size, values = bitmap
+        table_name = Exporter.get_string_table_name(
+            table.font.name, table.font.size, identifier
+        )
+        Exporter.write_string_bitmap(file, table_name, text, size, values)
+        stride = len(values) // size[0] if size[0] else 0
+        fields = cls._get_option_fields(table.font)
+        if table.font.dense:
+            fields["column_bits"] = size[1] * table.font.bpp
+            fields["glyph_bytes"] = len(values)
+        return identifier, table_name, size, stride, fields
+
+    @classmethod
+    def _write_tables(
+        cls, file: pathlib.Path, name: str, table: Layout.GlyphTable, storage: str
+    ):
+        """Write the lookup tables of one font size, the last table is left open."""
+        data = table.font
 
-        # Finalize file
-        Exporter.finalize_file(file, _name)
+        # Write the additional tables, like the codepoint index of subsets,
+        # to the linker section of the font size
+        _storage = Exporter.get_placement_qualifier(table.section) + storage
+        for field, (table_name, ctype, values, brief) in cls._get_tables(
+            name, table
+        ).items():
+            if field == "index":
+                Exporter.write_index_table(file, name, data.size, values, _storage)
+            else:
+                Exporter.write_table(file, table_name, values, ctype, _storage, brief)
+
+        # Write lookup table begin, aligned for word and DMA transfers
+        _storage = Exporter.get_placement_qualifier(
+            table.section, max(table.alignment, table.table_alignment)
+        )
+        Exporter.write_lookup_table_begin(
+            file, name, (data.width, data.height), _storage + storage, data.size
+        )
+
+        # Write lookup table
+        with open(file, "a", encoding="utf-8") as f:
+            for iChar, record in zip(table.charset, table.records):
+                f.write(8 * " " + Exporter.get_array_line(iChar, record))
+
+
+class FontCache:
+    """Least recently used cache of converted fonts.
+
+    A long-running process, like the font generator daemon, keeps the loaded
+    font files and the converted glyphs of the recently used sizes in memory,
+    so that repeated requests do not parse and convert the font again.
+    """
+
+    def __init__(self, max_fonts: int = 32):
+        """Constructor of the font cache.
+
+        At most `max_fonts` font sizes are kept, the least recently used
+        size is dropped first.
+        """
+        self.max_fonts = max_fonts
+        self.hits = 0
+        self.misses = 0
+        self._fonts = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of cached font sizes."""
+        return len(self._fonts)
+
+    @staticmethod
+    def get_key(
+        font_file: pathlib.Path,
+        font_size: int,
+        charset: list = None,
+        engine: str = "reference",
+        **options,
+    ) -> tuple:
+        """Get the cache key of a converted font size.
+
+        The key contains the modification time of the font file, so that a
+        changed font file is converted again. Font names which are resolved
+        by the system have no modification time.
+        """
+        path = pathlib.Path(font_file)
+        mtime = path.stat().st_mtime_ns if path.is_file() else None
+        return (
+            str(font_file),
+            mtime,
+            font_size,
+            None if charset is None else tuple(charset),
+            engine,
+            tuple(sorted(options.items())),
+        )
+
+    def get_font(
+        self,
+        font_file: pathlib.Path,
+        font_size: int,
+        charset: list = None,
+        engine: str = "reference",
+        **options,
+    ) -> Font:
+        """Get a converted font size, the font is converted when it is not cached.
+
+        The options are passed to the `BitConverter.FontConverter`.
+        """
+        key = self.get_key(font_file, font_size, charset, engine, **options)
+        if key in self._fonts:
+            self.hits += 1
+            self._fonts.move_to_end(key)
+            return self._fonts[key]
+
+        self.misses += 1
+        font = Font(font_file, font_size, charset, **options)
+        font.convert(engine)
+        self._fonts[key] = font
+        while len(self._fonts) > self.max_fonts:
+            self._fonts.popitem(last=False)
+        return font
+
+    def get_fonts(
+        self,
+        font_file: pathlib.Path,
+        font_sizes: list,
+        charset: list = None,
+        engine: str = "reference",
+        **options,
+    ) -> Fonts:
+        """Get all converted font sizes, see `get_font`."""
+        return Fonts.from_fonts(
+            self.get_font(font_file, iSize, charset, engine, **options)
+            for iSize in font_sizes
+        )
@@ -0,0 +1,339 @@
+#!python
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     run_compile_benchmark.py
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+## Description
+Benchmark of the compile cost of the generated font files.
+Font files are exported for every combination of font size and output
+style and a small translation unit which includes the generated header
+is compiled with the local C++ compilers. The compile time, the peak
+memory of the compiler and the size of the object file are reported,
+so that changes of the exporter which slow down firmware builds are
+noticed.
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Modules ===
+import pathlib
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import FontGenerator as FG
+
+# === Constants ===
+COMPILERS: tuple = ("g++", "clang++")
+
+COMPILER_FLAGS: tuple = ("-std=c++20", "-O2")
+
+STYLES: dict = {
+    "header": ({}, {}),
+    "split": ({"split": True}, {}),
+    "source": ({"source": True}, {}),
+    "trim": ({"trim": True}, {}),
+    "align": ({"align": 4}, {}),
+    "dense": ({}, {"dense": True}),
+}
+
+# Measures a command in a fresh interpreter, the peak memory of a process
+# forked from the benchmark would include the memory of the benchmark.
+_Measure: str = """import resource, subprocess, sys, time
+start = time.perf_counter()
+status = subprocess.run(sys.argv[1:], check=False).returncode
+seconds = time.perf_counter() - start
+print(seconds, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+sys.exit(status)
+"""
+
+_Font_Base: str = """#ifndef FONT_BASE_H_
+#define FONT_BASE_H_
+// Stub of the OTOS font descriptor with all exported fields
+namespace Font
+{
+    struct Base_t
+    {
+        const unsigned char *data;
+        unsigned char width_px;
+        unsigned char height_px;
+        unsigned char stride;
+        const unsigned char *index = nullptr;
+        const unsigned char *rows = nullptr;
+        const void *offsets = nullptr;
+        unsigned short rotation = 0;
+        bool mirrored = false;
+        unsigned char bpp = 1;
+        unsigned short column_bits = 0;
+        unsigned short glyph_bytes = 0;
+    };
+};
+#endif /* FONT_BASE_H_ */
+"""
+
+
+# === Functions ===
+def find_compilers(names: list) -> list:
+    """Find the available C++ compilers.
+
+    Args:
+        names (list): 1xn [str] The names or paths of the compilers.
+
+    Returns:
+        list: 1xn [str] The compilers which are available.
+
+    ---
+    """
+    return [name for name in names if shutil.which(name)]
+
+
+def export_case(font: pathlib.Path, size: int, style: str, path: pathlib.Path) -> list:
+    """Export the font files of one benchmark case.
+
+    Args:
+        font (pathlib.Path): 1x1 [-] The font file.
+        size (int): 1x1 [px] The font size in pixels.
+        style (str): 1x1 [-] The output style, see `STYLES`.
+        path (pathlib.Path): 1x1 [-] The directory to export to.
+
+    Returns:
+        list: 1xn [tuple] The (unit, file) of every translation unit to compile.
+
+    ---
+    """
+    export_options, options = STYLES[style]
+    fonts = FG.Fonts(font, [size], **options)
+    fonts.convert("vectorized")
+    fonts.export(path, **export_options)
+
+    # Include the generated header like a firmware module
+    name = fonts.fonts[0].data.name
+    (path / "benchmark.cpp").write_text(f'#include "{name}.h"\n', encoding="utf-8")
+    units = [("header", path / "benchmark.cpp")]
+    if export_options.get("source"):
+        units.append(("source", path / f"{name}.cpp"))
+    return units
+
+
+def compile_unit(
+    compiler: str, file: pathlib.Path, include: pathlib.Path, repeat: int = 1
+) -> dict:
+    """Compile a translation unit and measure the cost.
+
+    Args:
+        compiler (str): 1x1 [-] The C++ compiler.
+        file (pathlib.Path): 1x1 [-] The translation unit.
+        include (pathlib.Path): 1x1 [-] The directory containing `font_base.h`.
+        repeat (int, optional): 1x1 [-] The number of compilations, the fastest
+            one is reported.
+
+    Returns:
+        dict: 1x1 [-] The `seconds`, the peak memory `peak_kb` of the compiler
+            and the `object_bytes` of the object file.
+
+    Raises:
+        RuntimeError: The translation unit does not compile.
+
+    ---
+    """
+    obj = file.with_suffix(".o")
+    log = file.with_suffix(".log")
+    command = [compiler, *COMPILER_FLAGS, "-I", str(include)]
+    command += ["-c", str(file), "-o", str(obj)]
+    seconds = []
+    peak_kb = 0
+    for _ in range(repeat):
+        with open(log, "w", encoding="utf-8") as stderr:
+            process = subprocess.run(
+                [sys.executable, "-I", "-S", "-c", _Measure, *command],
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                text=True,
+                check=False,
+            )
+        if process.returncode:
+            raise RuntimeError(f"{compiler} failed on {file.name}:\n{log.read_text()}")
+        run_seconds, rss = process.stdout.split()
+        seconds.append(float(run_seconds))
+
+        # The peak memory is given in bytes on macOS and in kilobytes otherwise
+        rss = int(rss) // 1024 if sys.platform == "darwin" else int(rss)
+        peak_kb = max(peak_kb, rss)
+    return {
+        "seconds": min(seconds),
+        "peak_kb": peak_kb,
+        "object_bytes": obj.stat().st_size,
+    }
+
+
+def format_results(results: list) -> str:
+    """Format the benchmark results as table.
+
+    Args:
+        results (list): 1xn [dict] The results of the compiled units.
+
+    Returns:
+        str: 1xn [-] The formatted results.
+
+    ---
+    """
+    lines = [
+        f"{'Compiler':<10}{'Size':>6}  {'Style':<8}{'Unit':<8}"
+        f"{'Seconds':>9}{'Peak KB':>10}{'Object':>9}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result['compiler']:<10}{result['size']:>4}px  {result['style']:<8}"
+            f"{result['unit']:<8}{result['seconds']:>9.3f}{result['peak_kb']:>10}"
+            f"{result['object_bytes']:>9}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main(args: argparse.Namespace) -> list:
+    """Runs the compile benchmark.
+
+    Args:
+        args (argparse.Namespace): 1x1 [-] The command line arguments:
+            - font (pathlib.Path): The font file or font name.
+            - size (list): The font sizes in pixels.
+            - style (list): The output styles, see `STYLES`.
+            - compiler (list): The C++ compilers to use when available.
+            - include (pathlib.Path): Directory with the `font_base.h` of OTOS.
+            - repeat (int): The number of compilations of every unit.
+            - json (pathlib.Path): File for the results as JSON.
+
+    Returns:
+        list: 1xn [dict] The results of the compiled units.
+
+    Raises:
+        SystemExit: No compiler or the font is not available.
+
+    ---
+    """
+    compilers = find_compilers(args.compiler)
+    if not compilers:
+        raise SystemExit(f"None of the compilers {args.compiler} is available. :(")
+    font = FG.FontIndex.resolve_font(args.font)
+
+    results = []
+    print(format_results([]), end="")
+    with tempfile.TemporaryDirectory() as temp:
+        # Use the descriptor of OTOS or the stub with all exported fields
+        include = args.include
+        if include is None:
+            include = pathlib.Path(temp)
+            (include / "font_base.h").write_text(_Font_Base, encoding="utf-8")
+
+        for size in args.size:
+            for style in args.style:
+                path = pathlib.Path(temp, f"{style}_{size}px")
+                path.mkdir()
+                try:
+                    units = export_case(font, size, style, path)
+                except OSError as error:
+                    raise SystemExit(
+                        "The font is not available on your system. :|"
+                    ) from error
+                for compiler in compilers:
+                    for unit, file in units:
+                        result = {
+                            "compiler": compiler,
+                            "size": size,
+                            "style": style,
+                            "unit": unit,
+                            **compile_unit(compiler, file, include, args.repeat),
+                        }
+                        print(format_results([result]).splitlines()[-1], flush=True)
+                        results.append(result)
+
+    if args.json is not None:
+        args.json.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return results
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Get the parser of the command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: 1x1 [-] The argument parser.
+
+    ---
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure the compile cost of the generated font files."
+    )
+    parser.add_argument(
+        "-f", "--font", type=pathlib.Path, required=True, help="Font file or name."
+    )
+    parser.add_argument(
+        "-s",
+        "--size",
+        type=int,
+        nargs="+",
+        default=[8, 16, 32],
+        help="Font sizes in pixels.",
+    )
+    parser.add_argument(
+        "--style",
+        nargs="+",
+        choices=STYLES,
+        default=list(STYLES),
+        help="Output styles of the font files.",
+    )
+    parser.add_argument(
+        "--compiler",
+        nargs="+",
+        default=list(COMPILERS),
+        help="C++ compilers to use when available.",
+    )
+    parser.add_argument(
+        "--include",
+        type=pathlib.Path,
+        metavar="DIR",
+        help="Directory with the font_base.h of OTOS, defaults to a stub.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Compile every unit REPEAT times and report the fastest run.",
+    )
+    parser.add_argument(
+        "--json",
+        type=pathlib.Path,
+        metavar="FILE",
+        help="Write the results to FILE as JSON.",
+    )
+    return parser
+
+
+# === Main ===
+if __name__ == "__main__":
+    main(get_parser().parse_args())
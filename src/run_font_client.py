@@ -0,0 +1,76 @@
+#!python
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     run_font_client.py
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+## Description
+Thin client for the font generator daemon.
+The arguments are forwarded to a daemon started with
+`run_font_generator.py --daemon SOCKET`, which keeps the converted
+fonts in memory. Only the standard library is imported, so that the
+client starts fast.
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Modules ===
+import json
+import os
+import socket
+import sys
+
+
+# === Functions ===
+def request(socket_path: str, argv: list, cwd: str) -> dict:
+    """Send a request to the font generator daemon.
+
+    Args:
+        socket_path (str): 1x1 [-] The path of the Unix socket of the daemon.
+        argv (list): 1xn [str] The arguments of the font generator.
+        cwd (str): 1x1 [-] The working directory for relative paths.
+
+    Returns:
+        dict: 1x1 [-] The exit `status` and the `output` of the font generator.
+
+    ---
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps({"argv": argv, "cwd": cwd}).encode("utf-8") + b"\n")
+        with client.makefile("rb") as response:
+            return json.loads(response.readline())
+
+
+# === Main ===
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
+        print("usage: run_font_client.py SOCKET [font generator arguments ...]")
+        sys.exit(0 if len(sys.argv) > 1 else 2)
+
+    _response = request(sys.argv[1], sys.argv[2:], os.getcwd())
+    print(_response["output"], end="")
+    sys.exit(_response["status"])
@@ -36,46 +36,350 @@ Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 # === Modules ===
 import pathlib
 import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import socketserver
 import FontGenerator as FG
 
 
 # === Functions ===
-def main(font_file: pathlib.Path, sizes: list, outdir: pathlib.Path):
+def main(args: argparse.Namespace, cache: FG.FontCache = None):
     """Runs the font generator.
 
+    With a cache, the converted fonts are taken from and stored in the cache.
+
+    Args:
+        args (argparse.Namespace): 1x1 [-] The parsed command line arguments:
+            - font (pathlib.Path): The font file or name to use.
+            - font_dir (list): Additional directories with font files.
+            - size (list): The font sizes in pixels.
+            - fit (tuple): Pixel box (width, height) to fit the font size in.
+            - output (pathlib.Path): The output directory.
+            - charset_source (list): Sources to scan for used characters.
+            - extra_chars (str): Characters which are always included.
+            - report (pathlib.Path): File for the flash usage report.
+            - budget (int): The flash budget of the font tables in bytes.
+            - engine (str): The conversion engine.
+            - split (bool): Write one header per font size.
+            - source (bool): Define the lookup tables in a source file.
+            - rotate (int): The clockwise rotation of the glyphs in degrees.
+            - mirror (bool): Mirror the glyphs horizontally.
+            - bpp (int): The bits per pixel of the glyphs.
+            - dense (bool): Pack the columns of every glyph as one bitstream.
+            - trim (bool): Remove the empty byte rows of every glyph.
+            - align (int): Pad the glyphs and columns to this alignment in bytes.
+            - cost (pathlib.Path): File with strings to estimate the drawing cost.
+            - strings (pathlib.Path): File with constant strings to pre-render.
+            - order (pathlib.Path): Glyph frequency profile to order the glyphs.
+            - load (pathlib.Path): Intermediate file with the converted fonts.
+            - save (pathlib.Path): Intermediate file to save the converted fonts to.
+            - section (list): The (size, name) of the linker sections of the tables.
+            - section_align (list): The (size, alignment) of the lookup tables.
+            - placement (pathlib.Path): Manifest with the placement of the tables.
+        cache (FG.FontCache, optional): 1x1 [-] Cache of converted fonts.
+
+    Raises:
+        FileNotFoundError: A charset source is not available.
+        SystemExit: The font is not available or the tables exceed the flash budget.
+
+    ---
+    """
+    # Load the converted fonts or convert the font
+    if args.load is not None:
+        print(f"Loading the converted fonts from {args.load}.")
+        try:
+            fonts = FG.Fonts.load(args.load)
+        except (OSError, ValueError) as error:
+            raise SystemExit(f"{error} :(") from error
+    else:
+        fonts = convert_fonts(args, cache)
+
+    # Save the converted fonts for later exports
+    if args.save is not None:
+        print(f"Saving the converted fonts to {args.save}.")
+        fonts.save(args.save)
+    if args.output is None:
+        print("Done. :D")
+        return
+
+    # Export the font
+    print(f"Output directory: {args.output}")
+    print("Exporting the font...")
+    placement = get_placements(args, fonts)
+    frequencies = None
+    if args.order is not None:
+        frequencies = FG.Charset.load_frequencies(args.order)
+    report = fonts.export(
+        args.output,
+        budget=args.budget,
+        split=args.split,
+        source=args.source,
+        trim=args.trim,
+        align=args.align,
+        strings=read_strings(args.strings),
+        frequencies=frequencies,
+        placement=placement,
+    )
+    print(FG.Report.format_report(report), end="")
+    if args.report is not None:
+        FG.Report.write_report(report, args.report)
+
+    # Estimate the cost of drawing the strings with the exported glyph order
+    if args.cost is not None:
+        strings = read_strings(args.cost)
+        for font in fonts.fonts:
+            charset = font.data.charset
+            if frequencies is not None:
+                charset = FG.Charset.sort_by_frequency(charset, frequencies)
+            table = FG.Layout.GlyphTable(font.data, args.trim, args.align, charset)
+            costs = FG.RenderCost.get_render_costs(table, strings)
+            print(FG.RenderCost.format_costs(table, costs), end="")
+
+    # Check the flash budget
+    if report["exceeded"]:
+        raise SystemExit(
+            f"The font tables exceed the flash budget by {report['total'] - args.budget} bytes. :("
+        )
+    print("Done. :D")
+
+
+def convert_fonts(args: argparse.Namespace, cache: FG.FontCache = None) -> FG.Fonts:
+    """Convert the font sizes given by the command line arguments.
+
     Args:
-        font (pathlib.Path): 1x1 [-] The font file to use.
-        size (int): 1x1 [px] The font size in pixels.
-        outdir (pathlib.Path): 1x1 [-] The output directory.
+        args (argparse.Namespace): 1x1 [-] The parsed command line arguments,
+            see `main`.
+        cache (FG.FontCache, optional): 1x1 [-] Cache of converted fonts.
+
+    Returns:
+        FG.Fonts: 1x1 [-] The converted fonts.
 
     Raises:
-        FileNotFoundError: The font file is not available on the system.
+        FileNotFoundError: A charset source is not available.
+        SystemExit: The font is not available.
 
     ---
     """
+    # Resolve the font name
+    args.font = FG.FontIndex.resolve_font(args.font, get_font_index(args))
+
+    # Find the largest font size fitting in the pixel box
+    if args.fit is not None:
+        try:
+            args.size = [
+                FG.BitConverter.find_fit_size(args.font, *args.fit, args.rotate)
+            ]
+        except OSError as error:
+            raise SystemExit("The font is not available on your system. :|") from error
+        except ValueError as error:
+            raise SystemExit(f"{error} :(") from error
+        print(
+            f"Largest size fitting {args.fit[0]}x{args.fit[1]} px: {args.size[0]} px."
+        )
+
     # Inform the user
-    print(f"Generating font file for {font_file} with {sizes} px.")
-    print(f"Output directory: {outdir}")
+    print(f"Generating font file for {args.font} with {args.size} px.")
+
+    # Get the used characters
+    charset = None
+    if args.charset_source:
+        charset = FG.Charset.get_charset(args.charset_source, args.extra_chars)
+        print(f"Using {len(charset)} glyphs from {len(args.charset_source)} source(s).")
 
     # Create font and check whether the font is valid
+    options = {
+        "rotation": args.rotate,
+        "mirror": args.mirror,
+        "bpp": args.bpp,
+        "dense": args.dense,
+    }
     try:
-        fonts = FG.Fonts(font_file, sizes)
-    except FileNotFoundError:
-        print("The font is not available on your system. :|")
+        if cache is None:
+            fonts = FG.Fonts(args.font, args.size, charset, **options)
+        else:
+            hits = cache.hits
+            fonts = cache.get_fonts(
+                args.font, args.size, charset, args.engine, **options
+            )
+            print(f"Using {cache.hits - hits} cached size(s).")
+    except OSError as error:
+        raise SystemExit("The font is not available on your system. :|") from error
 
     # Convert the font
-    print("Converting the font...")
-    fonts.convert()
+    if cache is None:
+        print("Converting the font...")
+        fonts.convert(args.engine)
+    return fonts
 
-    # Export the font
-    print("Exporting the font...")
-    fonts.export(outdir)
-    print("Done. :D")
 
+def get_placements(args: argparse.Namespace, fonts: FG.Fonts) -> dict:
+    """Get the placement of every font size from the manifest and the options.
 
-# === Main ===
-if __name__ == "__main__":
-    # Create argument parser
+    The options `--section` and `--section-align` take precedence over the
+    manifest.
+
+    Args:
+        args (argparse.Namespace): 1x1 [-] The parsed command line arguments,
+            see `main`.
+        fonts (FG.Fonts): 1x1 [-] The converted fonts.
+
+    Returns:
+        dict: 1xn [dict] The placement of every font size.
+
+    Raises:
+        SystemExit: The manifest is not available or not valid.
+
+    ---
+    """
+    manifest = {}
+    if args.placement is not None:
+        try:
+            manifest = FG.Placement.load_manifest(args.placement)
+        except (OSError, ValueError) as error:
+            raise SystemExit(f"{error} :(") from error
+
+    # The options are a manifest for every font
+    options = {}
+    for key, values in (("section", args.section), ("align", args.section_align)):
+        for size, value in values or []:
+            options.setdefault(size, {})[key] = value
+    options = {FG.Placement.WILDCARD: options}
+
+    return {
+        font.data.size: FG.Placement.merge(
+            FG.Placement.get_placement(manifest, font.data.name, font.data.size),
+            FG.Placement.get_placement(options, font.data.name, font.data.size),
+        )
+        for font in fonts.fonts
+    }
+
+
+def read_strings(file: pathlib.Path) -> list:
+    """Read the strings of a file, one string per line.
+
+    Args:
+        file (pathlib.Path): 1x1 [-] The file with the strings.
+
+    Returns:
+        list: 1xn [str] The strings, None when no file is given.
+
+    ---
+    """
+    if file is None:
+        return None
+    return file.read_text(encoding="utf-8").splitlines()
+
+
+def parse_box(text: str) -> tuple:
+    """Parse a pixel box given as `<width>x<height>`.
+
+    Args:
+        text (str): 1xn [-] The pixel box, e.g. `8x16`.
+
+    Returns:
+        tuple: 1x2 [px] The (width, height) of the box.
+
+    Raises:
+        argparse.ArgumentTypeError: The text is not a valid pixel box.
+
+    ---
+    """
+    try:
+        width, height = (int(value) for value in text.lower().split("x"))
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"invalid pixel box: '{text}'") from error
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"invalid pixel box: '{text}'")
+    return width, height
+
+
+def parse_section(text: str) -> tuple:
+    """Parse a linker section given as `[SIZE:]NAME`.
+
+    Args:
+        text (str): 1xn [-] The section, e.g. `8:.itcm_rodata`.
+
+    Returns:
+        tuple: 1x2 [-] The font size or `*` for all sizes and the section name.
+
+    Raises:
+        argparse.ArgumentTypeError: The text is not a valid section.
+
+    ---
+    """
+    size, section = FG.Placement.parse_option(text)
+    try:
+        FG.Placement.check_placement({"section": section})
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"invalid section: '{text}'") from error
+    return size, section
+
+
+def parse_section_align(text: str) -> tuple:
+    """Parse the alignment of a lookup table given as `[SIZE:]BYTES`.
+
+    Args:
+        text (str): 1xn [-] The alignment, e.g. `8:32`.
+
+    Returns:
+        tuple: 1x2 [-] The font size or `*` for all sizes and the alignment.
+
+    Raises:
+        argparse.ArgumentTypeError: The text is not a valid alignment.
+
+    ---
+    """
+    size, value = FG.Placement.parse_option(text)
+    try:
+        align = int(value)
+        FG.Placement.check_placement({"align": align})
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"invalid alignment: '{text}'") from error
+    return size, align
+
+
+def get_font_index(args: argparse.Namespace) -> FG.FontIndex.FontIndex:
+    """Get the index of the installed fonts and the additional font directories.
+
+    Args:
+        args (argparse.Namespace): 1x1 [-] The parsed command line arguments.
+
+    Returns:
+        FG.FontIndex.FontIndex: 1x1 [-] The font index.
+
+    ---
+    """
+    directories = FG.FontIndex.get_font_directories() + (args.font_dir or [])
+    return FG.FontIndex.FontIndex(directories=directories)
+
+
+def list_fonts(args: argparse.Namespace):
+    """Print the indexed fonts.
+
+    Args:
+        args (argparse.Namespace): 1x1 [-] The parsed command line arguments.
+
+    ---
+    """
+    index = get_font_index(args)
+    index.update()
+    for path in sorted(index.entries):
+        name = index.get_name(path)
+        if name is not None:
+            print(f"{' '.join(name):<40}{path}")
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Get the parser of the command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: 1x1 [-] The argument parser.
+
+    ---
+    """
     parser = argparse.ArgumentParser(
         description="Generate font files for the OTOS Graphics library."
     )
@@ -87,7 +391,20 @@ if __name__ == "__main__":
         "-f",
         type=pathlib.Path,
         help="Path or Name of the font file.",
-        required=True,
+    )
+    # - Font directories
+    parser.add_argument(
+        "--font-dir",
+        type=pathlib.Path,
+        nargs="+",
+        metavar="DIR",
+        help="Additional directories with font files to resolve font names.",
+    )
+    # - List fonts
+    parser.add_argument(
+        "--list-fonts",
+        action="store_true",
+        help="List the names of the indexed fonts and exit.",
     )
     # - Font size
     parser.add_argument(
@@ -96,7 +413,13 @@ if __name__ == "__main__":
         type=int,
         nargs="+",
         help="Size(s) of the font in pixels.",
-        required=True,
+    )
+    # - Fit size
+    parser.add_argument(
+        "--fit",
+        type=parse_box,
+        metavar="WxH",
+        help="Use the largest size whose glyphs fit in W x H pixels instead of --size.",
     )
     # - Output file
     parser.add_argument(
@@ -104,7 +427,172 @@ if __name__ == "__main__":
         "-o",
         type=pathlib.Path,
         help="Path to the output file.",
-        required=True,
+    )
+    # - Charset sources
+    parser.add_argument(
+        "--charset-source",
+        "-c",
+        type=pathlib.Path,
+        nargs="+",
+        metavar="PATH",
+        help="C/C++ source files or directories to scan for used characters.",
+    )
+    # - Extra characters
+    parser.add_argument(
+        "--extra-chars",
+        type=str,
+        default="",
+        metavar="CHARS",
+        help="Characters which are always included when using --charset-source.",
+    )
+    # - Report
+    parser.add_argument(
+        "--report",
+        type=pathlib.Path,
+        metavar="FILE",
+        help="Write the flash usage report to FILE (JSON when ending with .json).",
+    )
+    # - Render cost
+    parser.add_argument(
+        "--cost",
+        type=pathlib.Path,
+        metavar="FILE",
+        help="Estimate the cost of drawing the strings in FILE (one per line).",
+    )
+    # - Budget
+    parser.add_argument(
+        "--budget",
+        type=int,
+        metavar="BYTES",
+        help="Fail when the font tables exceed BYTES of flash.",
+    )
+    # - Engine
+    parser.add_argument(
+        "--engine",
+        choices=FG.BitConverter.ENGINES,
+        default="vectorized",
+        help="Engine used to convert the glyphs (default: %(default)s).",
+    )
+    # - Split headers
+    parser.add_argument(
+        "--split",
+        action="store_true",
+        help="Write one header per size and an umbrella header including them.",
+    )
+    # - Source file
+    parser.add_argument(
+        "--source",
+        action="store_true",
+        help="Define the lookup tables in <Name>.cpp and only declare them in the headers.",
+    )
+    # - Rotation
+    parser.add_argument(
+        "--rotate",
+        type=int,
+        choices=FG.BitConverter.ROTATIONS,
+        default=0,
+        help="Rotate the glyphs clockwise by the given degrees.",
+    )
+    # - Mirror
+    parser.add_argument(
+        "--mirror",
+        action="store_true",
+        help="Mirror the glyphs horizontally before rotating them.",
+    )
+    # - Bit depth
+    parser.add_argument(
+        "--bpp",
+        type=int,
+        choices=FG.BitConverter.BIT_DEPTHS,
+        default=1,
+        help="Bits per pixel, 2 and 4 export anti-aliased grayscale glyphs.",
+    )
+    # - Dense packing
+    parser.add_argument(
+        "--dense",
+        action="store_true",
+        help="Pack the columns of every glyph as one bitstream without byte padding.",
+    )
+    # - Trim
+    parser.add_argument(
+        "--trim",
+        action="store_true",
+        help="Remove the empty byte rows of every glyph and export a row table.",
+    )
+    # - Alignment
+    parser.add_argument(
+        "--align",
+        type=int,
+        choices=FG.Layout.ALIGNMENTS,
+        default=1,
+        metavar="BYTES",
+        help="Pad glyphs and columns to BYTES for word/DMA transfers (1, 2 or 4).",
+    )
+    # - Placement
+    parser.add_argument(
+        "--section",
+        type=parse_section,
+        action="append",
+        metavar="[SIZE:]NAME",
+        help="Place the tables of all sizes or of SIZE in the linker section NAME.",
+    )
+    parser.add_argument(
+        "--section-align",
+        type=parse_section_align,
+        action="append",
+        metavar="[SIZE:]BYTES",
+        help="Align the lookup table of all sizes or of SIZE to BYTES, a power of two.",
+    )
+    parser.add_argument(
+        "--placement",
+        type=pathlib.Path,
+        metavar="FILE",
+        help="Place the tables by font name and size as given in the JSON manifest "
+        "FILE, --section and --section-align take precedence.",
+    )
+    # - Pre-rendered strings
+    parser.add_argument(
+        "--strings",
+        type=pathlib.Path,
+        metavar="FILE",
+        help="Pre-render the constant strings in FILE (one per line) to bitmaps.",
+    )
+    # - Glyph order
+    parser.add_argument(
+        "--order",
+        type=pathlib.Path,
+        metavar="FILE",
+        help="Order the glyphs by their usage in FILE, a string catalog "
+        "(one per line) or a JSON histogram, the most used first.",
+    )
+    # - Intermediate files
+    parser.add_argument(
+        "--save",
+        type=pathlib.Path,
+        metavar="FILE",
+        help="Save the converted fonts to the intermediate FILE (.npz).",
+    )
+    parser.add_argument(
+        "--load",
+        type=pathlib.Path,
+        metavar="FILE",
+        help="Export the converted fonts of the intermediate FILE instead of "
+        "converting the font again.",
+    )
+    # - Daemon
+    parser.add_argument(
+        "--daemon",
+        type=pathlib.Path,
+        metavar="SOCKET",
+        help="Serve requests of run_font_client.py on the Unix socket SOCKET.",
+    )
+    # - Cache size
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=32,
+        metavar="SIZES",
+        help="Number of converted font sizes kept by the daemon (default: %(default)s).",
     )
     # - Version
     parser.add_argument(
@@ -114,8 +602,183 @@ if __name__ == "__main__":
         version=f"%(prog)s: {FG.__name__}, Version: {FG.__version__}",
     )
 
-    # Parse arguments
-    args = parser.parse_args()
+    return parser
+
+
+def parse_args(
+    parser: argparse.ArgumentParser, argv: list = None
+) -> argparse.Namespace:
+    """Parse and check the command line arguments.
+
+    Font, size or fit and output are required unless the daemon is started
+    or the fonts are listed. Font and size are not required when the
+    converted fonts are loaded and the output is not required when they
+    are saved.
+
+    Args:
+        parser (argparse.ArgumentParser): 1x1 [-] The argument parser.
+        argv (list, optional): 1xn [str] The arguments, defaults to `sys.argv`.
+
+    Returns:
+        argparse.Namespace: 1x1 [-] The parsed arguments.
+
+    ---
+    """
+    args = parser.parse_args(argv)
+    if args.size and args.fit:
+        parser.error("argument --fit: not allowed with argument --size")
+    if args.trim and args.dense:
+        parser.error("argument --trim: not allowed with argument --dense")
+    if args.load is not None:
+        # The loaded fonts are already converted, so the conversion options
+        # would be ignored silently
+        for name in (
+            "font",
+            "size",
+            "fit",
+            "charset_source",
+            "extra_chars",
+            "strings",
+            "engine",
+            "rotate",
+            "mirror",
+            "bpp",
+            "dense",
+        ):
+            if getattr(args, name) != parser.get_default(name):
+                option = name.replace("_", "-")
+                parser.error(f"argument --{option}: not allowed with argument --load")
+    if args.daemon is None and not args.list_fonts:
+        optional = set()
+        if args.fit or args.load:
+            optional.add("size")
+        if args.load:
+            optional.add("font")
+        if args.save:
+            optional.add("output")
+        missing = [
+            name
+            for name in ("font", "size", "output")
+            if name not in optional and not getattr(args, name)
+        ]
+        if missing:
+            parser.error(
+                f"the following arguments are required: --{', --'.join(missing)}"
+            )
+    return args
+
 
-    # Call main function
-    main(args.font, args.size, args.output)
+def resolve_paths(args: argparse.Namespace, cwd: pathlib.Path):
+    """Resolve the relative paths of the arguments against a working directory.
+
+    Font names which are not found relative to the working directory are
+    kept, so that they are resolved by the system.
+
+    Args:
+        args (argparse.Namespace): 1x1 [-] The parsed arguments.
+        cwd (pathlib.Path): 1x1 [-] The working directory of the client.
+
+    ---
+    """
+    if args.font is not None and (cwd / args.font).exists():
+        args.font = cwd / args.font
+    if args.output is not None:
+        args.output = cwd / args.output
+    if args.report is not None:
+        args.report = cwd / args.report
+    if args.cost is not None:
+        args.cost = cwd / args.cost
+    if args.strings is not None:
+        args.strings = cwd / args.strings
+    if args.order is not None:
+        args.order = cwd / args.order
+    if args.placement is not None:
+        args.placement = cwd / args.placement
+    if args.load is not None:
+        args.load = cwd / args.load
+    if args.save is not None:
+        args.save = cwd / args.save
+    if args.font_dir:
+        args.font_dir = [cwd / path for path in args.font_dir]
+    if args.charset_source:
+        args.charset_source = [cwd / path for path in args.charset_source]
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Handle one request of the font generator client.
+
+    The request is one JSON line with the arguments `argv` and the working
+    directory `cwd` of the client. The response is one JSON line with the
+    exit `status` and the `output` of the font generator.
+    """
+
+    def handle(self):
+        """Run the font generator for the request."""
+        output = io.StringIO()
+        status = 0
+        try:
+            request = json.loads(self.rfile.readline())
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                args = parse_args(self.server.parser, request["argv"])
+                resolve_paths(args, pathlib.Path(request["cwd"]))
+                if args.list_fonts:
+                    list_fonts(args)
+                else:
+                    main(args, self.server.cache)
+        except SystemExit as error:
+            if isinstance(error.code, str):
+                output.write(error.code + "\n")
+                status = 1
+            else:
+                status = error.code or 0
+        except Exception as error:  # pylint: disable=broad-except
+            output.write(f"{type(error).__name__}: {error}\n")
+            status = 1
+        response = {"status": status, "output": output.getvalue()}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def _terminate(signum: int, _frame):
+    """Stop the daemon when it is terminated."""
+    raise SystemExit(128 + signum)
+
+
+def serve(socket_path: pathlib.Path, cache_size: int):
+    """Serve the font generator on a Unix socket.
+
+    The requests are handled one after another, since the output of every
+    request is captured from `stdout`. The daemon stops on `SIGINT` and
+    `SIGTERM` and removes the socket.
+
+    Args:
+        socket_path (pathlib.Path): 1x1 [-] The path of the Unix socket.
+        cache_size (int): 1x1 [-] Number of converted font sizes to keep.
+
+    ---
+    """
+    socket_path = pathlib.Path(socket_path)
+    if socket_path.is_socket():
+        socket_path.unlink()
+    with socketserver.UnixStreamServer(str(socket_path), RequestHandler) as server:
+        server.parser = get_parser()
+        server.cache = FG.FontCache(cache_size)
+        print(f"Serving the font generator on {socket_path}.", flush=True)
+        signal.signal(signal.SIGTERM, _terminate)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
+# === Main ===
+if __name__ == "__main__":
+    # Parse arguments and start the daemon or call main function
+    _args = parse_args(get_parser())
+    if _args.list_fonts:
+        list_fonts(_args)
+    elif _args.daemon is not None:
+        serve(_args.daemon, _args.cache_size)
+    else:
+        main(_args)
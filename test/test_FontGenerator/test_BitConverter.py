@@ -35,6 +35,12 @@ from src.FontGenerator import BitConverter as UUT
 # ▢ Draw the character on the canvas
 # ▢ Preview the character
 # ▢ Convert the canvas to a numpy array
+# ✓ Rotate and mirror the glyphs
+# ✓ Find the largest font size fitting in a pixel box
+# ✓ Quantize and pack anti-aliased glyphs with 2 and 4 bits per pixel
+# ✓ Pre-render whole strings like glyph by glyph drawing
+# ✓ Pack the columns of glyphs as dense bitstreams
+# ✓ Convert few characters of the parallel engine in-process
 
 # === Fixtures ===
 @pytest.fixture
@@ -171,3 +177,202 @@ class Test_Font_Converter():
         # Act
         with pytest.raises(FileNotFoundError):
             Converter = UUT.FontConverter("invalid_font.ttf", 8)
+
+
+    def test_parallel_engine_converts_few_characters_in_process(
+        self, Path_Test_Font: pathlib.Path, mocker
+    ):
+        """Test if no worker processes are started for single glyphs."""
+        # Arrange
+        Converter = UUT.FontConverter(str(Path_Test_Font), 8)
+        Executor = mocker.patch("concurrent.futures.ProcessPoolExecutor")
+
+        # Act
+        chars = Converter.convert_characters([ord("A")], "parallel")
+
+        # Assert
+        Executor.assert_not_called()
+        assert chars == [Converter.convert_character(ord("A"))]
+
+
+class Test_Glyph_Transformation():
+    """Test group to test the rotation and mirroring of glyphs."""
+    def test_transform_pixels(self):
+        """Test if the pixels are mirrored and rotated clockwise."""
+        # Arrange
+        pixels = UUT.np.array([[[1, 2, 3], [4, 5, 6]]])
+        # Act
+        rotated = UUT.transform_pixels(pixels, 90, False)
+        mirrored = UUT.transform_pixels(pixels, 0, True)
+        # Assert
+        assert rotated.tolist() == [[[4, 1], [5, 2], [6, 3]]]
+        assert mirrored.tolist() == [[[3, 2, 1], [6, 5, 4]]]
+
+    def test_rotated_bitmap_size(self, Path_Test_Font: pathlib.Path):
+        """Test if width and height of the bitmaps are swapped."""
+        # Arrange
+        Converter = UUT.FontConverter(str(Path_Test_Font), 16, rotation=270)
+        # Act
+        char = Converter.convert_character(ord("A"))
+        # Assert
+        assert Converter.bitmap_width_px == 16
+        assert Converter.bitmap_height_px == 10
+        assert len(char) == 16 * 2
+
+    def test_rotated_canvas(self, Path_Test_Font: pathlib.Path):
+        """Test if the canvas is rotated clockwise."""
+        # Arrange
+        Converter = UUT.FontConverter(str(Path_Test_Font), 16, rotation=90)
+        canvas = Converter.render_character(ord("L"))
+        # Act
+        rotated = Converter.transform_canvas(canvas)
+        # Assert
+        assert rotated.size == (16, 10)
+        assert rotated.getpixel((15 - 3, 2)) == canvas.getpixel((2, 3))
+
+    def test_invalid_rotation(self, Path_Test_Font: pathlib.Path):
+        """Test correct handling of invalid rotations."""
+        # Act
+        with pytest.raises(ValueError):
+            UUT.FontConverter(str(Path_Test_Font), 16, rotation=45)
+
+
+class Test_Fit_Size():
+    """Test group to test the search of the font size fitting in a pixel box."""
+    def test_bitmap_size(self, Path_Test_Font: pathlib.Path):
+        """Test if the bitmap size matches the converter."""
+        # Arrange
+        converter = UUT.FontConverter(str(Path_Test_Font), 32, rotation=90)
+        # Act
+        size = UUT.get_bitmap_size(Path_Test_Font, 32, rotation=90)
+        # Assert
+        assert size == (converter.bitmap_width_px, converter.bitmap_height_px)
+        assert size == (32, 20)
+
+    def test_find_fit_size(self, Path_Test_Font: pathlib.Path):
+        """Test if the largest fitting font size is found."""
+        # Act
+        size = UUT.find_fit_size(Path_Test_Font, 8, 16)
+        # Assert
+        assert size == 13
+        assert UUT.get_bitmap_size(Path_Test_Font, size)[0] <= 8
+        assert UUT.get_bitmap_size(Path_Test_Font, size + 1)[0] > 8
+
+    def test_find_fit_size_rotated(self, Path_Test_Font: pathlib.Path):
+        """Test if the box of rotated glyphs is swapped."""
+        # Act
+        size = UUT.find_fit_size(Path_Test_Font, 16, 8, rotation=270)
+        # Assert
+        assert size == 13
+
+    def test_find_fit_size_height_bound(self, Path_Test_Font: pathlib.Path):
+        """Test if the height of the box limits the font size."""
+        # Act
+        size = UUT.find_fit_size(Path_Test_Font, 100, 12)
+        # Assert
+        assert size == 12
+
+    def test_no_size_fits(self, Path_Test_Font: pathlib.Path):
+        """Test if an error is raised when no font size fits."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            UUT.find_fit_size(Path_Test_Font, 0, 16)
+
+
+class Test_Grayscale():
+    """Test group to test the anti-aliased glyphs with multiple bits per pixel."""
+    def test_quantize_pixels(self):
+        """Test if the gray values are quantized like the reference."""
+        # Arrange
+        pixels = UUT.np.arange(256, dtype=UUT.np.uint8).reshape(1, 16, 16)
+        # Act
+        levels = UUT.quantize_pixels(pixels, 2)
+        # Assert
+        assert levels.tolist()[0] == [
+            [UUT.quantize_level(value, 2) for value in row] for row in pixels.tolist()[0]
+        ]
+        assert (levels.min(), levels.max()) == (0, 3)
+
+    def test_pack_pixels(self):
+        """Test if the lowest byte row comes first and the top pixel is stored in the lowest bits."""
+        # Arrange
+        pixels = UUT.np.array([[[1], [2], [3], [0], [3], [3], [3], [3]]], dtype=UUT.np.uint8)
+        # Act
+        packed = UUT.pack_pixels(pixels, 2)
+        # Assert
+        assert packed.tolist() == [[0xFF, 0x39]]
+        assert UUT.convert_pixel_sequence([1, 2, 3, 0], 2) == 0x39
+
+    def test_grayscale_glyphs(self, Path_Test_Font: pathlib.Path):
+        """Test if the glyphs are anti-aliased and the bitmaps grow with the bit depth."""
+        # Arrange
+        converter = UUT.FontConverter(str(Path_Test_Font), 16, bpp=4)
+        # Act
+        bitmap = converter.convert_characters([0x41], "vectorized")[0]
+        # Assert
+        assert len(bitmap) == converter.width_px * 16 * 4 // 8
+        assert converter.options["bpp"] == 4
+        assert {value & 0x0F for value in bitmap} - {0x00, 0x0F}
+
+    def test_invalid_bit_depth(self, Path_Test_Font: pathlib.Path):
+        """Test if an unsupported bit depth is rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            UUT.FontConverter(str(Path_Test_Font), 16, bpp=3)
+
+
+class Test_Dense:
+    """Test group to test the dense bitstream packing."""
+
+    def test_pack_bitstream(self):
+        """Test if the columns are packed without padding, top pixel first."""
+        # Arrange
+        pixels = UUT.np.array([[[1, 0], [0, 1], [1, 1]], [[0, 0], [0, 0], [0, 1]]])
+        # Act
+        packed = UUT.pack_bitstream(pixels)
+        gray = UUT.pack_bitstream(pixels[:1] * 3, 2)
+        # Assert
+        assert packed.tolist() == [[0b00110101], [0b00100000]]
+        assert gray.tolist() == [[0b00110011, 0b1111]]
+
+    @pytest.mark.parametrize("options", [{}, {"bpp": 2}, {"rotation": 90}])
+    def test_dense_glyphs(self, Path_Test_Font: pathlib.Path, options: dict):
+        """Test if all rows of a height which is not a multiple of 8 are packed."""
+        # Arrange
+        converter = UUT.FontConverter(str(Path_Test_Font), 12, dense=True, **options)
+        # Act
+        reference = converter.convert_characters([0x41, 0x67], "reference")
+        vectorized = converter.convert_characters([0x41, 0x67], "vectorized")
+        # Assert
+        bits = converter.bitmap_width_px * converter.bitmap_height_px * converter.bpp
+        assert len(reference[0]) == -(-bits // 8)
+        assert reference == vectorized
+        assert converter.options["dense"]
+
+
+class Test_Strings:
+    """Test group to test the pre-rendered strings."""
+
+    @pytest.mark.parametrize(
+        "options", [{}, {"bpp": 2}, {"rotation": 180, "mirror": True}]
+    )
+    def test_string_equals_glyphs(self, Path_Test_Font: pathlib.Path, options: dict):
+        """Test if a string bitmap equals the bitmaps of its glyphs next to each other."""
+        # Arrange
+        converter = UUT.FontConverter(str(Path_Test_Font), 16, **options)
+        glyphs = converter.convert_characters([0x41, 0x62], "reference")
+        # Act
+        size, bitmap = converter.convert_string("Ab")
+        # Assert
+        assert size == (2 * converter.width_px, 16)
+        assert bitmap == glyphs[0] + glyphs[1]
+
+    def test_rotated_string(self, Path_Test_Font: pathlib.Path):
+        """Test if a rotated string is stacked along the rotated line."""
+        # Arrange
+        converter = UUT.FontConverter(str(Path_Test_Font), 16, rotation=90)
+        # Act
+        size, bitmap = converter.convert_string("AB")
+        # Assert
+        assert size == (16, 2 * converter.width_px)
+        assert len(bitmap) == 16 * -(-2 * converter.width_px // 8)
@@ -0,0 +1,157 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     test_Charset.py
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+"""
+# === Modules ===
+import pytest, pathlib
+
+# === UUT ===
+from src.FontGenerator import Charset as UUT
+
+# === Test list ===
+# ✓ Escape sequences are decoded
+# ✓ String and character literals are found
+# ✓ Comments and includes are skipped
+# ✓ Source files are found in directories
+# ✓ Charset contains used characters, extra characters and the fallback
+# ✓ Index table maps missing codepoints to the fallback glyph
+# ✓ Glyph frequencies are counted from string catalogs and histograms
+# ✓ Glyphs are sorted by frequency, missing glyphs count for the fallback
+
+# === Fixtures ===
+@pytest.fixture
+def Source_Tree(tmp_path: pathlib.Path) -> pathlib.Path:
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "main.cpp").write_text(
+        '#include "display.h"\n'
+        "// draw(\"comment\");\n"
+        "void main() { draw(\"Hi\\n\"); draw('!'); /* \"no\" */ }\n"
+    )
+    (tmp_path / "app" / "notes.txt").write_text('"ignored"')
+    yield tmp_path
+
+# === Tests ===
+
+class Test_Literals():
+    """Test group to test the parsing of literals."""
+    def test_decode_escapes(self):
+        """Test if escape sequences are decoded."""
+        # Act
+        decoded = UUT.decode_escapes(r"a\n\x41\101\\\"")
+        # Assert
+        assert decoded == "a\nAA\\\""
+
+    def test_get_string_literals(self):
+        """Test if string and character literals are found."""
+        # Arrange
+        source = 'auto s = "Temp: %d\\xB0"; char c = \'C\'; auto r = R"x(raw")x";'
+        # Act
+        literals = UUT.get_string_literals(source)
+        # Assert
+        assert literals == ["Temp: %d\xb0", "C", 'raw"']
+
+    def test_skip_comments_and_includes(self):
+        """Test if comments and includes are skipped."""
+        # Arrange
+        source = '#include "font.h"\n// "line"\n/* "block" */ "used"'
+        # Act
+        literals = UUT.get_string_literals(source)
+        # Assert
+        assert literals == ["used"]
+
+
+class Test_Charset():
+    """Test group to test the charset computation."""
+    def test_find_source_files(self, Source_Tree: pathlib.Path):
+        """Test if only C/C++ files are found."""
+        # Act
+        files = UUT.find_source_files([Source_Tree])
+        # Assert
+        assert files == [Source_Tree / "app" / "main.cpp"]
+
+    def test_missing_source_path(self, tmp_path: pathlib.Path):
+        """Test correct handling of missing source paths."""
+        # Act
+        with pytest.raises(FileNotFoundError):
+            UUT.find_source_files([tmp_path / "missing"])
+
+    def test_get_charset(self, Source_Tree: pathlib.Path):
+        """Test if the charset contains all used characters."""
+        # Act
+        charset = UUT.get_charset([Source_Tree], extra_chars="01€")
+        # Assert
+        assert charset == sorted(map(ord, "Hi\n! 01"))
+
+    def test_get_index_table(self):
+        """Test if the index table maps missing codepoints to the fallback."""
+        # Act
+        index = UUT.get_index_table([0x20, 0x41, 0x42])
+        # Assert
+        assert len(index) == 256
+        assert index[0x41] == 1
+        assert index[0x42] == 2
+        assert index[0x43] == 0
+        assert UUT.is_complete(list(range(256)))
+        assert not UUT.is_complete([0x20, 0x41, 0x42])
+
+
+class Test_Frequencies:
+    """Test group to test the glyph frequency ordering."""
+
+    def test_get_frequencies(self):
+        """Test if the characters of the strings are counted."""
+        # Act
+        frequencies = UUT.get_frequencies(["12:30", "1.5"])
+        # Assert
+        assert frequencies == {
+            0x31: 2,
+            0x32: 1,
+            0x3A: 1,
+            0x33: 1,
+            0x30: 1,
+            0x2E: 1,
+            0x35: 1,
+        }
+
+    def test_load_frequencies(self, tmp_path: pathlib.Path):
+        """Test if string catalogs and JSON histograms are loaded."""
+        # Arrange
+        catalog = tmp_path / "strings.txt"
+        catalog.write_text("AB\nA\n", encoding="utf-8")
+        histogram = tmp_path / "histogram.json"
+        histogram.write_text('{"A": 3, "0x41": 2, "66": 1, "0": 4}', encoding="utf-8")
+        # Act & Assert
+        assert UUT.load_frequencies(catalog) == {0x41: 2, 0x42: 1}
+        assert UUT.load_frequencies(histogram) == {0x41: 5, 0x42: 1, 0x30: 4}
+
+    def test_sort_by_frequency(self):
+        """Test if the most used glyphs come first and ties keep their order."""
+        # Arrange
+        frequencies = {0x41: 1, 0x42: 5, 0x20: 1, 0x20AC: 3}
+        # Act
+        charset = UUT.sort_by_frequency([0x20, 0x30, 0x41, 0x42], frequencies)
+        # Assert
+        assert charset == [0x42, 0x20, 0x41, 0x30]
+        assert UUT.get_index_table(charset)[0x43] == 1
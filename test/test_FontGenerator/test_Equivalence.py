@@ -0,0 +1,105 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     test_Equivalence.py
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+Differential test of all conversion engines against the pure Python
+reference implementation. Run it on its own with:
+
+    pytest test/test_FontGenerator/test_Equivalence.py
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+"""
+# === Modules ===
+import pytest, pathlib
+
+# === UUT ===
+from src.FontGenerator import BitConverter as UUT
+
+# === Test list ===
+# ✓ Every engine produces byte-identical bitmaps to the reference engine
+#   for all 256 characters and a wide range of font sizes
+# ✓ The engines are equivalent for all conversion options
+
+# === Constants ===
+SIZES = list(range(4, 33)) + [36, 40, 48, 64]
+OPTIONS = [
+    {"rotation": 90},
+    {"rotation": 180},
+    {"rotation": 270, "mirror": True},
+    {"mirror": True},
+    {"bpp": 2},
+    {"bpp": 4},
+    {"rotation": 90, "mirror": True, "bpp": 4},
+    {"dense": True},
+    {"rotation": 270, "bpp": 2, "dense": True},
+]
+CASES = [(size, {}) for size in SIZES]
+CASES += [(size, options) for size in (9, 16, 21) for options in OPTIONS]
+ENGINES = [engine for engine in UUT.ENGINES if engine != "reference"]
+
+# === Fixtures ===
+@pytest.fixture(scope="module")
+def Reference() -> dict:
+    """Cache of the reference bitmaps per font size."""
+    yield {}
+
+@pytest.fixture
+def Path_Test_Font() -> pathlib.Path:
+    yield pathlib.Path("./test/Stubs/DelugiaMonoPL.ttf")
+
+# === Tests ===
+
+class Test_Engine_Equivalence():
+    """Test group to compare the engines with the reference engine."""
+    @pytest.mark.parametrize("engine", ENGINES)
+    @pytest.mark.parametrize("size, options", CASES)
+    def test_engine_matches_reference(
+        self,
+        Path_Test_Font: pathlib.Path,
+        Reference: dict,
+        size: int,
+        options: dict,
+        engine: str,
+    ):
+        """Test if the engine output is byte-identical to the reference."""
+        # Arrange
+        converter = UUT.FontConverter(str(Path_Test_Font), size, **options)
+        key = (size, tuple(sorted(options.items())))
+        if key not in Reference:
+            Reference[key] = converter.convert_characters(range(256), "reference")
+
+        # Act
+        bitmaps = converter.convert_characters(range(256), engine)
+
+        # Assert
+        assert len(bitmaps) == 256
+        for character, (expected, actual) in enumerate(zip(Reference[key], bitmaps)):
+            assert actual == expected, f"{engine} differs for {character:#04x}"
+
+    def test_unknown_engine(self, Path_Test_Font: pathlib.Path):
+        """Test correct handling of unknown engines."""
+        # Arrange
+        converter = UUT.FontConverter(str(Path_Test_Font), 8)
+        # Act
+        with pytest.raises(ValueError):
+            converter.convert_characters([0x41], "unknown")
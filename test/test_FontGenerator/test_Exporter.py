@@ -25,10 +25,11 @@
 Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 """
 # === Modules ===
-import pytest, pathlib
+import pytest, pathlib, os
 
 # === UUT ===
 from src.FontGenerator import Exporter as UUT
+from src.FontGenerator import FontData
 
 # === Test list ===
 # ▢ File formatting:
@@ -39,6 +40,19 @@ from src.FontGenerator import Exporter as UUT
 #   ▢ lookup table is written correctly
 #   ▢ Font name is written correctly
 #   ▢ Font data struct is written correctly
+#   ✓ Additional descriptor fields are written
+#   ✓ Codepoint index table is written
+#   ✓ Umbrella header is written
+#   ✓ Tables can be defined as const and declared as extern
+#   ✓ Source file preamble is written
+#   ✓ Generic tables are written with the smallest element type
+#   ✓ Tables are placed in linker sections with an alignment
+#   ✓ Pre-rendered strings get unique identifiers and descriptors
+# ▢ Incremental export:
+#   ✓ Content hash is deterministic and depends on the glyph data
+#   ✓ Content hash frames records over 255 bytes without ambiguity
+#   ✓ Unchanged files are not replaced
+#   ✓ Temporary files are removed
 
 
 # === Fixtures ===
@@ -143,6 +157,40 @@ class Test_File_Export():
         # Assert
         assert file.read_text().startswith(expected)
 
+    def test_lookup_table_end_with_fields(self, tmp_path: pathlib.Path):
+        """Test if additional descriptor fields are written."""
+        # Arrange
+        expected = "            .stride = 3,\n"
+        expected += "            .index = Index_TestFont_20px};\n"
+
+        # Act
+        file = tmp_path / "test.txt"
+        file.touch()
+        UUT.write_lookup_table_end(
+            file, "TestFont", (12, 20), 3, {"index": "Index_TestFont_20px"}
+        )
+
+        # Assert
+        assert expected in file.read_text()
+
+    def test_index_table(self, tmp_path: pathlib.Path):
+        """Test if the codepoint index table is written correctly."""
+        # Arrange
+        index = [0] * 256
+        index[0x41] = 1
+
+        # Act
+        file = tmp_path / "test.txt"
+        file.touch()
+        UUT.write_index_table(file, "TestFont", 20, index)
+
+        # Assert
+        content = file.read_text()
+        assert "constexpr unsigned char Index_TestFont_20px[] = {\n" in content
+        assert "0x00, 0x01, 0x00," in content
+        assert content.count("// 0x") == 16
+        assert content.endswith("    };\n\n")
+
     def test_finalizing_file(self, tmp_path: pathlib.Path):
         """Test if the lookup table is written correctly."""
         # Arrange
@@ -156,3 +204,229 @@ class Test_File_Export():
 
         # Assert
         assert file.read_text().startswith(expected)
+
+    def test_umbrella_header(self, tmp_path: pathlib.Path):
+        """Test if the umbrella header includes all headers."""
+        # Arrange
+        expected = "\n"
+        expected += "#ifndef TESTFONT_H_\n"
+        expected += "#define TESTFONT_H_\n"
+        expected += "\n"
+        expected += "// === Includes ===\n"
+        expected += "#include \"TestFont_8px.h\"\n"
+        expected += "#include \"TestFont_16px.h\"\n"
+        expected += "\n"
+        expected += "#endif /* TESTFONT_H_ */"
+
+        # Act
+        file = tmp_path / "test.txt"
+        file.touch()
+        UUT.write_umbrella_header(file, "TestFont", ["TestFont_8px.h", "TestFont_16px.h"])
+
+        # Assert
+        assert file.read_text() == expected
+
+    def test_lookup_table_begin_in_source(self, tmp_path: pathlib.Path):
+        """Test if the lookup table can be defined in a source file."""
+        # Act
+        file = tmp_path / "test.txt"
+        file.touch()
+        UUT.write_lookup_table_begin(file, "TestFont", (12, 20), "const")
+
+        # Assert
+        assert "    const unsigned char Lookup_TestFont_20px[] = {\n" in file.read_text()
+
+    def test_table_declaration(self, tmp_path: pathlib.Path):
+        """Test if a table is declared as extern."""
+        # Act
+        file = tmp_path / "test.txt"
+        file.touch()
+        UUT.write_table_declaration(file, "Lookup_TestFont_20px")
+
+        # Assert
+        assert file.read_text() == "    extern const unsigned char Lookup_TestFont_20px[];\n"
+
+    def test_source_preamble(self, tmp_path: pathlib.Path):
+        """Test if the source file includes the header."""
+        # Arrange
+        expected = "\n"
+        expected += "// === Includes ===\n"
+        expected += "#include \"TestFont.h\"\n"
+        expected += "\n"
+        expected += "namespace Font\n"
+        expected += "{\n"
+
+        # Act
+        file = tmp_path / "test.txt"
+        file.touch()
+        UUT.write_source_preamble(file, "TestFont.h")
+        UUT.finalize_source(file)
+
+        # Assert
+        assert file.read_text() == expected + "};\n"
+
+    def test_table_type(self):
+        """Test if the smallest element type is selected for a table."""
+        # Assert
+        assert UUT.get_table_type(0xFF) == "unsigned char"
+        assert UUT.get_table_type(0x100) == "unsigned short"
+        assert UUT.get_table_type(0x10000) == "unsigned int"
+        assert UUT.get_table_size("unsigned short") == 2
+
+    def test_table(self, tmp_path: pathlib.Path):
+        """Test if a generic table is written."""
+        # Arrange
+        expected = "    /**\n"
+        expected += "     * @brief Start of every glyph\n"
+        expected += "     */\n"
+        expected += "    constexpr unsigned short Offsets_TestFont_8px[] = {\n"
+        expected += "        0x0000, 0x0005, 0x0100,\n"
+        expected += "    };\n\n"
+
+        # Act
+        file = tmp_path / "test.txt"
+        file.touch()
+        UUT.write_table(
+            file,
+            "Offsets_TestFont_8px",
+            [0, 5, 256],
+            "unsigned short",
+            "constexpr",
+            "Start of every glyph",
+        )
+
+        # Assert
+        assert file.read_text() == expected
+
+    def test_placement_qualifier(self):
+        """Test if the alignment and section qualifiers are combined."""
+        # Assert
+        assert UUT.get_placement_qualifier() == ""
+        assert UUT.get_placement_qualifier(alignment=4) == "alignas(4) "
+        assert (
+            UUT.get_placement_qualifier(".itcm_rodata", 32)
+            == 'alignas(32) __attribute__((section(".itcm_rodata"))) '
+        )
+
+
+class Test_String_Export:
+    """Test group to test the export of pre-rendered strings."""
+
+    def test_string_identifier(self):
+        """Test if strings are converted to unique C++ identifiers."""
+        # Arrange
+        used = set()
+        # Act
+        identifiers = [
+            UUT.get_string_identifier(text, used)
+            for text in ["Hello World!", "Hello-World", "42 V", "%"]
+        ]
+        # Assert
+        assert identifiers == ["Hello_World", "Hello_World_2", "_42_V", "String"]
+        assert UUT.get_string_table_name("Font", 8, "_42_V") == "String_Font_8px__42_V"
+
+    def test_string_bitmap(self, tmp_path: pathlib.Path):
+        """Test if the bitmap of a string is written with its size."""
+        # Arrange
+        file = tmp_path / "test.txt"
+        file.touch()
+        # Act
+        UUT.write_string_bitmap(file, "String_Font_8px_Hi", "Hi */", (10, 8), [1, 2])
+        # Assert
+        content = file.read_text()
+        assert '@brief Pre-rendered string "Hi * /"\n' in content
+        assert "@details width: 10 px, height: 8 px" in content
+        assert (
+            "constexpr unsigned char String_Font_8px_Hi[] = {\n        0x01, 0x02,\n"
+            in content
+        )
+
+    def test_string_descriptors(self, tmp_path: pathlib.Path):
+        """Test if every string gets its own font descriptor."""
+        # Arrange
+        file = tmp_path / "test.txt"
+        file.touch()
+        expected = "\n    // === Pre-rendered Strings ===\n"
+        expected += "    // Font: 8px\n"
+        expected += "    namespace _8px\n"
+        expected += "    {\n"
+        expected += "        constexpr Font::Base_t Font_Hi = {\n"
+        expected += "            .data = String_Font_8px_Hi,\n"
+        expected += "            .width_px = 10,\n"
+        expected += "            .height_px = 8,\n"
+        expected += "            .stride = 1,\n"
+        expected += "            .bpp = 2};\n"
+        expected += "    };\n"
+        # Act
+        UUT.write_string_descriptors(
+            file, "Font", 8, [("Hi", "String_Font_8px_Hi", (10, 8), 1, {"bpp": 2})]
+        )
+        # Assert
+        assert file.read_text() == expected
+
+
+class Test_Incremental_Export():
+    """Test group to test the write-if-changed export."""
+    def test_content_hash(self):
+        """Test if the content hash only depends on the glyph data."""
+        # Arrange
+        font = FontData()
+        font.name = "TestFont"
+        font.data[0x41] = [1, 2, 3]
+        # Act
+        first = UUT.get_content_hash([font])
+        second = UUT.get_content_hash([font])
+        font.data[0x41] = [1, 2, 4]
+        changed = UUT.get_content_hash([font])
+        # Assert
+        assert len(first) == 64
+        assert first == second
+        assert first != changed
+
+    def test_content_hash_of_long_records(self):
+        """Test if records over 255 bytes are framed without ambiguity."""
+        # Arrange
+        glyph = [0x42, 0x00] + [7] * 254
+        font = FontData()
+        font.charset = [0x41, 0x42]
+        font.data[0x41] = glyph
+        other = FontData()
+        other.charset = [0x41, 0x42]
+        other.data[0x42] = glyph[2:] + [0x42, 0x00]
+        # Act & Assert
+        assert UUT.get_content_hash([font]) != UUT.get_content_hash([other])
+
+    def test_unchanged_file_is_not_replaced(self, tmp_path: pathlib.Path):
+        """Test if an unchanged file keeps its modification time."""
+        # Arrange
+        file = tmp_path / "test.h"
+        file.write_text("content")
+        os.utime(file, (0, 0))
+        # Act
+        with UUT.write_if_changed(file) as temp:
+            temp.write_text("content")
+        # Assert
+        assert file.stat().st_mtime == 0
+        assert [item.name for item in tmp_path.iterdir()] == ["test.h"]
+
+    def test_changed_file_is_replaced(self, tmp_path: pathlib.Path):
+        """Test if a changed file is replaced."""
+        # Arrange
+        file = tmp_path / "test.h"
+        file.write_text("old")
+        # Act
+        with UUT.write_if_changed(file) as temp:
+            temp.write_text("new")
+        # Assert
+        assert file.read_text() == "new"
+        assert [item.name for item in tmp_path.iterdir()] == ["test.h"]
+
+    def test_temporary_file_is_removed_on_error(self, tmp_path: pathlib.Path):
+        """Test if the temporary file is removed when writing fails."""
+        # Act
+        with pytest.raises(RuntimeError):
+            with UUT.write_if_changed(tmp_path / "test.h") as temp:
+                temp.write_text("partial")
+                raise RuntimeError()
+        # Assert
+        assert list(tmp_path.iterdir()) == []
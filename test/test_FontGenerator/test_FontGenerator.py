@@ -25,7 +25,7 @@
 Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 """
 # === Modules ===
-import pytest, pathlib
+import pytest, pathlib, os
 
 # === UUT ===
 from src import FontGenerator as UUT
@@ -40,6 +40,32 @@ from src import FontGenerator as UUT
 # ▢ Font Class:
 #   ▢ has a data container
 #   ▢ has a converter
+#   ✓ converts only the requested charset
+#   ✓ converts glyphs lazily on first access
+#   ✓ bulk conversion keeps the lazily converted glyphs
+#   ✓ rotated glyphs are packed with the exported stride
+# ▢ Fonts Class:
+#   ✓ exports all sizes to one header
+#   ✓ exports one header per size with an umbrella header
+#   ✓ exports the tables to a source file
+#   ✓ does not replace unchanged files
+#   ✓ exports the rotation and mirroring in the descriptor
+#   ✓ exports the bit depth in the descriptor
+#   ✓ exports the bit offsets of dense glyphs in the descriptor
+#   ✓ exports trimmed glyphs with row and offset tables
+#   ✓ exports aligned glyphs with the padded stride
+#   ✓ exports pre-rendered strings with one descriptor per string
+#   ✓ exports the bit offsets of rotated dense strings from their bitmap
+#   ✓ exports the glyphs ordered by frequency with an index table
+#   ✓ reports the reordered glyphs for their own codepoints
+#   ✓ saved and loaded fonts are exported without converting them again
+#   ✓ loaded fonts cannot pre-render strings
+#   ✓ places the tables of every size in its linker section
+#   ✓ export options are keyword-only
+# ▢ Font Cache:
+#   ✓ converted fonts are reused
+#   ✓ least recently used fonts are dropped
+#   ✓ options and charset are part of the key
 
 # === Fixtures ===
 @pytest.fixture
@@ -49,12 +75,20 @@ def FontConverter_Mock(mocker):
         "src.FontGenerator.BitConverter.FontConverter",
         __init__=mocker.DEFAULT,
         convert_character=mocker.DEFAULT,
+        convert_string=mocker.DEFAULT,
         fontname = "TestFont",
         height_px = 8,
         width_px = 5,
+        bitmap_height_px = 8,
+        bitmap_width_px = 5,
+        rotation = 0,
+        mirror = False,
+        bpp = 1,
+        dense = False,
     )
     _mock["__init__"].return_value = None
     _mock["convert_character"].return_value = [0, 1, 2, 3, 4]
+    _mock["convert_string"].return_value = ((10, 8), [0x01] * 10)
     yield _mock
 
 # === Tests ===
@@ -143,3 +177,385 @@ class Test_Font_Class():
         assert font.data.stride == 1
         assert FontConverter_Mock["convert_character"].call_count == 256
         assert font.data.data[0] == [0,1,2,3,4]
+
+    def test_convert_charset(self, FontConverter_Mock):
+        """Test the converting of a subset of the font."""
+        # Arrange
+        font_source = pathlib.Path("test/test_FontGenerator/test_font.ttf")
+        font = UUT.Font(font_source, 12, charset=[0x20, 0x41])
+        # Act
+        font.convert()
+        # Assert
+        assert font.data.charset == [0x20, 0x41]
+        assert FontConverter_Mock["convert_character"].call_count == 2
+        assert font.data.data[0x41] == [0,1,2,3,4]
+        assert font.data.data[0x42] == []
+
+
+    def test_lazy_conversion(self, FontConverter_Mock):
+        """Test if a glyph is converted on first access and memoized."""
+        # Arrange
+        font = UUT.Font(pathlib.Path("test_font.ttf"), 12)
+        # Act
+        first = font["A"]
+        second = font[0x41]
+        # Assert
+        assert first == [0, 1, 2, 3, 4]
+        assert second is first
+        assert font.data.name == "TestFont"
+        assert font.data.data[0x42] == []
+        FontConverter_Mock["convert_character"].assert_called_once_with(0x41)
+        with pytest.raises(KeyError):
+            font[256]
+
+    def test_convert_after_lazy_conversion(self, FontConverter_Mock):
+        """Test if the bulk conversion only converts the missing glyphs."""
+        # Arrange
+        font = UUT.Font(pathlib.Path("test_font.ttf"), 12, charset=[0x20, 0x41])
+        font[0x41]
+        # Act
+        font.convert()
+        # Assert
+        assert FontConverter_Mock["convert_character"].call_count == 2
+        assert font.data.data[0x20] == [0, 1, 2, 3, 4]
+
+    @pytest.mark.parametrize("engine", ["reference", "vectorized"])
+    def test_convert_rotated(self, engine: str):
+        """Test if rotated glyphs keep the pixels of the partial byte row."""
+        # Arrange
+        font_source = pathlib.Path("test/Stubs/DelugiaMonoPL.ttf")
+        font = UUT.Font(font_source, 16, charset=[0x57], rotation=90)
+        # Act
+        font.convert(engine)
+        # Assert
+        record = font.data.data[0x57]
+        assert font.converter.bitmap_height_px % 8 != 0
+        assert len(record) == font.data.width * font.data.stride
+        assert any(record[0 : len(record) : font.data.stride])
+
+
+class Test_Fonts_Class():
+    """Test group to test the export of multiple font sizes."""
+    def test_export(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if all sizes are exported to one header."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8])
+        fonts.convert()
+        # Act
+        report = fonts.export(tmp_path)
+        # Assert
+        assert [file.name for file in tmp_path.iterdir()] == ["TestFont.h"]
+        assert "namespace _8px" in (tmp_path / "TestFont.h").read_text()
+        assert report["total"] == 256 * 5
+
+    def test_export_split(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if every size is exported to its own header."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8])
+        fonts.convert()
+        # Act
+        fonts.export(tmp_path, split=True)
+        # Assert
+        assert sorted(file.name for file in tmp_path.iterdir()) == [
+            "TestFont.h", "TestFont_8px.h"
+        ]
+        umbrella = (tmp_path / "TestFont.h").read_text()
+        header = (tmp_path / "TestFont_8px.h").read_text()
+        assert '#include "TestFont_8px.h"' in umbrella
+        assert "#ifndef TESTFONT_8PX_H_" in header
+        assert "namespace _8px" in header
+
+    def test_export_source(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if the tables are defined in a source file."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8])
+        fonts.convert()
+        # Act
+        fonts.export(tmp_path, source=True)
+        # Assert
+        header = (tmp_path / "TestFont.h").read_text()
+        source = (tmp_path / "TestFont.cpp").read_text()
+        assert "extern const unsigned char Lookup_TestFont_8px[];" in header
+        assert "constexpr Font::Base_t TestFont" in header
+        assert "0x00, 0x01" not in header
+        assert '#include "TestFont.h"' in source
+        assert "const unsigned char Lookup_TestFont_8px[] = {" in source
+        assert "0x00, 0x01, 0x02, 0x03, 0x04, // 0x41: A" in source
+
+    def test_export_unchanged(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if an unchanged export keeps the file untouched."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8])
+        fonts.convert()
+        fonts.export(tmp_path)
+        file = tmp_path / "TestFont.h"
+        os.utime(file, (0, 0))
+        # Act
+        fonts.export(tmp_path)
+        # Assert
+        assert file.stat().st_mtime == 0
+        assert " * Content hash: sha256:" in file.read_text()
+
+    def test_export_rotation(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if rotated fonts keep their size in the names."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8])
+        fonts.convert()
+        fonts.fonts[0].data.width, fonts.fonts[0].data.height = 8, 5
+        fonts.fonts[0].data.rotation = 90
+        fonts.fonts[0].data.mirror = True
+        # Act
+        fonts.export(tmp_path)
+        # Assert
+        header = (tmp_path / "TestFont.h").read_text()
+        assert "Lookup_TestFont_8px[]" in header
+        assert "namespace _8px" in header
+        assert ".width_px = 8,\n            .height_px = 5," in header
+        assert ".rotation = 90,\n            .mirrored = true};" in header
+
+    def test_export_bpp(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if the bit depth is exported in the descriptor."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8])
+        fonts.convert()
+        fonts.fonts[0].data.bpp = 4
+        fonts.fonts[0].data.stride = 4
+        # Act
+        fonts.export(tmp_path)
+        # Assert
+        header = (tmp_path / "TestFont.h").read_text()
+        assert ".stride = 4,\n            .bpp = 4};" in header
+
+    def test_export_dense(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if the bits per column and bytes per glyph are exported."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8], charset=[0x41])
+        fonts.convert()
+        fonts.fonts[0].data.dense = True
+        # Act
+        fonts.export(tmp_path, align=4)
+        # Assert
+        header = (tmp_path / "TestFont.h").read_text()
+        assert "0x00, 0x01, 0x02, 0x03, 0x04, 0x00, 0x00, 0x00, // 0x41: A" in header
+        assert (
+            ".stride = 1,\n"
+            "            .index = Index_TestFont_8px,\n"
+            "            .column_bits = 8,\n"
+            "            .glyph_bytes = 8};" in header
+        )
+
+    def test_export_trim(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if the empty byte rows are removed from the exported glyphs."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8], charset=[0x20, 0x41])
+        fonts.convert()
+        fonts.fonts[0].data.data[0x20] = [0x00] * 5
+        # Act
+        report = fonts.export(tmp_path, trim=True)
+        # Assert
+        header = (tmp_path / "TestFont.h").read_text()
+        assert "constexpr unsigned char Rows_TestFont_8px[] = {\n        0x00, 0x00, 0x00, 0x01,\n" in header
+        assert "constexpr unsigned char Offsets_TestFont_8px[] = {\n        0x00, 0x00,\n" in header
+        assert ".rows = Rows_TestFont_8px,\n            .offsets = Offsets_TestFont_8px};" in header
+        assert report["fonts"][0]["bytes"] == {"glyphs": 5, "tables": 256 + 4 + 2, "strings": 0, "total": 267}
+
+
+    def test_export_align(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if the glyphs are padded and the lookup table is aligned."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8], charset=[0x41])
+        fonts.convert()
+        # Act
+        report = fonts.export(tmp_path, align=2)
+        # Assert
+        header = (tmp_path / "TestFont.h").read_text()
+        assert "alignas(2) constexpr unsigned char Lookup_TestFont_8px[] = {" in header
+        assert "0x00, 0x00, 0x01, 0x00, 0x02, 0x00, 0x03, 0x00, 0x04, 0x00, // 0x41: A" in header
+        assert ".stride = 2,\n            .index = Index_TestFont_8px};" in header
+        assert report["fonts"][0]["bytes"]["glyphs"] == 10
+
+    def test_export_strings(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if the strings are pre-rendered to their own header."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8])
+        fonts.convert()
+        # Act
+        report = fonts.export(tmp_path, strings=["Start", "", "Stop"])
+        # Assert
+        header = (tmp_path / "TestFont_Strings.h").read_text()
+        assert "#ifndef TESTFONT_STRINGS_H_" in header
+        assert "constexpr unsigned char String_TestFont_8px_Start[] = {" in header
+        assert "constexpr unsigned char String_TestFont_8px_Stop[] = {" in header
+        assert (
+            "constexpr Font::Base_t TestFont_Stop = {\n"
+            "            .data = String_TestFont_8px_Stop,\n"
+            "            .width_px = 10,\n"
+            "            .height_px = 8,\n"
+            "            .stride = 1};" in header
+        )
+        assert "Content hash" not in header
+        assert "String_" not in (tmp_path / "TestFont.h").read_text()
+        assert report["fonts"][0]["bytes"]["strings"] == 20
+
+    def test_export_rotated_dense_strings(self, tmp_path: pathlib.Path):
+        """Test if dense strings get the bit offsets of their own bitmap."""
+        # Arrange
+        font_source = pathlib.Path("test/Stubs/DelugiaMonoPL.ttf")
+        fonts = UUT.Fonts(font_source, [12], charset=[0x41], rotation=90, dense=True)
+        fonts.convert()
+        (size, bitmap), = fonts.fonts[0].convert_strings(["AB"])
+        # Act
+        fonts.export(tmp_path, strings=["AB"])
+        # Assert
+        header = (tmp_path / f"{fonts.fonts[0].data.name}_Strings.h").read_text()
+        assert size[1] != fonts.fonts[0].data.height
+        assert (
+            f"            .height_px = {size[1]},\n"
+            f"            .stride = {len(bitmap) // size[0]},\n"
+            "            .rotation = 90,\n"
+            f"            .column_bits = {size[1]},\n"
+            f"            .glyph_bytes = {len(bitmap)}}};" in header
+        )
+
+    def test_export_frequencies(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if the most used glyphs are exported first."""
+        # Arrange
+        fonts = UUT.Fonts(
+            pathlib.Path("test_font.ttf"), [8], charset=[0x20, 0x31, 0x41]
+        )
+        fonts.convert()
+        # Act
+        fonts.export(tmp_path, frequencies={0x41: 3, 0x31: 1})
+        # Assert
+        header = (tmp_path / "TestFont.h").read_text()
+        assert header.index("// 0x41: A") < header.index("// 0x31: 1")
+        assert header.index("// 0x31: 1") < header.index("// 0x20:  ")
+        assert "        0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, " in header
+        assert ".index = Index_TestFont_8px};" in header
+        assert fonts.fonts[0].data.charset == [0x20, 0x31, 0x41]
+
+    def test_export_frequencies_report(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if the report counts the reordered glyphs for their codepoints."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8], charset=[0x41, 0xC4])
+        fonts.convert()
+        fonts.fonts[0].data.data[0xC4] = [0x00] * 5
+        # Act
+        report = fonts.export(tmp_path, trim=True, frequencies={0xC4: 5})
+        # Assert
+        assert report["fonts"][0]["ranges"]["ascii"] == 5
+        assert report["fonts"][0]["ranges"]["latin-1"] == 0
+
+    def test_export_loaded_fonts(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if loaded fonts are exported like the converted fonts."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8], charset=[0x20, 0x41])
+        fonts.convert()
+        fonts.save(tmp_path / "fonts.npz")
+        (tmp_path / "converted").mkdir()
+        (tmp_path / "loaded").mkdir()
+        report = fonts.export(tmp_path / "converted", trim=True)
+        calls = FontConverter_Mock["convert_character"].call_count
+        # Act
+        loaded = UUT.Fonts.load(tmp_path / "fonts.npz")
+        loaded_report = loaded.export(tmp_path / "loaded", trim=True)
+        # Assert
+        assert FontConverter_Mock["convert_character"].call_count == calls
+        assert loaded_report == report
+        assert (tmp_path / "loaded" / "TestFont.h").read_text() == (
+            tmp_path / "converted" / "TestFont.h"
+        ).read_text()
+        assert loaded.fonts[0][0x42] == []
+
+    def test_export_loaded_fonts_with_strings(
+        self, FontConverter_Mock, tmp_path: pathlib.Path
+    ):
+        """Test if strings cannot be pre-rendered without the font file."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8], charset=[0x41])
+        fonts.convert()
+        fonts.save(tmp_path / "fonts.npz")
+        loaded = UUT.Fonts.load(tmp_path / "fonts.npz")
+        # Act & Assert
+        with pytest.raises(ValueError, match="font file is required"):
+            loaded.export(tmp_path, strings=["Start"])
+        assert not (tmp_path / "TestFont.h").exists()
+
+    def test_export_placement(self, FontConverter_Mock, tmp_path: pathlib.Path):
+        """Test if all tables of a size are placed in its section."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8], charset=[0x41])
+        fonts.convert()
+        # Act
+        fonts.export(
+            tmp_path, align=2, placement={8: {"section": ".itcm_rodata", "align": 32}}
+        )
+        # Assert
+        header = (tmp_path / "TestFont.h").read_text()
+        assert (
+            '__attribute__((section(".itcm_rodata"))) constexpr unsigned char Index_'
+            in header
+        )
+        assert (
+            'alignas(32) __attribute__((section(".itcm_rodata"))) constexpr '
+            "unsigned char Lookup_TestFont_8px[] = {" in header
+        )
+        assert ".stride = 2," in header
+        with pytest.raises(ValueError):
+            fonts.export(tmp_path, placement={8: {"align": 3}})
+
+    def test_export_options_are_keyword_only(
+        self, FontConverter_Mock, tmp_path: pathlib.Path
+    ):
+        """Test if the export options cannot be passed positionally."""
+        # Arrange
+        fonts = UUT.Fonts(pathlib.Path("test_font.ttf"), [8], charset=[0x41])
+        fonts.convert()
+        # Act & Assert
+        with pytest.raises(TypeError):
+            fonts.export(tmp_path, None, True)
+
+
+class Test_Font_Cache():
+    """Test group to test the cache of converted fonts."""
+    def test_reuse_converted_font(self, FontConverter_Mock):
+        """Test if a converted font is reused."""
+        # Arrange
+        cache = UUT.FontCache()
+        # Act
+        first = cache.get_font(pathlib.Path("test_font.ttf"), 8)
+        second = cache.get_font(pathlib.Path("test_font.ttf"), 8)
+        # Assert
+        assert first is second
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+        assert first.data.data[0x41] == [0x00, 0x01, 0x02, 0x03, 0x04]
+        FontConverter_Mock["__init__"].assert_called_once()
+
+    def test_least_recently_used_font_is_dropped(self, FontConverter_Mock):
+        """Test if the least recently used font is dropped."""
+        # Arrange
+        cache = UUT.FontCache(max_fonts=2)
+        cache.get_font(pathlib.Path("test_font.ttf"), 8)
+        cache.get_font(pathlib.Path("test_font.ttf"), 12)
+        cache.get_font(pathlib.Path("test_font.ttf"), 8)
+        # Act
+        cache.get_font(pathlib.Path("test_font.ttf"), 16)
+        cache.get_font(pathlib.Path("test_font.ttf"), 8)
+        cache.get_font(pathlib.Path("test_font.ttf"), 12)
+        # Assert
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    def test_key_contains_options(self, FontConverter_Mock):
+        """Test if the options and the charset are part of the key."""
+        # Arrange
+        cache = UUT.FontCache()
+        # Act
+        cache.get_font(pathlib.Path("test_font.ttf"), 8)
+        cache.get_font(pathlib.Path("test_font.ttf"), 8, rotation=90)
+        cache.get_font(pathlib.Path("test_font.ttf"), 8, [0x20, 0x41])
+        fonts = cache.get_fonts(pathlib.Path("test_font.ttf"), [8], [0x20, 0x41])
+        # Assert
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert isinstance(fonts, UUT.Fonts)
+        assert fonts.fonts[0].data.charset == [0x20, 0x41]
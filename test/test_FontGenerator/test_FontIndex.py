@@ -0,0 +1,120 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     test_FontIndex.py
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+"""
+# === Modules ===
+import pytest, pathlib, shutil, os
+
+# === UUT ===
+from src.FontGenerator import FontIndex as UUT
+
+# === Test list ===
+# ✓ Font names are normalized
+# ✓ Family and style name are read from the font file
+# ✓ Fonts are found by family, family and style and file name
+# ✓ Index is persisted and reused without reading the font files
+# ✓ Changed and removed font files are updated incrementally
+# ✓ Existing paths and unknown names are not resolved
+
+# === Fixtures ===
+@pytest.fixture
+def Font_Dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    (tmp_path / "fonts").mkdir()
+    shutil.copy("test/Stubs/DelugiaMonoPL.ttf", tmp_path / "fonts" / "DelugiaMonoPL.ttf")
+    (tmp_path / "fonts" / "broken.ttf").write_bytes(b"no font")
+    (tmp_path / "fonts" / "readme.txt").write_text("no font")
+    yield tmp_path / "fonts"
+
+@pytest.fixture
+def Index(Font_Dir: pathlib.Path) -> UUT.FontIndex:
+    index = UUT.FontIndex(Font_Dir.parent / "cache" / "index.json", [Font_Dir])
+    index.update()
+    yield index
+
+# === Tests ===
+
+class Test_Names():
+    """Test group to test the font names."""
+    def test_normalize_name(self):
+        """Test if case and separators are ignored."""
+        # Assert
+        assert UUT.normalize_name("Delugia PL-Mono_Bold") == "delugiaplmonobold"
+
+    def test_read_font_name(self, Font_Dir: pathlib.Path):
+        """Test if the family and style name are read from the font file."""
+        # Assert
+        assert UUT.read_font_name(Font_Dir / "DelugiaMonoPL.ttf") == ("Delugia PL Mono", "Regular")
+        assert UUT.read_font_name(Font_Dir / "broken.ttf") is None
+
+
+class Test_Font_Index():
+    """Test group to test the font index."""
+    def test_find_font(self, Index: UUT.FontIndex, Font_Dir: pathlib.Path):
+        """Test if fonts are found by family, family and style and file name."""
+        # Arrange
+        expected = (Font_Dir / "DelugiaMonoPL.ttf").resolve()
+        # Assert
+        assert len(Index.entries) == 2
+        assert Index.find("Delugia PL Mono") == expected
+        assert Index.find("delugia-pl-mono regular") == expected
+        assert Index.find("DelugiaMonoPL") == expected
+        assert Index.find("Delugia PL Mono Bold") is None
+        assert Index.get_name(Font_Dir / "DelugiaMonoPL.ttf") == ("Delugia PL Mono", "Regular")
+        assert Index.get_name(Font_Dir / "broken.ttf") is None
+
+    def test_index_is_persisted(self, Index: UUT.FontIndex, Font_Dir: pathlib.Path, mocker):
+        """Test if the persisted index is used without reading the font files."""
+        # Arrange
+        read = mocker.patch("src.FontGenerator.FontIndex.read_font_name")
+        # Act
+        index = UUT.FontIndex(Index.cache_file, [Font_Dir])
+        changed = index.update()
+        # Assert
+        assert index.entries == Index.entries
+        assert index.find("Delugia PL Mono") is not None
+        assert not changed
+        read.assert_not_called()
+
+    def test_incremental_update(self, Index: UUT.FontIndex, Font_Dir: pathlib.Path, mocker):
+        """Test if only changed font files are read again and removed files are dropped."""
+        # Arrange
+        read = mocker.patch(
+            "src.FontGenerator.FontIndex.read_font_name", return_value=("Other", "Bold")
+        )
+        os.utime(Font_Dir / "DelugiaMonoPL.ttf", ns=(0, 0))
+        (Font_Dir / "broken.ttf").unlink()
+        # Act
+        found = Index.find("Other Bold")
+        # Assert
+        assert found == (Font_Dir / "DelugiaMonoPL.ttf").resolve()
+        assert len(Index.entries) == 1
+        read.assert_called_once()
+
+    def test_resolve_font(self, Index: UUT.FontIndex, Font_Dir: pathlib.Path):
+        """Test if names are resolved while paths and unknown names are kept."""
+        # Assert
+        assert UUT.resolve_font("Delugia PL Mono", Index) == (Font_Dir / "DelugiaMonoPL.ttf").resolve()
+        assert UUT.resolve_font(Font_Dir / "broken.ttf", Index) == Font_Dir / "broken.ttf"
+        assert UUT.resolve_font("Unknown Font", Index) == pathlib.Path("Unknown Font")
@@ -0,0 +1,167 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     test_GlyphFile.py
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+"""
+# === Modules ===
+import pytest, pathlib, json, zipfile
+import numpy as np
+
+# === UUT ===
+from src.FontGenerator import GlyphFile as UUT
+from src.FontGenerator import FontData
+
+# === Test list ===
+# ✓ Font sizes are saved with their metadata and glyph arrays
+# ✓ Saved files are readable by NumPy and memory mapped on load
+# ✓ Loaded glyphs equal the saved glyphs, missing glyphs are empty
+# ✓ Unchanged files are not replaced
+# ✓ Unsupported versions and other files are rejected
+
+
+# === Fixtures ===
+@pytest.fixture
+def Font_Data() -> FontData:
+    data = FontData()
+    data.name = "TestFont"
+    data.size = 12
+    data.width = 2
+    data.height = 12
+    data.stride = 2
+    data.bpp = 2
+    data.dense = True
+    data.charset = [0x20, 0x41, 0xC4]
+    data.data[0x20] = [0, 0, 0]
+    data.data[0x41] = [1, 2, 3]
+    data.data[0xC4] = [255, 0, 7]
+    yield data
+
+
+# === Tests ===
+
+
+class Test_Save:
+    """Test group to test saving the intermediate file."""
+
+    def test_get_arrays(self, Font_Data: FontData):
+        """Test if the glyphs are stored back-to-back with their offsets."""
+        # Act
+        metadata, (charset, offsets, glyphs) = UUT.get_arrays(Font_Data)
+        # Assert
+        assert metadata == {
+            "name": "TestFont",
+            "size": 12,
+            "width": 2,
+            "height": 12,
+            "stride": 2,
+            "rotation": 0,
+            "mirror": False,
+            "bpp": 2,
+            "layout": "dense",
+        }
+        assert charset.tolist() == [0x20, 0x41, 0xC4]
+        assert offsets.tolist() == [0, 3, 6, 9]
+        assert glyphs.dtype == np.uint8
+        assert glyphs.tolist() == [0, 0, 0, 1, 2, 3, 255, 0, 7]
+
+    def test_save_npz(self, Font_Data: FontData, tmp_path: pathlib.Path):
+        """Test if the file is an uncompressed archive which NumPy can read."""
+        # Act
+        UUT.save(tmp_path / "font.npz", [Font_Data, Font_Data])
+        # Assert
+        with np.load(tmp_path / "font.npz") as archive:
+            metadata = json.loads(archive["metadata"].tobytes())
+            assert archive["glyphs_1"].tolist() == [0, 0, 0, 1, 2, 3, 255, 0, 7]
+        assert metadata["version"] == UUT.FORMAT_VERSION
+        assert len(metadata["fonts"]) == 2
+        with zipfile.ZipFile(tmp_path / "font.npz") as archive:
+            assert {info.compress_type for info in archive.infolist()} == {
+                zipfile.ZIP_STORED
+            }
+
+    def test_unchanged_file_is_not_replaced(
+        self, Font_Data: FontData, tmp_path: pathlib.Path
+    ):
+        """Test if saving the same glyphs again keeps the file."""
+        # Arrange
+        file = tmp_path / "font.npz"
+        UUT.save(file, [Font_Data])
+        mtime = file.stat().st_mtime_ns
+        # Act
+        UUT.save(file, [Font_Data])
+        # Assert
+        assert file.stat().st_mtime_ns == mtime
+
+
+class Test_Load:
+    """Test group to test loading the intermediate file."""
+
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_load(self, Font_Data: FontData, tmp_path: pathlib.Path, mmap: bool):
+        """Test if the loaded glyphs equal the saved glyphs."""
+        # Arrange
+        UUT.save(tmp_path / "font.npz", [Font_Data])
+        # Act
+        ((metadata, glyphs),) = UUT.load(tmp_path / "font.npz", mmap)
+        # Assert
+        assert metadata["layout"] == "dense"
+        assert glyphs.charset == [0x20, 0x41, 0xC4]
+        assert len(glyphs) == 256
+        assert glyphs[0x41] == [1, 2, 3]
+        assert glyphs[0xC4] == [255, 0, 7]
+        assert glyphs[0x42] == []
+        with pytest.raises(IndexError):
+            glyphs[256]
+
+    def test_map_arrays(self, Font_Data: FontData, tmp_path: pathlib.Path):
+        """Test if the arrays are memory mapped and equal the arrays of NumPy."""
+        # Arrange
+        Font_Data.charset = []
+        UUT.save(tmp_path / "font.npz", [Font_Data])
+        # Act
+        arrays = UUT.map_arrays(tmp_path / "font.npz")
+        # Assert
+        assert isinstance(arrays["offsets_0"], np.memmap)
+        with np.load(tmp_path / "font.npz") as archive:
+            for key in archive.files:
+                assert np.array_equal(arrays[key], archive[key])
+
+    def test_unsupported_version(self, Font_Data: FontData, tmp_path: pathlib.Path):
+        """Test if files of other versions are rejected."""
+        # Arrange
+        metadata = json.dumps({"version": UUT.FORMAT_VERSION + 1, "fonts": []})
+        np.savez(
+            tmp_path / "font.npz", metadata=np.frombuffer(metadata.encode(), np.uint8)
+        )
+        # Act & Assert
+        with pytest.raises(ValueError, match="format version"):
+            UUT.load(tmp_path / "font.npz")
+
+    def test_no_glyph_file(self, tmp_path: pathlib.Path):
+        """Test if other files are rejected."""
+        # Arrange
+        (tmp_path / "font.npz").write_text("no archive")
+        # Act & Assert
+        with pytest.raises(ValueError, match="not an intermediate glyph file"):
+            UUT.load(tmp_path / "font.npz")
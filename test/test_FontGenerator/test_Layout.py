@@ -0,0 +1,193 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     test_Layout.py
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+"""
+# === Modules ===
+import pytest
+
+# === UUT ===
+from src.FontGenerator import Layout as UUT
+from src.FontGenerator import FontData
+
+# === Test list ===
+# ✓ Empty byte rows are removed from every column
+# ✓ Blank glyphs have no rows
+# ✓ Offsets point to the start of every record
+# ✓ Glyph table contains the records in charset order
+# ✓ Glyph table contains the records in a given export order
+# ✓ Glyph table stores the rows and offsets of trimmed glyphs
+# ✓ Columns and records are padded to the alignment
+# ✓ Glyph table pads the stride of untrimmed and the records of trimmed glyphs
+# ✓ Dense glyphs are only padded at the end and cannot be trimmed
+
+# === Fixtures ===
+@pytest.fixture
+def Font_Data() -> FontData:
+    data = FontData()
+    data.name = "TestFont"
+    data.size = 24
+    data.width = 2
+    data.height = 24
+    data.stride = 3
+    data.charset = [0x20, 0x41, 0x42]
+    data.data[0x20] = [0x00] * 6
+    data.data[0x41] = [0x00, 0x01, 0x00, 0x00, 0x02, 0x00]
+    data.data[0x42] = [0x03, 0x00, 0x04, 0x05, 0x00, 0x00]
+    yield data
+
+# === Tests ===
+
+class Test_Trimming():
+    """Test group to test the trimming of glyph records."""
+    def test_trim_rows(self):
+        """Test if the empty byte rows are removed from every column."""
+        # Act
+        first, count, trimmed = UUT.trim_rows([0x00, 0x01, 0x00, 0x00, 0x03, 0x00], 2)
+
+        # Assert
+        assert (first, count) == (1, 1)
+        assert trimmed == [0x01, 0x03]
+
+    def test_trim_rows_keeps_inner_rows(self):
+        """Test if empty rows between used rows are kept."""
+        # Act
+        first, count, trimmed = UUT.trim_rows([0x01, 0x00, 0x02, 0x00, 0x00, 0x00], 2)
+
+        # Assert
+        assert (first, count) == (0, 3)
+        assert trimmed == [0x01, 0x00, 0x02, 0x00, 0x00, 0x00]
+
+    def test_trim_blank_glyph(self):
+        """Test if blank glyphs have no rows."""
+        # Act
+        first, count, trimmed = UUT.trim_rows([0x00] * 6, 2)
+
+        # Assert
+        assert (first, count, trimmed) == (0, 0, [])
+
+    def test_offsets(self):
+        """Test if the offsets point to the start of every record."""
+        # Act
+        offsets = UUT.get_offsets([[1, 2], [], [3, 4, 5], [6]])
+
+        # Assert
+        assert offsets == [0, 2, 2, 5]
+
+    def test_pad_columns(self):
+        """Test if every column is padded to the stride."""
+        # Act
+        padded = UUT.pad_columns([0x01, 0x02, 0x03, 0x04], 2, 4)
+
+        # Assert
+        assert padded == [0x01, 0x02, 0x00, 0x00, 0x03, 0x04, 0x00, 0x00]
+
+    def test_pad_record(self):
+        """Test if the record is padded to a multiple of the alignment."""
+        # Assert
+        assert UUT.pad_record([0x01, 0x02, 0x03], 4) == [0x01, 0x02, 0x03, 0x00]
+        assert UUT.pad_record([0x01, 0x02], 2) == [0x01, 0x02]
+        assert UUT.pad_record([], 4) == []
+
+
+class Test_Glyph_Table():
+    """Test group to test the glyph table."""
+    def test_records_in_charset_order(self, Font_Data: FontData):
+        """Test if the glyph table contains the records in charset order."""
+        # Act
+        table = UUT.GlyphTable(Font_Data)
+
+        # Assert
+        assert table.charset == [0x20, 0x41, 0x42]
+        assert table.records == [Font_Data.data[0x20], Font_Data.data[0x41], Font_Data.data[0x42]]
+        assert table.rows is None
+        assert table.offsets is None
+
+    def test_records_in_export_order(self, Font_Data: FontData):
+        """Test if the glyph table contains the records in the given order."""
+        # Act
+        table = UUT.GlyphTable(Font_Data, trim=True, charset=[0x42, 0x20, 0x41])
+
+        # Assert
+        assert table.charset == [0x42, 0x20, 0x41]
+        assert table.records == [[0x03, 0x00, 0x04, 0x05, 0x00, 0x00], [], [0x01, 0x02]]
+        assert table.offsets == [0, 6, 6]
+        assert Font_Data.charset == [0x20, 0x41, 0x42]
+
+    def test_trimmed_records(self, Font_Data: FontData):
+        """Test if the glyph table stores the rows and offsets of trimmed glyphs."""
+        # Act
+        table = UUT.GlyphTable(Font_Data, trim=True)
+
+        # Assert
+        assert table.records == [[], [0x01, 0x02], [0x03, 0x00, 0x04, 0x05, 0x00, 0x00]]
+        assert table.rows == [0, 0, 1, 1, 0, 3]
+        assert table.offsets == [0, 0, 2]
+        assert Font_Data.data[0x41] == [0x00, 0x01, 0x00, 0x00, 0x02, 0x00]
+
+    def test_aligned_records(self, Font_Data: FontData):
+        """Test if the stride and the columns of the glyphs are padded."""
+        # Act
+        table = UUT.GlyphTable(Font_Data, alignment=4)
+
+        # Assert
+        assert table.stride == 4
+        assert table.alignment == 4
+        assert table.records[1] == [0x00, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00]
+        assert Font_Data.stride == 3
+
+    def test_aligned_trimmed_records(self, Font_Data: FontData):
+        """Test if trimmed glyphs start at a multiple of the alignment."""
+        # Act
+        table = UUT.GlyphTable(Font_Data, trim=True, alignment=4)
+
+        # Assert
+        assert table.stride == 3
+        assert table.records[1] == [0x01, 0x02, 0x00, 0x00]
+        assert table.offsets == [0, 0, 4]
+
+    def test_invalid_alignment(self, Font_Data: FontData):
+        """Test if an invalid alignment is rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            UUT.GlyphTable(Font_Data, alignment=3)
+
+    def test_aligned_dense_records(self, Font_Data: FontData):
+        """Test if dense glyphs are only padded at the end of every glyph."""
+        # Arrange
+        Font_Data.dense = True
+        # Act
+        table = UUT.GlyphTable(Font_Data, alignment=4)
+
+        # Assert
+        assert table.stride == 3
+        assert table.records[1] == [0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00]
+
+    def test_trim_dense_records(self, Font_Data: FontData):
+        """Test if dense glyphs cannot be trimmed."""
+        # Arrange
+        Font_Data.dense = True
+        # Act & Assert
+        with pytest.raises(ValueError):
+            UUT.GlyphTable(Font_Data, trim=True)
@@ -0,0 +1,133 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     test_Placement.py
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+"""
+# === Modules ===
+import pytest, pathlib, json
+
+# === UUT ===
+from src.FontGenerator import Placement as UUT
+
+# === Test list ===
+# ✓ Placements are completed with the defaults
+# ✓ Invalid sections, alignments and keys are rejected
+# ✓ Options are parsed with an optional size
+# ✓ Manifests are loaded with integer sizes
+# ✓ Font names and sizes take precedence over wildcards
+
+
+# === Tests ===
+
+
+class Test_Placement:
+    """Test group to test the placement of one font size."""
+
+    def test_check_placement(self):
+        """Test if the missing keys get their defaults."""
+        # Assert
+        assert UUT.check_placement({}) == {"section": None, "align": 1}
+        assert UUT.check_placement({"section": ".font$fast", "align": 32}) == {
+            "section": ".font$fast",
+            "align": 32,
+        }
+
+    @pytest.mark.parametrize(
+        "placement",
+        [
+            {"section": 'fast") int x; ("'},
+            {"section": ""},
+            {"align": 0},
+            {"align": 12},
+            {"align": "4"},
+            {"region": "itcm"},
+        ],
+    )
+    def test_invalid_placement(self, placement: dict):
+        """Test if invalid placements are rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            UUT.check_placement(placement)
+
+    def test_parse_option(self):
+        """Test if the size prefix of an option is optional."""
+        # Assert
+        assert UUT.parse_option(".itcm_rodata") == ("*", ".itcm_rodata")
+        assert UUT.parse_option("8:.itcm_rodata") == (8, ".itcm_rodata")
+        assert UUT.parse_option("12:32") == (12, "32")
+
+
+class Test_Manifest:
+    """Test group to test the placement manifest."""
+
+    def test_load_manifest(self, tmp_path: pathlib.Path):
+        """Test if the sizes of the manifest are converted to integers."""
+        # Arrange
+        file = tmp_path / "placement.json"
+        file.write_text(
+            json.dumps(
+                {
+                    "*": {"*": {"section": ".font_flash"}},
+                    "TestFont": {"8": {"section": ".itcm_rodata", "align": 32}},
+                }
+            )
+        )
+        # Act
+        manifest = UUT.load_manifest(file)
+        # Assert
+        assert manifest == {
+            "*": {"*": {"section": ".font_flash"}},
+            "TestFont": {8: {"section": ".itcm_rodata", "align": 32}},
+        }
+
+    def test_invalid_manifest(self, tmp_path: pathlib.Path):
+        """Test if manifests with invalid placements are rejected."""
+        # Arrange
+        file = tmp_path / "placement.json"
+        file.write_text(json.dumps({"TestFont": {"8": {"align": 3}}}))
+        # Act & Assert
+        with pytest.raises(ValueError):
+            UUT.load_manifest(file)
+
+    def test_get_placement(self):
+        """Test if specific entries take precedence over wildcards."""
+        # Arrange
+        manifest = {
+            "*": {"*": {"section": ".font_flash", "align": 4}, 12: {"align": 16}},
+            "TestFont": {8: {"section": ".itcm_rodata"}},
+        }
+        # Act & Assert
+        assert UUT.get_placement(manifest, "TestFont", 8) == {
+            "section": ".itcm_rodata",
+            "align": 4,
+        }
+        assert UUT.get_placement(manifest, "TestFont", 12) == {
+            "section": ".font_flash",
+            "align": 16,
+        }
+        assert UUT.get_placement({}, "TestFont", 8) == {}
+        assert UUT.merge({"section": ".a", "align": 4}, {"section": None}) == {
+            "section": ".a",
+            "align": 4,
+        }
@@ -0,0 +1,115 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     test_RenderCost.py
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+"""
+# === Modules ===
+import pytest
+
+# === UUT ===
+from src.FontGenerator import RenderCost as UUT
+from src.FontGenerator import FontData, Layout
+
+# === Test list ===
+# ✓ Strings are encoded to 8-bit codepoints
+# ✓ Glyph costs of complete fonts
+# ✓ Missing codepoints cost as much as the fallback glyph
+# ✓ Trimmed glyphs read the rows and offsets and write only their rows
+# ✓ Costs are summed per string
+
+# === Fixtures ===
+@pytest.fixture
+def Font_Data() -> FontData:
+    data = FontData()
+    data.name = "TestFont"
+    data.size = 16
+    data.width = 2
+    data.height = 16
+    data.stride = 2
+    data.data = [[0x00] * 4 for _ in range(256)]
+    data.data[0x41] = [0x00, 0x01, 0x00, 0x02]
+    yield data
+
+# === Tests ===
+
+class Test_Encoding():
+    """Test group to test the encoding of strings."""
+    def test_encode_strings(self):
+        """Test if the strings are encoded and characters above 0xFF are replaced."""
+        # Act
+        codes, ids = UUT.encode_strings(["AB", "", "\u00c4\u20ac"])
+
+        # Assert
+        assert codes.tolist() == [0x41, 0x42, 0xC4, 0x20]
+        assert ids.tolist() == [0, 0, 2, 2]
+
+
+class Test_Glyph_Costs():
+    """Test group to test the cost of the glyphs."""
+    def test_complete_font(self, Font_Data: FontData):
+        """Test if every glyph reads its record and writes all columns."""
+        # Act
+        costs = UUT.get_glyph_costs(Layout.GlyphTable(Font_Data))
+
+        # Assert
+        assert costs["lookups"][0x41] == 1
+        assert costs["bytes_read"][0x41] == 4
+        assert costs["bytes_written"][0x41] == 4
+
+    def test_missing_codepoints(self, Font_Data: FontData):
+        """Test if missing codepoints cost as much as the fallback glyph."""
+        # Arrange
+        Font_Data.charset = [0x20, 0x41]
+        Font_Data.data[0x20] = [0x00] * 2
+        # Act
+        costs = UUT.get_glyph_costs(Layout.GlyphTable(Font_Data))
+
+        # Assert
+        assert costs["lookups"][0x42] == 2
+        assert costs["bytes_read"][0x42] == 2 + 1
+        assert costs["bytes_read"][0x41] == 4 + 1
+
+    def test_trimmed_glyphs(self, Font_Data: FontData):
+        """Test if trimmed glyphs read their rows and offset and write only their rows."""
+        # Act
+        costs = UUT.get_glyph_costs(Layout.GlyphTable(Font_Data, trim=True))
+
+        # Assert
+        assert costs["lookups"][0x41] == 3
+        assert costs["bytes_read"][0x41] == 2 + 2 + 1
+        assert costs["bytes_written"][0x41] == 2
+        assert costs["bytes_written"][0x20] == 0
+
+
+class Test_Render_Costs():
+    """Test group to test the cost of the strings."""
+    def test_costs_per_string(self, Font_Data: FontData):
+        """Test if the costs are summed per string."""
+        # Act
+        costs = UUT.get_render_costs(Layout.GlyphTable(Font_Data), ["AA", "", "A "])
+
+        # Assert
+        assert costs["glyphs"].tolist() == [2, 0, 2]
+        assert costs["bytes_read"].tolist() == [8, 0, 8]
+        assert "3 strings, glyphs: 4" in UUT.format_costs(Layout.GlyphTable(Font_Data), costs)
@@ -0,0 +1,132 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     test_Report.py
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+"""
+# === Modules ===
+import pytest, pathlib, json
+
+# === UUT ===
+from src.FontGenerator import Report as UUT
+from src.FontGenerator import FontData
+
+# === Test list ===
+# ✓ Codepoints are assigned to glyph ranges
+# ✓ Bytes per glyph range are counted
+# ✓ Records in export order are counted for their own codepoints
+# ✓ Blank glyphs, empty columns and stride rounding are counted
+# ✓ Dense glyphs only waste the bits at the end of every glyph
+# ✓ Budget is checked
+# ✓ Report is written as text and JSON
+
+# === Fixtures ===
+@pytest.fixture
+def Font_Data() -> FontData:
+    data = FontData()
+    data.name = "TestFont"
+    data.size = 12
+    data.height = 12
+    data.width = 2
+    data.stride = 2
+    data.charset = [0x20, 0x41, 0xC4]
+    data.data[0x20] = [0, 0, 0, 0]
+    data.data[0x41] = [1, 2, 0, 0]
+    data.data[0xC4] = [1, 0, 0, 3]
+    yield data
+
+# === Tests ===
+
+class Test_Font_Report():
+    """Test group to test the report of one font size."""
+    def test_get_range_name(self):
+        """Test if codepoints are assigned to the glyph ranges."""
+        # Assert
+        assert UUT.get_range_name(0x00) == "control"
+        assert UUT.get_range_name(0x41) == "ascii"
+        assert UUT.get_range_name(0x80) == "extended"
+        assert UUT.get_range_name(0xFF) == "latin-1"
+        with pytest.raises(ValueError):
+            UUT.get_range_name(0x100)
+
+    def test_get_font_report(self, Font_Data: FontData):
+        """Test if the flash usage is counted correctly."""
+        # Act
+        report = UUT.get_font_report(Font_Data, table_bytes=256)
+        # Assert
+        assert report["glyphs"] == 3
+        assert report["bytes"] == {"glyphs": 12, "tables": 256, "strings": 0, "total": 268}
+        assert report["ranges"] == {
+            "control": 0, "ascii": 8, "extended": 0, "latin-1": 4
+        }
+        assert report["waste"]["blank_glyphs"] == 4
+        assert report["waste"]["empty_columns"] == 2
+        assert report["waste"]["stride_rounding"] == 2
+
+    def test_font_report_in_export_order(self, Font_Data: FontData):
+        """Test if reordered records are counted for their own codepoints."""
+        # Arrange
+        charset = [0xC4, 0x20, 0x41]
+        records = [[1, 0, 0, 3, 5, 6], [], [1, 2]]
+        # Act
+        report = UUT.get_font_report(Font_Data, records, charset=charset)
+        # Assert
+        assert report["ranges"] == {
+            "control": 0, "ascii": 2, "extended": 0, "latin-1": 6
+        }
+
+    def test_dense_font_report(self, Font_Data: FontData):
+        """Test if only the padding at the end of dense glyphs is wasted."""
+        # Arrange
+        Font_Data.height = 15
+        Font_Data.dense = True
+        # Act
+        report = UUT.get_font_report(Font_Data)
+        # Assert
+        assert report["waste"]["empty_columns"] == 0
+        assert report["waste"]["stride_rounding"] == 2 * (32 - 2 * 15) // 8
+
+
+class Test_Report():
+    """Test group to test the combined report."""
+    def test_budget(self, Font_Data: FontData):
+        """Test if the budget is checked."""
+        # Arrange
+        font_report = UUT.get_font_report(Font_Data)
+        # Act
+        within = UUT.get_report([font_report], budget=12)
+        exceeded = UUT.get_report([font_report, font_report], budget=12)
+        # Assert
+        assert within["total"] == 12 and not within["exceeded"]
+        assert exceeded["total"] == 24 and exceeded["exceeded"]
+
+    def test_write_report(self, Font_Data: FontData, tmp_path: pathlib.Path):
+        """Test if the report is written as text and JSON."""
+        # Arrange
+        report = UUT.get_report([UUT.get_font_report(Font_Data)])
+        # Act
+        UUT.write_report(report, tmp_path / "report.json")
+        UUT.write_report(report, tmp_path / "report.txt")
+        # Assert
+        assert json.loads((tmp_path / "report.json").read_text()) == report
+        assert "Total: 12 bytes" in (tmp_path / "report.txt").read_text()
@@ -0,0 +1,233 @@
+# OTOS - Open Tec Operating System
+# Copyright (c) 2022 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+### Details
+- *File:*     test_run_font_generator.py
+- *Details:*  Python 3.9
+- *Date:*     2026-10-19
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+"""
+# === Modules ===
+import pytest, pathlib, json, io, shutil, signal, subprocess, sys, types
+
+# The scripts import the font generator from their own directory
+SRC = pathlib.Path(__file__).parents[2] / "src"
+sys.path.insert(0, str(SRC))
+
+# === UUT ===
+import run_font_generator as UUT
+import run_font_client as Client
+
+# === Test list ===
+# ✓ Required arguments depend on the daemon, --fit, --load and --save
+# ✓ Conversion options are rejected for loaded fonts
+# ✓ Relative paths are resolved against the working directory of the client
+# ✓ Requests are answered with one JSON line:
+#   ✓ with the output and status 0 on success
+#   ✓ with status 1 and the message of SystemExit(str)
+#   ✓ with the status of parser errors
+#   ✓ with status 1 and the name of unexpected exceptions
+# ✓ The client gets the response of the daemon on a Unix socket
+# ✓ The drawing cost is estimated with the exported glyph order
+
+
+# === Fixtures ===
+@pytest.fixture
+def Parser():
+    yield UUT.get_parser()
+
+
+@pytest.fixture
+def Font_File(tmp_path: pathlib.Path) -> pathlib.Path:
+    shutil.copy("test/Stubs/DelugiaMonoPL.ttf", tmp_path / "DelugiaMonoPL.ttf")
+    (tmp_path / "out").mkdir()
+    yield tmp_path / "DelugiaMonoPL.ttf"
+
+
+def handle(parser, cache, request: bytes) -> dict:
+    """Handle one in-memory request and return the decoded response."""
+    handler = UUT.RequestHandler.__new__(UUT.RequestHandler)
+    handler.server = types.SimpleNamespace(parser=parser, cache=cache)
+    handler.rfile = io.BytesIO(request)
+    handler.wfile = io.BytesIO()
+    handler.handle()
+    lines = handler.wfile.getvalue().splitlines()
+    assert len(lines) == 1
+    return json.loads(lines[0])
+
+
+# === Tests ===
+
+
+class Test_Arguments:
+    """Test group to test parsing and resolving the arguments."""
+
+    def test_required_arguments(self, Parser):
+        """Test if font, size and output are only required when needed."""
+        # Act & Assert
+        with pytest.raises(SystemExit):
+            UUT.parse_args(Parser, ["-f", "font.ttf", "-s", "8"])
+        with pytest.raises(SystemExit):
+            UUT.parse_args(Parser, ["-f", "font.ttf", "-s", "8", "--fit", "8x8"])
+        with pytest.raises(SystemExit):
+            UUT.parse_args(Parser, ["--load", "fonts.npz", "-s", "8", "-o", "out"])
+        assert UUT.parse_args(Parser, ["--daemon", "socket"]).daemon == pathlib.Path(
+            "socket"
+        )
+        assert UUT.parse_args(Parser, ["-f", "font.ttf", "--fit", "8x8", "-o", "out"])
+        assert UUT.parse_args(Parser, ["-f", "font.ttf", "-s", "8", "--save", "f.npz"])
+        assert UUT.parse_args(Parser, ["--load", "fonts.npz", "-o", "out"])
+
+    @pytest.mark.parametrize(
+        "option",
+        [
+            ["--rotate", "90"],
+            ["--mirror"],
+            ["--bpp", "2"],
+            ["--dense"],
+            ["--engine", "atlas"],
+            ["--extra-chars", "abc"],
+        ],
+    )
+    def test_load_conversion_options(self, Parser, option: list, capsys):
+        """Test if conversion options are rejected for loaded fonts."""
+        # Act & Assert
+        with pytest.raises(SystemExit):
+            UUT.parse_args(Parser, ["--load", "fonts.npz", "-o", "out"] + option)
+        assert f"argument {option[0]}: not allowed with argument --load" in (
+            capsys.readouterr().err
+        )
+
+    def test_resolve_paths(self, Parser, tmp_path: pathlib.Path):
+        """Test if the paths are resolved against the working directory."""
+        # Arrange
+        (tmp_path / "font.ttf").touch()
+        argv = ["-f", "font.ttf", "-s", "8", "-o", "out", "-c", "main.cpp"]
+        args = UUT.parse_args(Parser, argv + ["--cost", "s.txt"])
+        argv = ["-f", "DejaVu Sans", "-s", "8", "-o", "/out"]
+        args_name = UUT.parse_args(Parser, argv)
+        # Act
+        UUT.resolve_paths(args, tmp_path)
+        UUT.resolve_paths(args_name, tmp_path)
+        # Assert
+        assert args.font == tmp_path / "font.ttf"
+        assert args.output == tmp_path / "out"
+        assert args.charset_source == [tmp_path / "main.cpp"]
+        assert args.cost == tmp_path / "s.txt"
+        assert args_name.font == pathlib.Path("DejaVu Sans")
+        assert args_name.output == pathlib.Path("/out")
+
+
+class Test_Request_Handler:
+    """Test group to test the requests of the daemon."""
+
+    def test_request(self, Parser, Font_File: pathlib.Path):
+        """Test if a request converts the font relative to the client."""
+        # Arrange
+        cache = UUT.FG.FontCache()
+        request = {"argv": ["-f", Font_File.name, "-s", "8", "-o", "out"]}
+        request["cwd"] = str(Font_File.parent)
+        # Act
+        first = handle(Parser, cache, json.dumps(request).encode() + b"\n")
+        second = handle(Parser, cache, json.dumps(request).encode() + b"\n")
+        # Assert
+        assert first["status"] == 0
+        assert "Done. :D" in first["output"]
+        assert "Using 1 cached size(s)." in second["output"]
+        assert list((Font_File.parent / "out").glob("*.h"))
+
+    def test_system_exit_message(self, Parser, Font_File: pathlib.Path):
+        """Test if the message of SystemExit is returned with status 1."""
+        # Arrange
+        argv = ["-f", Font_File.name, "-s", "8", "-o", "out", "--budget", "1"]
+        request = json.dumps({"argv": argv, "cwd": str(Font_File.parent)})
+        # Act
+        response = handle(Parser, UUT.FG.FontCache(), request.encode() + b"\n")
+        # Assert
+        assert response["status"] == 1
+        assert "exceed the flash budget" in response["output"]
+
+    def test_parser_error(self, Parser, tmp_path: pathlib.Path):
+        """Test if parser errors return the usage and status 2."""
+        # Arrange
+        request = json.dumps({"argv": ["-s", "8"], "cwd": str(tmp_path)})
+        # Act
+        response = handle(Parser, UUT.FG.FontCache(), request.encode() + b"\n")
+        # Assert
+        assert response["status"] == 2
+        assert "the following arguments are required: --font" in response["output"]
+
+    def test_unexpected_exception(self, Parser):
+        """Test if unexpected exceptions are returned with status 1."""
+        # Act
+        response = handle(Parser, UUT.FG.FontCache(), b"not json\n")
+        # Assert
+        assert response["status"] == 1
+        assert response["output"].startswith("JSONDecodeError: ")
+
+
+class Test_Daemon:
+    """Test group to test the daemon and the client end-to-end."""
+
+    def test_client_request(self, Font_File: pathlib.Path):
+        """Test if the client gets the response of the daemon."""
+        # Arrange
+        socket_path = Font_File.parent / "daemon.sock"
+        daemon = subprocess.Popen(
+            [sys.executable, "run_font_generator.py", "--daemon", str(socket_path)],
+            cwd=SRC,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            assert daemon.stdout.readline().startswith("Serving the font generator")
+            # Act
+            response = Client.request(
+                str(socket_path),
+                ["-f", Font_File.name, "-s", "8", "-o", "out"],
+                str(Font_File.parent),
+            )
+        finally:
+            daemon.send_signal(signal.SIGTERM)
+            status = daemon.wait(timeout=10)
+            daemon.stdout.close()
+        # Assert
+        assert response["status"] == 0
+        assert "Done. :D" in response["output"]
+        assert status == 128 + signal.SIGTERM
+        assert not socket_path.exists()
+
+
+class Test_Main:
+    """Test group to test the font generator run."""
+
+    def test_cost_with_glyph_order(self, Parser, Font_File: pathlib.Path, capsys):
+        """Test if the cost includes the index table of the reordered glyphs."""
+        # Arrange
+        (Font_File.parent / "order.txt").write_text("AAB\n")
+        (Font_File.parent / "cost.txt").write_text("AB\n")
+        argv = ["-f", Font_File.name, "-s", "8", "-o", "out"]
+        argv += ["--order", "order.txt", "--cost", "cost.txt"]
+        args = UUT.parse_args(Parser, argv)
+        UUT.resolve_paths(args, Font_File.parent)
+        # Act
+        UUT.main(args)
+        # Assert
+        assert "1 strings, glyphs: 2, lookups: 4," in capsys.readouterr().out